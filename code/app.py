@@ -1,613 +1,23 @@
 import streamlit as st
 import time
-import base64
 from datetime import datetime
 from pathlib import Path
 from io import BytesIO
 from cv_optimizer import CVOptimizer  # Import the CVOptimizer class
-from jd_keyword_extractor import extract_jd_keywords
+from jd_keyword_extractor import cached_keywords, extract_jd_keywords
+from jd_analysis import JDAnalysisService
+from static_assets import inject_css
+from pdf_preview import load_pdf, render_pdf_preview
+from session_artifacts import get_session_artifact, get_session_artifact_store, put_session_artifact
+from application_store import get_application_store
+from user_identity import anonymous_user_id, persist_anonymous_id, verified_email
+from payment_integration import get_subscription_manager, render_upgrade_prompt
 # ================================
 # 🎨 MODERN PROFESSIONAL STYLING
 # ================================
 def load_modern_css():
-    """Load modern, professional CSS styling with beautiful color grading and typography"""
-    st.markdown("""
-    <style>
-        /* Import Beautiful Modern Fonts */
-        @import url('https://fonts.googleapis.com/css2?family=Outfit:wght@300;400;500;600;700;800&family=Space+Grotesk:wght@300;400;500;600;700&display=swap');
-        
-        /* CSS Variables - Beautiful Dark Theme Color System */
-        :root {
-            --primary: #6366f1;
-            --primary-light: #818cf8;
-            --primary-dark: #4f46e5;
-            --primary-glow: rgba(99, 102, 241, 0.3);
-            
-            --secondary: #06b6d4;
-            --secondary-light: #22d3ee;
-            --secondary-dark: #0891b2;
-            
-            --accent: #f59e0b;
-            --accent-light: #fbbf24;
-            --accent-dark: #d97706;
-            
-            --success: #10b981;
-            --success-light: #34d399;
-            --success-dark: #059669;
-            --success-glow: rgba(16, 185, 129, 0.3);
-            
-            --warning: #f59e0b;
-            --warning-light: #fbbf24;
-            --warning-glow: rgba(245, 158, 11, 0.3);
-            
-            --danger: #ef4444;
-            --danger-light: #f87171;
-            --info: #3b82f6;
-            
-            /* Dark Theme Neutrals */
-            --neutral-50: #0a0a0a;
-            --neutral-100: #171717;
-            --neutral-200: #262626;
-            --neutral-300: #404040;
-            --neutral-400: #525252;
-            --neutral-500: #737373;
-            --neutral-600: #a3a3a3;
-            --neutral-700: #d4d4d4;
-            --neutral-800: #e5e5e5;
-            --neutral-900: #f5f5f5;
-            
-            /* Dark Background System */
-            --bg-primary: #111111;
-            --bg-secondary: #1a1a1a;
-            --bg-tertiary: #262626;
-            --bg-elevated: #1f1f1f;
-            --bg-overlay: rgba(17, 17, 17, 0.95);
-            
-            /* Dark Theme Text Colors */
-            --text-primary: #ffffff;
-            --text-secondary: #d4d4d4;
-            --text-tertiary: #a3a3a3;
-            --text-quaternary: #525252;
-            --text-inverse: #000000;
-            
-            /* Dark Theme Borders */
-            --border-light: #262626;
-            --border-primary: #404040;
-            --border-secondary: #525252;
-            --border-focus: var(--primary);
-            
-            /* Enhanced Shadows for Dark Theme */
-            --shadow-xs: 0 1px 2px 0 rgb(0 0 0 / 0.8);
-            --shadow-sm: 0 1px 3px 0 rgb(0 0 0 / 0.8), 0 1px 2px -1px rgb(0 0 0 / 0.8);
-            --shadow-md: 0 4px 6px -1px rgb(0 0 0 / 0.8), 0 2px 4px -2px rgb(0 0 0 / 0.8);
-            --shadow-lg: 0 10px 15px -3px rgb(0 0 0 / 0.8), 0 4px 6px -4px rgb(0 0 0 / 0.8);
-            --shadow-xl: 0 20px 25px -5px rgb(0 0 0 / 0.8), 0 8px 10px -6px rgb(0 0 0 / 0.8);
-            --shadow-2xl: 0 25px 50px -12px rgb(0 0 0 / 0.9);
-            --shadow-colored: 0 8px 32px var(--primary-glow);
-            
-            /* Premium Typography */
-            --font-body: 'Outfit', system-ui, -apple-system, BlinkMacSystemFont, sans-serif;
-            --font-heading: 'Space Grotesk', system-ui, -apple-system, BlinkMacSystemFont, sans-serif;
-            --font-mono: 'JetBrains Mono', 'Fira Code', monospace;
-            
-            /* Modern Spacing Scale */
-            --space-1: 0.25rem;
-            --space-2: 0.5rem;
-            --space-3: 0.75rem;
-            --space-4: 1rem;
-            --space-5: 1.25rem;
-            --space-6: 1.5rem;
-            --space-8: 2rem;
-            --space-10: 2.5rem;
-            --space-12: 3rem;
-            --space-16: 4rem;
-            --space-20: 5rem;
-            
-            /* Border Radius Scale */
-            --radius-sm: 0.375rem;
-            --radius-md: 0.5rem;
-            --radius-lg: 0.75rem;
-            --radius-xl: 1rem;
-            --radius-2xl: 1.5rem;
-            --radius-full: 9999px;
-        }
-
-        /* Navigation Specific Styles */
-        .nav-container {
-            background: linear-gradient(135deg, var(--bg-secondary) 0%, var(--bg-elevated) 100%);
-            padding: var(--space-6) var(--space-8);
-            border-radius: var(--radius-2xl);
-            border: 1px solid var(--border-light);
-            box-shadow: var(--shadow-lg);
-            margin: var(--space-8) var(--space-8) var(--space-12) var(--space-8);
-            position: sticky;
-            top: var(--space-4);
-            z-index: 1000;
-            backdrop-filter: blur(10px);
-            -webkit-backdrop-filter: blur(10px);
-        }
-        
-        .nav-title {
-            font-family: var(--font-heading);
-            font-size: 1.5rem;
-            font-weight: 700;
-            color: var(--text-primary);
-            text-align: center;
-            margin-bottom: var(--space-6);
-            background: linear-gradient(135deg, var(--primary) 0%, var(--secondary) 100%);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-        }
-
-        /* Enhanced Navigation Button Styles */
-        .nav-button-container {
-            display: flex;
-            justify-content: center;
-            gap: var(--space-3);
-            flex-wrap: wrap;
-        }
-
-        /* Override Streamlit button styles for navigation */
-        .nav-button-container .stButton > button {
-            background: var(--bg-tertiary) !important;
-            color: var(--text-secondary) !important;
-            border: 1px solid var(--border-primary) !important;
-            border-radius: var(--radius-lg) !important;
-            padding: var(--space-4) var(--space-6) !important;
-            font-family: var(--font-body) !important;
-            font-size: 0.875rem !important;
-            font-weight: 500 !important;
-            transition: all 0.3s ease !important;
-            box-shadow: var(--shadow-sm) !important;
-            position: relative !important;
-            overflow: hidden !important;
-            min-width: 100px !important;
-            text-transform: capitalize !important;
-        }
-
-        .nav-button-container .stButton > button:hover {
-            background: var(--bg-elevated) !important;
-            color: var(--text-primary) !important;
-            border-color: var(--primary) !important;
-            transform: translateY(-2px) !important;
-            box-shadow: var(--shadow-md), 0 0 20px var(--primary-glow) !important;
-        }
-
-        .nav-button-container .stButton > button:focus {
-            outline: none !important;
-            box-shadow: var(--shadow-md), 0 0 0 3px var(--primary-glow) !important;
-        }
-
-        /* Active navigation button style */
-        .nav-button-active .stButton > button {
-            background: linear-gradient(135deg, var(--primary) 0%, var(--primary-dark) 100%) !important;
-            color: white !important;
-            border-color: var(--primary) !important;
-            box-shadow: var(--shadow-md), 0 0 20px var(--primary-glow) !important;
-            font-weight: 600 !important;
-        }
-
-        .nav-button-active .stButton > button:hover {
-            background: linear-gradient(135deg, var(--primary-light) 0%, var(--primary) 100%) !important;
-            color: white !important;
-        }
-
-        /* Global Styling */
-        .main .block-container {
-            padding-top: 0;
-            padding-bottom: var(--space-8);
-            max-width: 1200px;
-        }
-        .stApp {
-            background: #000000;
-            min-height: 100vh;
-        }
-        /* Hide Streamlit Branding */
-        #MainMenu {visibility: hidden;}
-        footer {visibility: hidden;}
-        header {visibility: hidden;}
-        
-        /* Beautiful Typography System */
-        html, body, [class*="css"] {
-            font-family: var(--font-body);
-            font-weight: 400;
-            line-height: 1.6;
-            -webkit-font-smoothing: antialiased;
-            -moz-osx-font-smoothing: grayscale;
-        }
-        h1, h2, h3, h4, h5, h6 {
-            font-family: var(--font-heading) !important;
-            font-weight: 600 !important;
-            line-height: 1.2 !important;
-            letter-spacing: -0.025em !important;
-            color: var(--text-primary) !important;
-        }
-        h1 { font-size: 2.5rem !important; font-weight: 800 !important; }
-        h2 { font-size: 2rem !important; font-weight: 700 !important; }
-        h3 { font-size: 1.5rem !important; font-weight: 600 !important; }
-        h4 { font-size: 1.25rem !important; font-weight: 600 !important; }
-        p, span, div {
-            color: var(--text-secondary);
-        }
-        /* Premium Header Section */
-        .app-header {
-            background: linear-gradient(135deg, var(--bg-primary) 0%, var(--bg-elevated) 100%);
-            padding: var(--space-10) var(--space-8);
-            border-radius: var(--radius-2xl);
-            box-shadow: var(--shadow-xl), 0 0 0 1px var(--border-light);
-            border: 1px solid var(--border-light);
-            margin: var(--space-8) var(--space-8) var(--space-12) var(--space-8);
-            text-align: center;
-            position: relative;
-            overflow: hidden;
-        }
-        .app-header::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            right: 0;
-            height: 1px;
-            background: linear-gradient(90deg, transparent 0%, var(--primary) 50%, transparent 100%);
-        }
-        .app-title {
-            font-family: var(--font-heading);
-            font-size: 3.5rem;
-            font-weight: 800;
-            background: linear-gradient(135deg, var(--primary) 0%, var(--secondary) 100%);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-            margin-bottom: var(--space-4);
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            gap: var(--space-4);
-            letter-spacing: -0.05em;
-        }
-        .app-subtitle {
-            font-size: 1.25rem;
-            font-weight: 500;
-            color: var(--text-secondary);
-            margin-bottom: var(--space-8);
-            max-width: 700px;
-            margin-left: auto;
-            margin-right: auto;
-            line-height: 1.7;
-        }
-        .trust-indicators {
-            display: flex;
-            justify-content: center;
-            align-items: center;
-            gap: var(--space-8);
-            flex-wrap: wrap;
-            margin-top: var(--space-6);
-        }
-        .trust-item {
-            display: flex;
-            align-items: center;
-            gap: var(--space-3);
-            color: var(--text-tertiary);
-            font-size: 0.875rem;
-            font-weight: 500;
-            padding: var(--space-3) var(--space-4);
-            background: var(--bg-secondary);
-            border-radius: var(--radius-full);
-            border: 1px solid var(--border-light);
-            transition: all 0.2s ease;
-        }
-        .trust-item:hover {
-            transform: translateY(-2px);
-            box-shadow: var(--shadow-md);
-            border-color: var(--primary);
-            color: var(--text-secondary);
-        }
-        /* Sticky Progress Section */
-        .progress-container {
-            background: linear-gradient(135deg, var(--bg-primary) 0%, var(--bg-elevated) 100%);
-            border-radius: var(--radius-xl);
-            padding: var(--space-8);
-            border: 1px solid var(--border-light);
-            box-shadow: var(--shadow-lg);
-            margin-bottom: var(--space-10);
-            position: sticky;
-            top: var(--space-4);
-            z-index: 100;
-            backdrop-filter: blur(10px);
-            -webkit-backdrop-filter: blur(10px);
-            overflow: hidden;
-        }
-        .progress-header {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: var(--space-5);
-        }
-        .progress-title {
-            font-family: var(--font-heading);
-            font-size: 1.375rem;
-            font-weight: 600;
-            color: var(--text-primary);
-        }
-        .progress-percentage {
-            font-size: 1rem;
-            font-weight: 700;
-            background: linear-gradient(135deg, var(--primary) 0%, var(--secondary) 100%);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-        }
-        .progress-bar {
-            width: 100%;
-            height: 12px;
-            background: var(--neutral-200);
-            border-radius: var(--radius-full);
-            overflow: hidden;
-            margin-bottom: var(--space-6);
-            position: relative;
-        }
-        .progress-fill {
-            height: 100%;
-            background: linear-gradient(90deg, var(--primary) 0%, var(--secondary) 50%, var(--accent) 100%);
-            border-radius: var(--radius-full);
-            transition: width 0.8s ease;
-            position: relative;
-            box-shadow: 0 0 20px rgba(99, 102, 241, 0.3);
-        }
-        .progress-steps {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: var(--space-4);
-        }
-        .progress-step {
-            display: flex;
-            align-items: center;
-            gap: var(--space-4);
-            padding: var(--space-4);
-            border-radius: var(--radius-lg);
-            background: var(--bg-secondary);
-            transition: all 0.3s ease;
-            border: 1px solid var(--border-light);
-        }
-        .progress-step.completed {
-            background: linear-gradient(135deg, var(--success-glow), var(--bg-secondary));
-            border-color: var(--success);
-            box-shadow: 0 4px 12px var(--success-glow);
-        }
-        .step-status {
-            width: 28px;
-            height: 28px;
-            border-radius: var(--radius-full);
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-size: 0.8125rem;
-            font-weight: 700;
-            flex-shrink: 0;
-            transition: all 0.3s ease;
-        }
-        .step-status.pending {
-            background: var(--neutral-300);
-            color: var(--neutral-600);
-        }
-        .step-status.completed {
-            background: linear-gradient(135deg, var(--success) 0%, var(--success-light) 100%);
-            color: white;
-            box-shadow: 0 4px 12px var(--success-glow);
-        }
-        .step-label {
-            font-size: 0.9375rem;
-            font-weight: 500;
-            color: var(--text-primary);
-        }
-        /* Premium Section Cards */
-        .section-card {
-            background: linear-gradient(135deg, var(--bg-primary) 0%, var(--bg-elevated) 100%);
-            border-radius: var(--radius-2xl);
-            border: 1px solid var(--border-light);
-            box-shadow: var(--shadow-lg);
-            overflow: hidden;
-            margin-bottom: var(--space-10);
-            transition: all 0.3s ease;
-        }
-        .section-card:hover {
-            box-shadow: var(--shadow-xl), var(--shadow-colored);
-            transform: translateY(-2px);
-        }
-        .section-header {
-            padding: var(--space-8) var(--space-8);
-            border-bottom: 1px solid var(--border-light);
-            background: linear-gradient(135deg, var(--bg-secondary) 0%, var(--neutral-100) 100%);
-            position: relative;
-        }
-        .section-title {
-            font-family: var(--font-heading);
-            font-size: 1.5rem;
-            font-weight: 600;
-            color: var(--text-primary);
-            margin-bottom: var(--space-3);
-            display: flex;
-            align-items: center;
-            gap: var(--space-3);
-        }
-        .section-subtitle {
-            color: var(--text-secondary);
-            font-size: 1rem;
-            font-weight: 400;
-            line-height: 1.6;
-        }
-        .section-content {
-            padding: var(--space-8);
-        }
-        /* Beautiful Status Messages */
-        .status-message {
-            padding: var(--space-5) var(--space-6);
-            border-radius: var(--radius-lg);
-            margin: var(--space-5) 0;
-            display: flex;
-            align-items: flex-start;
-            gap: var(--space-4);
-            font-size: 0.9375rem;
-            line-height: 1.6;
-            font-weight: 500;
-            border: 1px solid;
-            position: relative;
-            overflow: hidden;
-        }
-        .status-success {
-            background: linear-gradient(135deg, var(--success-glow), rgba(16, 185, 129, 0.1));
-            border-color: rgba(16, 185, 129, 0.5);
-            color: var(--success-light);
-        }
-        .status-warning {
-            background: linear-gradient(135deg, var(--warning-glow), rgba(245, 158, 11, 0.1));
-            border-color: rgba(245, 158, 11, 0.5);
-            color: var(--accent-light);
-        }
-        .status-info {
-            background: linear-gradient(135deg, rgba(59, 130, 246, 0.3), rgba(59, 130, 246, 0.1));
-            border-color: rgba(59, 130, 246, 0.5);
-            color: #93c5fd;
-        }
-        /* Enhanced Streamlit Components */
-        .stFileUploader > div {
-            border: 2px dashed var(--border-primary);
-            border-radius: var(--radius-xl);
-            background: linear-gradient(135deg, var(--bg-secondary) 0%, var(--neutral-100) 100%);
-            padding: var(--space-10);
-            text-align: center;
-            transition: all 0.3s ease;
-            position: relative;
-            overflow: hidden;
-        }
-        .stFileUploader > div:hover {
-            border-color: var(--primary);
-            background: linear-gradient(135deg, rgba(99, 102, 241, 0.05) 0%, var(--bg-secondary) 100%);
-            transform: translateY(-2px);
-            box-shadow: var(--shadow-lg);
-        }
-        .stTextArea > div > div > textarea {
-            border: 1px solid var(--border-primary) !important;
-            border-radius: var(--radius-lg) !important;
-            font-family: var(--font-body) !important;
-            font-size: 0.9375rem !important;
-            background: var(--bg-primary) !important;
-            transition: all 0.3s ease !important;
-            padding: var(--space-5) !important;
-            line-height: 1.6 !important;
-            color: var(--text-primary) !important;
-            resize: vertical !important;
-        }
-        .stTextArea > div > div > textarea:focus {
-            border-color: var(--primary) !important;
-            box-shadow: 0 0 0 4px var(--primary-glow) !important;
-            outline: none !important;
-        }
-        .stTextArea > div > div > textarea::placeholder {
-            color: var(--text-tertiary) !important;
-            font-style: italic !important;
-        }
-        /* Premium Button Styling */
-        .stButton > button {
-            background: linear-gradient(135deg, var(--primary) 0%, var(--primary-dark) 100%) !important;
-            color: white !important;
-            border: none !important;
-            border-radius: var(--radius-lg) !important;
-            padding: var(--space-4) var(--space-6) !important;
-            font-family: var(--font-body) !important;
-            font-size: 0.9375rem !important;
-            font-weight: 600 !important;
-            transition: all 0.3s ease !important;
-            box-shadow: var(--shadow-md), 0 0 20px var(--primary-glow) !important;
-            position: relative !important;
-            overflow: hidden !important;
-        }
-        .stButton > button:hover {
-            background: linear-gradient(135deg, var(--primary-light) 0%, var(--primary) 100%) !important;
-            transform: translateY(-2px) !important;
-            box-shadow: var(--shadow-lg), 0 0 30px var(--primary-glow) !important;
-        }
-        .stButton > button:focus {
-            outline: none !important;
-            box-shadow: var(--shadow-lg), 0 0 0 4px var(--primary-glow) !important;
-        }
-        .stButton > button:disabled {
-            background: var(--neutral-300) !important;
-            color: var(--neutral-500) !important;
-            transform: none !important;
-            box-shadow: none !important;
-            cursor: not-allowed !important;
-        }
-        /* Word Count */
-        .word-count {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-top: 0.5rem;
-            padding: 0.5rem 0;
-            font-size: 0.875rem;
-            color: var(--text-tertiary);
-        }
-        .count-status {
-            padding: 0.25rem 0.75rem;
-            border-radius: 12px;
-            font-size: 0.75rem;
-            font-weight: 600;
-        }
-        .count-good {
-            background: rgba(5, 150, 105, 0.1);
-            color: var(--success);
-        }
-        .count-warning {
-            background: rgba(217, 119, 6, 0.1);
-            color: var(--warning);
-        }
-        /* Requirements List */
-        .requirements-list {
-            display: flex;
-            justify-content: center;
-            gap: 2rem;
-            flex-wrap: wrap;
-            margin-top: 1rem;
-            font-size: 0.875rem;
-            color: var(--text-tertiary);
-        }
-        .requirement-item {
-            display: flex;
-            align-items: center;
-            gap: 0.5rem;
-        }
-        /* Responsive Design */
-        @media (max-width: 768px) {
-            .app-title {
-                font-size: 2rem;
-            }
-            
-            .trust-indicators {
-                gap: 1rem;
-            }
-            
-            .requirements-list {
-                gap: 1rem;
-            }
-            
-            .progress-steps {
-                grid-template-columns: 1fr;
-            }
-
-            .nav-button-container {
-                gap: var(--space-2);
-            }
-
-            .nav-button-container .stButton > button {
-                font-size: 0.75rem !important;
-                padding: var(--space-3) var(--space-4) !important;
-                min-width: 80px !important;
-            }
-        }
-    </style>
-    """, unsafe_allow_html=True)
+    """Load modern, professional CSS styling (styles/modern.css), sent once per session"""
+    inject_css("styles/modern.css")
 
 # ================================
 # 🔧 SESSION STATE MANAGEMENT
@@ -719,13 +129,11 @@ def initialize_session_state():
         if 'processing_errors' not in st.session_state:
             st.session_state.processing_errors = []
         
-        # CVOptimizer specific state
-        if 'cv_text' not in st.session_state:
-            st.session_state.cv_text = ""
+        # CVOptimizer specific state (CV text and optimized CV are session artefacts)
+        if 'cv_extraction_error' not in st.session_state:
+            st.session_state.cv_extraction_error = None
         if 'template_config' not in st.session_state:
             st.session_state.template_config = {}
-        if 'optimized_cv' not in st.session_state:
-            st.session_state.optimized_cv = ""
         
         # Initialize optimizer
         if 'cv_optimizer' not in st.session_state:
@@ -797,13 +205,21 @@ def render_upload_section():
         is_valid, validation_message = validate_uploaded_file(uploaded_file)
         
         if is_valid:
-            # Extract CV text using the optimizer
-            optimizer = st.session_state.cv_optimizer
-            success, extracted_text = optimizer.extract_cv_text(uploaded_file)
+            # Extract CV text once per uploaded file; reruns reuse the result
+            # (the text itself lives in the artefact store, session_state keeps a handle)
+            source_id = getattr(uploaded_file, "file_id", None) or f"{uploaded_file.name}:{uploaded_file.size}"
+            extracted_text = get_session_artifact("cv_text")
+            if st.session_state.get("cv_source_id") != source_id or (
+                    st.session_state.cv_extraction_error is None and extracted_text is None):
+                optimizer = st.session_state.cv_optimizer
+                success, extracted_text = optimizer.extract_cv_text(uploaded_file)
+                if success:
+                    put_session_artifact("cv_text", extracted_text)
+                st.session_state.cv_extraction_error = None if success else extracted_text
+                st.session_state.cv_source_id = source_id
             
+            success = st.session_state.cv_extraction_error is None
             if success:
-                # Store in session state
-                st.session_state.cv_text = extracted_text
                 st.session_state.file_uploaded = True
                 
                 # Process file info
@@ -833,7 +249,7 @@ def render_upload_section():
                 
             else:
                 st.session_state.file_uploaded = False
-                st.error(f"❌ Failed to extract text: {extracted_text}")
+                st.error(f"❌ Failed to extract text: {st.session_state.cv_extraction_error}")
         else:
             # Show validation error
             st.session_state.file_uploaded = False
@@ -841,6 +257,7 @@ def render_upload_section():
     else:
         # Reset file upload state when no file
         st.session_state.file_uploaded = False
+        st.session_state.cv_source_id = None
         # Show requirements when no file is uploaded
         st.markdown("""
         <div class="requirements-list">
@@ -889,11 +306,15 @@ Include everything for best results:
     
     # Real-time word count and validation
     if job_description:
-        # Use optimizer to set job description
-        optimizer = st.session_state.cv_optimizer
-        optimizer.set_job_description(job_description)
+        analysis_service = get_session_jd_analysis()
+        stats = analysis_service.stats(job_description)
         
-        words = len(job_description.split())
+        # Use optimizer to set job description (only when the text changed)
+        if job_description != st.session_state.job_description:
+            optimizer = st.session_state.cv_optimizer
+            optimizer.set_job_description(job_description)
+        
+        words = stats.words
         st.session_state.job_description = job_description
         st.session_state.word_count = words
         
@@ -919,7 +340,7 @@ Include everything for best results:
         # Word count display
         st.markdown(f"""
         <div class="word-count">
-            <span>{words} words</span>
+            <span>{words} words · ≈{stats.estimated_tokens} tokens</span>
             <span class="count-status {status_class}">{status_text}</span>
         </div>
         """, unsafe_allow_html=True)
@@ -937,6 +358,7 @@ Include everything for best results:
         
         # JD Keyword Extraction - ADDED THIS SECTION
         if words >= 50:
+            render_jd_coverage(job_description)
             extract_jd_keywords_simple()
             
     else:
@@ -946,6 +368,32 @@ Include everything for best results:
     st.markdown("</div></div>", unsafe_allow_html=True)
     return job_description
 
+def get_session_jd_analysis() -> JDAnalysisService:
+    """This session's JD analysis service (memoized stats and keyword coverage)"""
+    if 'jd_analysis' not in st.session_state:
+        st.session_state.jd_analysis = JDAnalysisService()
+    return st.session_state.jd_analysis
+
+def render_jd_coverage(job_description: str):
+    """Show how well the uploaded CV covers the job description's keywords"""
+    analysis_service = get_session_jd_analysis()
+    cv_text = get_session_artifact("cv_text", "")
+    analysis = analysis_service.analyse(job_description, cv_text)
+    
+    source = "extracted keywords" if analysis.source == "extracted" else "most frequent terms"
+    if cv_text:
+        st.markdown(f"""
+        <div class="status-message status-info">
+            <span>🎯</span>
+            <span><strong>{len(analysis.matched)}/{len(analysis.terms)}</strong> of the job's {source}
+            appear in your CV ({analysis.coverage:.0%} coverage)</span>
+        </div>
+        """, unsafe_allow_html=True)
+        if analysis.missing:
+            st.caption("Missing: " + ", ".join(analysis.missing[:10]))
+    else:
+        st.caption(f"Key terms ({source}): " + ", ".join(analysis.terms[:10]))
+
 def extract_jd_keywords_simple():
     """Simple function to extract JD keywords and show results"""
     
@@ -960,25 +408,29 @@ def extract_jd_keywords_simple():
         # Get API key
         api_key = st.secrets["ANTHROPIC_API_KEY"]
         
+        # Unchanged text reuses keywords extracted earlier instead of calling the API
+        already_extracted = cached_keywords(st.session_state.job_description) is not None
+        
         # Show processing
         with st.spinner("🤖 Extracting keywords..."):
             success, result = extract_jd_keywords(st.session_state.job_description, api_key)
         
         # Show results
         if success:
-            st.success(f"✅ Keywords saved to: {result}")
+            reused = " (reused, no API call)" if already_extracted else ""
+            st.success(f"✅ Keywords saved to: {result}{reused}")
+            if not already_extracted:
+                # Coverage switches from frequent terms to the extracted keywords
+                get_session_jd_analysis().invalidate(st.session_state.job_description)
             
-            # Load and display the JSON
-            import json
-            try:
-                with open(result, 'r') as f:
-                    data = json.load(f)
-                
+            # Display from shared storage; on a multi-worker deployment the
+            # jd_extracted.json file may already hold another user's keywords
+            data = cached_keywords(st.session_state.job_description)
+            if data is not None:
                 st.markdown("### 🎯 Extracted Keywords:")
                 st.json(data)
-                    
-            except Exception as e:
-                st.error(f"Error loading results: {e}")
+            else:
+                st.warning("⚠️ The AI response could not be parsed as keyword JSON. Please try again.")
         else:
             st.error(f"❌ Failed: {result}")
 
@@ -1093,18 +545,51 @@ def render_optimization_section():
         """, unsafe_allow_html=True)
 
 # ================================
-# 📄 PAGE CONTENT FUNCTIONS
+# 🧩 PAGE FRAGMENTS
 # ================================
-def render_home_page():
-    """Render the main home page with CV optimization"""
-    render_header()
-    
-    # Input sections first - these UPDATE the session state
+# Session keys written by the input sections and read by the setup status.
+# Each input section is a fragment, so interacting with it reruns only that
+# section; the full page reruns only when one of these keys changes.
+SETUP_DEPENDENCY_KEYS = ("file_uploaded", "job_description_added", "template_selected")
+
+def setup_signature() -> tuple:
+    """Current values of the keys the setup status depends on"""
+    return tuple(bool(st.session_state.get(key)) for key in SETUP_DEPENDENCY_KEYS)
+
+def rerun_if_setup_changed():
+    """
+    Rerun the whole page if a fragment changed what the setup status shows
+
+    The status fragment records the signature it last rendered with. A full
+    run clears it before the input fragments execute, since the status renders
+    after them anyway, so only fragment reruns can trigger a page rerun.
+    """
+    rendered = st.session_state.get("setup_rendered_signature")
+    if rendered is not None and rendered != setup_signature():
+        st.rerun()
+
+@st.fragment
+def upload_fragment():
+    """Step 1: reruns on its own when the CV file changes"""
     render_upload_section()
-    render_job_description_section() 
+    rerun_if_setup_changed()
+
+@st.fragment
+def job_description_fragment():
+    """Step 2: typing in the JD box reruns only this section and its counters"""
+    render_job_description_section()
+    rerun_if_setup_changed()
+
+@st.fragment
+def template_fragment():
+    """Step 3: reruns on its own when a template is picked"""
     render_template_section()
-    
-    # Progress and optimization sections last - these READ the session state
+    rerun_if_setup_changed()
+
+@st.fragment
+def setup_status_fragment():
+    """Progress, optimization action and completion message"""
+    st.session_state.setup_rendered_signature = setup_signature()
     render_progress_section()
     render_optimization_section()
     
@@ -1131,6 +616,24 @@ def render_home_page():
         </div>
         """, unsafe_allow_html=True)
 
+# ================================
+# 📄 PAGE CONTENT FUNCTIONS
+# ================================
+def render_home_page():
+    """Render the main home page with CV optimization"""
+    render_header()
+    
+    # Full run: the status fragment below renders with the latest state
+    st.session_state.setup_rendered_signature = None
+    
+    # Input sections first - these UPDATE the session state
+    upload_fragment()
+    job_description_fragment()
+    template_fragment()
+    
+    # Progress and optimization sections last - these READ the session state
+    setup_status_fragment()
+
 def render_about_page():
     """Render the About page"""
     st.markdown("""
@@ -1439,7 +942,8 @@ def render_account_page():
         col1, col2 = st.columns(2)
         with col1:
             st.text_input("First Name", value="John", key="first_name")
-            st.text_input("Email", value="john@example.com", key="email")
+            st.text_input("Email", value=verified_email() or "",
+                          placeholder="john@example.com", key="email")
             st.selectbox("Industry", ["Technology", "Finance", "Healthcare", "Marketing", "Other"], key="industry")
         
         with col2:
@@ -1449,6 +953,19 @@ def render_account_page():
         
         if st.button("Update Profile", type="primary"):
             st.success("✅ Profile updated successfully!")
+        
+        # Only a verified sign-in ties history and usage to an email across
+        # devices; the email above is contact information
+        signed_in_as = verified_email()
+        if signed_in_as:
+            st.caption(f"🔐 Signed in as {signed_in_as}")
+            if st.button("Sign out"):
+                st.logout()
+        elif st.button("🔐 Sign in to keep your history across devices"):
+            try:
+                st.login()
+            except Exception as e:
+                st.warning(f"⚠️ Sign-in is not available: {str(e)}")
     
     with tab2:
         st.markdown("### 📊 Your Dashboard")
@@ -1637,6 +1154,14 @@ def optimize_cv():
             st.warning(f"⚠️ PDF generation unavailable: {rendercv_msg}")
             st.info("💡 You'll get an optimized YAML file. Install `rendercv` for PDF generation.")
         
+        # Check the plan's limit before doing any work
+        subscription_manager = get_subscription_manager()
+        can_optimize, quota_message = subscription_manager.can_optimize_cv()
+        if not can_optimize:
+            st.error(f"❌ {quota_message}")
+            render_upgrade_prompt()
+            return
+        
         with progress_container.container():
             st.markdown("""
             <div style="
@@ -1679,15 +1204,30 @@ def optimize_cv():
                 st.error("❌ Failed to setup AI client")
                 return
             
-            success, result = optimizer.optimize_cv_with_ai(final_prompt)
+            # Count the optimization before calling the API, so concurrent
+            # sessions can't both spend the last one; failed runs are refunded
+            reserved, quota_message = subscription_manager.reserve_cv_optimization()
+            if reserved:
+                try:
+                    success, result = optimizer.optimize_cv_with_ai(final_prompt)
+                except Exception:
+                    subscription_manager.refund_cv_optimization()
+                    raise
+                if not success:
+                    subscription_manager.refund_cv_optimization()
 
         
         # Clear progress and show results
         progress_container.empty()
         
+        if not reserved:
+            st.error(f"❌ {quota_message}")
+            render_upgrade_prompt()
+            return
+        
         if success:
             st.session_state.optimization_complete = True
-            st.session_state.optimized_cv = result
+            put_session_artifact("optimized_cv", result)
             
             # Save to output directory
             save_success, yaml_path = optimizer.save_optimized_cv(result)
@@ -1698,63 +1238,65 @@ def optimize_cv():
                 with st.spinner("🔄 Generating PDF..."):
                     pdf_success, pdf_path = optimizer.generate_pdf_from_yaml(yaml_path)
                 
+                # Read the YAML once for whichever download button is shown
+                try:
+                    yaml_text = Path(yaml_path).read_text(encoding='utf-8')
+                except Exception as e:
+                    yaml_text = None
+                    st.error(f"Error preparing YAML download: {str(e)}")
+                
                 if pdf_success:
                     st.success("📄 PDF generated successfully!")
                     
-                    # Preview PDF inside Streamlit
+                    # Read the PDF once; preview and download share the bytes
                     try:
-                        with open(pdf_path, "rb") as f:
-                            base64_pdf = base64.b64encode(f.read()).decode('utf-8')
-                            pdf_view = f'<iframe src="data:application/pdf;base64,{base64_pdf}" width="100%" height="800px" type="application/pdf"></iframe>'
-                            st.markdown("### 📖 PDF Preview")
-                            st.markdown(pdf_view, unsafe_allow_html=True)
+                        pdf_artifact = load_pdf(pdf_path)
                     except Exception as e:
-                        st.warning(f"Could not preview PDF: {str(e)}")
+                        pdf_artifact = None
+                        st.error(f"Error reading PDF: {str(e)}")
+                    
+                    # Preview PDF inside Streamlit
+                    if pdf_artifact:
+                        try:
+                            render_pdf_preview(pdf_artifact)
+                        except Exception as e:
+                            st.warning(f"Could not preview PDF: {str(e)}")
                     
                     # Download buttons
                     col1, col2 = st.columns(2)
                     with col1:
-                        try:
-                            with open(pdf_path, "rb") as f:
-                                st.download_button(
-                                    "📥 Download PDF",
-                                    f.read(),
-                                    file_name=Path(pdf_path).name,
-                                    mime="application/pdf",
-                                    use_container_width=True,
-                                    type="primary"
-                                )
-                        except Exception as e:
-                            st.error(f"Error preparing PDF download: {str(e)}")
+                        if pdf_artifact:
+                            st.download_button(
+                                "📥 Download PDF",
+                                pdf_artifact.data,
+                                file_name=pdf_artifact.name,
+                                mime="application/pdf",
+                                use_container_width=True,
+                                type="primary"
+                            )
                     
                     with col2:
-                        try:
-                            with open(yaml_path, "r", encoding='utf-8') as f:
-                                st.download_button(
-                                    "📄 Download YAML",
-                                    f.read(),
-                                    file_name=Path(yaml_path).name,
-                                    mime="text/yaml",
-                                    use_container_width=True
-                                )
-                        except Exception as e:
-                            st.error(f"Error preparing YAML download: {str(e)}")
-                else:
-                    st.error(f"❌ PDF generation failed: {pdf_path}")
-                    
-                    # Still offer YAML download as fallback
-                    st.markdown("### 📄 YAML Download Available")
-                    try:
-                        with open(yaml_path, "r", encoding='utf-8') as f:
+                        if yaml_text is not None:
                             st.download_button(
-                                "📄 Download YAML (Fallback)",
-                                f.read(),
+                                "📄 Download YAML",
+                                yaml_text,
                                 file_name=Path(yaml_path).name,
                                 mime="text/yaml",
                                 use_container_width=True
                             )
-                    except Exception as e:
-                        st.error(f"Error preparing YAML download: {str(e)}")
+                else:
+                    st.error(f"❌ PDF generation failed: {pdf_path}")
+                    
+                    # Still offer YAML download as fallback
+                    st.markdown("### 📄 YAML Download Available")
+                    if yaml_text is not None:
+                        st.download_button(
+                            "📄 Download YAML (Fallback)",
+                            yaml_text,
+                            file_name=Path(yaml_path).name,
+                            mime="text/yaml",
+                            use_container_width=True
+                        )
                         
                     # Show installation instructions
                     st.markdown("""
@@ -1935,6 +1477,11 @@ def render_debug_section():
                     st.text_area("Prompt Content Preview", content[:500] + "..." if len(content) > 500 else content)
                 except Exception as e:
                     st.error(f"Error reading prompt file: {e}")
+            
+            artifact_store = get_session_artifact_store()
+            st.markdown("### 🗄️ Session Artefacts")
+            st.json(artifact_store.stats())
+            st.dataframe(artifact_store.session_metrics(), use_container_width=True)
 
 # ================================
 # 🏠 MAIN APPLICATION
@@ -1953,12 +1500,23 @@ def configure_page():
         }
     )
 
+def carry_over_anonymous_data():
+    """After a verified sign-in, move what this browser tracked anonymously to the account"""
+    email = verified_email()
+    if not email or st.session_state.get('anonymous_data_owner') == email:
+        return
+    get_application_store().reassign(anonymous_user_id(), email)
+    get_subscription_manager().transfer_cv_usage(anonymous_user_id())
+    st.session_state.anonymous_data_owner = email
+
 def main():
     """Main application function with comprehensive error handling"""
     try:
         configure_page()
         load_modern_css()
         initialize_session_state()
+        persist_anonymous_id()
+        carry_over_anonymous_data()
         
         # Render navigation
         render_top_navbar()
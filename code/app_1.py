@@ -78,7 +78,8 @@ if 'search_results' in st.session_state:
                         [job],
                         settings,
                         st.session_state.cv_content,
-                        st.session_state.user_profile
+                        st.session_state.user_profile,
+                        applications_today=st.session_state.tracker.count_applications(days=1)
                     )
                     for app in apps:
                         st.session_state.tracker.add_application(app)
@@ -101,6 +102,7 @@ if st.button("Send Follow-Ups"):
     for app in apps:
         if app.status == ApplicationStatus.APPLIED:
             st.session_state.follow_up.schedule_follow_ups(app)
+            st.session_state.tracker.update_application(app)
             st.session_state.follow_up.send_follow_up(app)
             count += 1
     st.success(f"✅ Sent follow-ups for {count} applications.")
@@ -0,0 +1,257 @@
+# application_store.py
+"""
+Durable SQLite storage for tracked job applications
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# ================================
+# 🗃️ APPLICATION STORE
+# ================================
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS applications (
+    owner TEXT NOT NULL,
+    application_id TEXT NOT NULL,
+    job TEXT NOT NULL,
+    company TEXT NOT NULL,
+    applied_date TEXT NOT NULL,
+    status TEXT NOT NULL,
+    cv_version TEXT NOT NULL,
+    cover_letter TEXT,
+    follow_up_dates TEXT NOT NULL DEFAULT '[]',
+    notes TEXT NOT NULL DEFAULT '',
+    response_received INTEGER NOT NULL DEFAULT 0,
+    interview_scheduled TEXT,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (owner, application_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_applications_owner_date ON applications (owner, applied_date);
+"""
+
+ANONYMOUS_OWNER_PREFIX = "anon_"
+ANONYMOUS_RETENTION_DAYS = 90
+PURGE_INTERVAL_SECONDS = 24 * 60 * 60
+
+UPSERT_SQL = """
+INSERT INTO applications (
+    owner, application_id, job, company, applied_date, status, cv_version, cover_letter,
+    follow_up_dates, notes, response_received, interview_scheduled, updated_at
+) VALUES (
+    :owner, :application_id, :job, :company, :applied_date, :status, :cv_version, :cover_letter,
+    :follow_up_dates, :notes, :response_received, :interview_scheduled, :updated_at
+)
+ON CONFLICT (owner, application_id) DO UPDATE SET
+    job = excluded.job,
+    company = excluded.company,
+    applied_date = excluded.applied_date,
+    status = excluded.status,
+    cv_version = excluded.cv_version,
+    cover_letter = excluded.cover_letter,
+    follow_up_dates = excluded.follow_up_dates,
+    notes = excluded.notes,
+    response_received = excluded.response_received,
+    interview_scheduled = excluded.interview_scheduled,
+    updated_at = excluded.updated_at
+"""
+
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def _from_iso(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+def job_to_dict(job) -> Dict:
+    """JSON-safe dict of a JobListing, keeping enum values and ISO datetimes"""
+    return {
+        "job_id": job.job_id,
+        "title": job.title,
+        "company": job.company,
+        "location": job.location,
+        "salary": job.salary,
+        "description": job.description,
+        "requirements": list(job.requirements or []),
+        "url": job.url,
+        "job_board": job.job_board.value,
+        "posted_date": _iso(job.posted_date),
+        "application_deadline": _iso(job.application_deadline),
+        "job_type": job.job_type,
+        "experience_level": job.experience_level,
+        "remote_option": job.remote_option,
+        "match_score": job.match_score,
+    }
+
+
+def job_from_dict(data: Dict):
+    """Rebuild a JobListing from job_to_dict output"""
+    from job_automation import JobListing, JobBoard
+
+    return JobListing(**{
+        **data,
+        "job_board": JobBoard(data["job_board"]),
+        "posted_date": _from_iso(data["posted_date"]),
+        "application_deadline": _from_iso(data["application_deadline"]),
+    })
+
+
+class ApplicationStore:
+    """
+    Application history in SQLite, one row per application.
+
+    Rows are scoped by owner (a verified signed-in email, or the random
+    per-browser ID from user_identity) so several sessions of the same user
+    see one history. Every add or update writes a single row; WAL mode and a
+    busy timeout let concurrent sessions and processes write without
+    corrupting each other. Anonymous histories untouched for
+    anonymous_retention_days are purged, checked at most once a day.
+    """
+
+    def __init__(self, db_path: str = "../output/applications.db",
+                 anonymous_retention_days: int = ANONYMOUS_RETENTION_DAYS):
+        """
+        Args:
+            db_path: SQLite database file (relative to code/ directory)
+            anonymous_retention_days: Days an anonymous history is kept after its last change
+        """
+        script_dir = Path(__file__).parent
+        self.db_path = script_dir / db_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=5.0)
+        self.conn.row_factory = sqlite3.Row
+
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+
+        self.anonymous_retention_days = anonymous_retention_days
+        self._last_purge = 0.0
+
+        with self._lock, self.conn:
+            self.conn.executescript(SCHEMA)
+
+    @staticmethod
+    def _to_row(owner: str, application) -> Dict:
+        return {
+            "owner": owner,
+            "application_id": application.application_id,
+            "job": json.dumps(job_to_dict(application.job)),
+            "company": application.job.company,
+            "applied_date": application.applied_date.isoformat(),
+            "status": application.status.value,
+            "cv_version": application.cv_version,
+            "cover_letter": application.cover_letter,
+            "follow_up_dates": json.dumps([d.isoformat() for d in application.follow_up_dates or []]),
+            "notes": application.notes or "",
+            "response_received": int(bool(application.response_received)),
+            "interview_scheduled": _iso(application.interview_scheduled),
+            "updated_at": datetime.now().isoformat(),
+        }
+
+    @staticmethod
+    def _from_row(row: sqlite3.Row):
+        from job_automation import JobApplication, ApplicationStatus
+
+        return JobApplication(
+            application_id=row["application_id"],
+            job=job_from_dict(json.loads(row["job"])),
+            applied_date=datetime.fromisoformat(row["applied_date"]),
+            status=ApplicationStatus(row["status"]),
+            cv_version=row["cv_version"],
+            cover_letter=row["cover_letter"],
+            follow_up_dates=[datetime.fromisoformat(d) for d in json.loads(row["follow_up_dates"])],
+            notes=row["notes"],
+            response_received=bool(row["response_received"]),
+            interview_scheduled=_from_iso(row["interview_scheduled"])
+        )
+
+    def save(self, owner: str, application):
+        """Insert or fully rewrite one application"""
+        with self._lock, self.conn:
+            self.conn.execute(UPSERT_SQL, self._to_row(owner, application))
+        self._maybe_purge()
+
+    def save_many(self, owner: str, applications: List):
+        """Insert or rewrite several applications in one transaction"""
+        rows = [self._to_row(owner, application) for application in applications]
+        with self._lock, self.conn:
+            self.conn.executemany(UPSERT_SQL, rows)
+        self._maybe_purge()
+
+    def update_status(self, owner: str, application_id: str, status: str, notes: str):
+        """Change one application's status and replace its notes"""
+        with self._lock, self.conn:
+            self.conn.execute(
+                "UPDATE applications SET status = ?, notes = ?, updated_at = ? "
+                "WHERE owner = ? AND application_id = ?",
+                (status, notes, datetime.now().isoformat(), owner, application_id)
+            )
+
+    def load(self, owner: str) -> List:
+        """All of an owner's applications, oldest first"""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT * FROM applications WHERE owner = ? ORDER BY applied_date", (owner,)
+            ).fetchall()
+        return [self._from_row(row) for row in rows]
+
+    def reassign(self, from_owner: str, to_owner: str) -> int:
+        """Move one owner's applications to another (e.g. on sign-in); returns how many"""
+        if from_owner == to_owner:
+            return 0
+        with self._lock, self.conn:
+            moved = self.conn.execute(
+                "UPDATE OR IGNORE applications SET owner = ?, updated_at = ? WHERE owner = ?",
+                (to_owner, datetime.now().isoformat(), from_owner)
+            ).rowcount
+            # Rows left behind already exist under the new owner
+            self.conn.execute("DELETE FROM applications WHERE owner = ?", (from_owner,))
+        return moved
+
+    def purge_anonymous(self, now: Optional[datetime] = None) -> int:
+        """Delete anonymous histories not changed for anonymous_retention_days; returns rows deleted"""
+        cutoff = ((now or datetime.now()) - timedelta(days=self.anonymous_retention_days)).isoformat()
+        with self._lock, self.conn:
+            deleted = self.conn.execute(
+                "DELETE FROM applications WHERE owner IN ("
+                "SELECT owner FROM applications WHERE owner LIKE ? ESCAPE '\\' "
+                "GROUP BY owner HAVING MAX(updated_at) < ?)",
+                (ANONYMOUS_OWNER_PREFIX.replace("_", "\\_") + "%", cutoff)
+            ).rowcount
+            self._last_purge = time.monotonic()
+        return deleted
+
+    def _maybe_purge(self):
+        if not self._last_purge or time.monotonic() - self._last_purge >= PURGE_INTERVAL_SECONDS:
+            self.purge_anonymous()
+
+    def delete_all(self, owner: str):
+        """Remove an owner's whole history"""
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM applications WHERE owner = ?", (owner,))
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+_shared_store: Optional[ApplicationStore] = None
+_shared_lock = threading.Lock()
+
+def get_application_store() -> ApplicationStore:
+    """Process-wide application store shared by all trackers"""
+    global _shared_store
+    with _shared_lock:
+        if _shared_store is None:
+            _shared_store = ApplicationStore()
+        return _shared_store
@@ -0,0 +1,44 @@
+# bench_css_payload.py
+"""
+Measure the stylesheet bytes sent per rerun: inline <style> vs the hashed static asset
+
+Usage:
+    python bench_css_payload.py [--source styles/modern.css] [--reruns 20]
+"""
+
+import argparse
+import gzip
+from pathlib import Path
+
+from static_assets import build_css_asset, stylesheet_injector
+
+def kb(size: int) -> str:
+    return f"{size / 1024:7.1f} KB"
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--source", default="styles/modern.css")
+    parser.add_argument("--reruns", type=int, default=20)
+    args = parser.parse_args()
+
+    raw = (Path(__file__).parent / args.source).read_text(encoding='utf-8')
+    asset = build_css_asset(args.source)
+
+    inline_delta = len(f"<style>{raw}</style>".encode('utf-8'))
+    minified_delta = len(f"<style>{asset.css}</style>".encode('utf-8'))
+    injector_delta = len(stylesheet_injector(asset).encode('utf-8'))
+    asset_gzip = len(gzip.compress(asset.css.encode('utf-8')))
+
+    print(f"Stylesheet:            {args.source} -> static/{asset.filename}")
+    print(f"Source CSS:            {kb(asset.source_bytes)}")
+    print(f"Minified asset:        {kb(asset.size_bytes)} ({kb(asset_gzip)} gzipped, fetched once then cached)")
+    print()
+    print(f"{'per session of ' + str(args.reruns) + ' reruns':<28} {'first run':>10} {'each rerun':>12} {'total':>10}")
+    print(f"{'inline <style> (before)':<28} {kb(inline_delta):>10} {kb(inline_delta):>12} "
+          f"{kb(inline_delta * args.reruns):>10}")
+    print(f"{'inline minified (fallback)':<28} {kb(minified_delta):>10} {kb(minified_delta):>12} "
+          f"{kb(minified_delta * args.reruns):>10}")
+    print(f"{'static asset (after)':<28} {kb(injector_delta):>10} {kb(0):>12} {kb(injector_delta):>10}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# bench_extraction.py
+"""
+Benchmark job card extraction: one execute_script call vs per-element find_element calls
+
+Usage:
+    python bench_extraction.py [--cards 25] [--repeats 5]
+"""
+
+import argparse
+import time
+import urllib.parse
+
+from driver_pool import get_driver_pool
+from job_automation import LinkedInScraper
+
+def build_results_page(cards: int) -> str:
+    """Synthetic LinkedIn-style results page with the given number of cards"""
+    card_html = "".join(f"""
+        <div class="job-search-card">
+            <a href="https://www.linkedin.com/jobs/view/{1000 + i}">
+                <h3 class="job-search-card__title">Python Developer {i}</h3>
+            </a>
+            <h4 class="job-search-card__subtitle">Company {i}</h4>
+            <span class="job-search-card__location">London, England, United Kingdom</span>
+        </div>""" for i in range(cards))
+    return f"<html><body><ul>{card_html}</ul></body></html>"
+
+def time_mode(scraper: LinkedInScraper, pooled, mode: str, cards: int, repeats: int) -> float:
+    """Average seconds to extract and build all cards in the given mode"""
+    scraper.extraction_mode = mode
+    timings = []
+
+    for _ in range(repeats):
+        started = time.perf_counter()
+        jobs = scraper._build_jobs(scraper._extract_cards(pooled, cards))
+        timings.append(time.perf_counter() - started)
+        assert len(jobs) == cards, f"{mode} extracted {len(jobs)} of {cards} cards"
+
+    return sum(timings) / len(timings)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cards", type=int, default=25)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    scraper = LinkedInScraper()
+    page_url = "data:text/html;charset=utf-8," + urllib.parse.quote(build_results_page(args.cards))
+
+    with get_driver_pool().acquire() as pooled:
+        pooled.driver.get(page_url)
+
+        element_seconds = time_mode(scraper, pooled, "element", args.cards, args.repeats)
+        script_seconds = time_mode(scraper, pooled, "script", args.cards, args.repeats)
+
+    print(f"Cards per page:      {args.cards}")
+    print(f"Per-element (find):  {element_seconds * 1000:8.1f} ms/page")
+    print(f"Single script eval:  {script_seconds * 1000:8.1f} ms/page")
+    print(f"Speed-up:            {element_seconds / script_seconds:8.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# bench_job_search.py
+"""
+Benchmark job store search latency over a large synthetic listing set
+
+Usage:
+    python bench_job_search.py [--listings 200000] [--repeats 20]
+"""
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from job_automation import JobBoard, JobListing
+from job_store import JobQuery, JobStore
+
+ROLES = ["Python Developer", "Data Scientist", "Product Manager", "DevOps Engineer",
+         "Frontend Developer", "Data Analyst", "Machine Learning Engineer", "QA Tester"]
+LEVELS = ["Junior", "Senior", "Lead", ""]
+CITIES = ["London", "Manchester", "Leeds", "Bristol", "Edinburgh", "Remote"]
+SKILLS = ["python", "sql", "aws", "docker", "react", "kubernetes", "pandas", "spark", "terraform", "excel"]
+JOB_TYPES = ["Full-time", "Part-time", "Contract"]
+
+QUERIES = [
+    JobQuery(text="python developer"),
+    JobQuery(text='"data scientist" london'),
+    JobQuery(text="title:engineer kubernetes -junior"),
+    JobQuery(text="react OR frontend", remote_only=True),
+    JobQuery(text="senior", salary_min=60000, job_types=["Full-time"]),
+    JobQuery(text="analyst", boards=["reed"], page=5),
+    JobQuery(salary_min=40000, salary_max=70000),
+]
+
+def build_listing(i: int, rng: random.Random) -> JobListing:
+    """Synthetic listing with a realistic mix of fields"""
+    role = rng.choice(ROLES)
+    level = rng.choice(LEVELS)
+    city = rng.choice(CITIES)
+    low = rng.randrange(25, 110) * 1000
+    skills = rng.sample(SKILLS, 4)
+
+    return JobListing(
+        job_id=str(i),
+        title=f"{level} {role}".strip(),
+        company=f"Company {rng.randrange(5000)}",
+        location=city,
+        salary=f"£{low:,} - £{low + 15000:,}" if rng.random() < 0.7 else None,
+        description=f"We are hiring a {role.lower()} in {city}. Experience with "
+                    f"{', '.join(skills)} is essential. " * 3,
+        requirements=[f"Experience with {skill}" for skill in skills],
+        url=f"https://example.com/jobs/{i}",
+        job_board=rng.choice(list(JobBoard)),
+        posted_date=datetime.now() - timedelta(hours=rng.randrange(24 * 60)),
+        application_deadline=None,
+        job_type=rng.choice(JOB_TYPES),
+        experience_level=level or "Mid",
+        remote_option=city == "Remote",
+        match_score=0.0
+    )
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--listings", type=int, default=200000)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = JobStore(str(Path(tmp) / "jobs.db"))
+
+        started = time.perf_counter()
+        for batch_start in range(0, args.listings, 5000):
+            batch_end = min(batch_start + 5000, args.listings)
+            store.upsert_jobs([build_listing(i, rng) for i in range(batch_start, batch_end)])
+        load_seconds = time.perf_counter() - started
+
+        print(f"Listings:  {store.count():,} (loaded in {load_seconds:.1f}s, FTS5: {store.has_fts})")
+        print(f"{'query':<48} {'matches':>9} {'p50 ms':>8} {'p95 ms':>8}")
+
+        for query in QUERIES:
+            timings = []
+            for _ in range(args.repeats):
+                result = store.search(query)
+                timings.append(result.took_ms)
+            timings.sort()
+            p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+
+            label = query.text or f"salary {query.salary_min}-{query.salary_max}"
+            print(f"{label:<48} {result.total:>9,} {statistics.median(timings):>8.1f} {p95:>8.1f}")
+
+        store.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+# bench_shared_storage.py
+"""
+Multi-process load test of the shared storage backends (correctness and throughput)
+
+Every worker process opens its own backend, the way separate Streamlit
+workers would, and hammers the same counters and blob keys. The run fails if
+any increment is lost or duplicated, or a reader ever sees a torn blob.
+
+Usage:
+    python bench_shared_storage.py [--backends sqlite file] [--workers 8] [--ops 500]
+    python bench_shared_storage.py --backends redis --redis-url redis://localhost:6379/15
+"""
+
+import argparse
+import hashlib
+import multiprocessing as mp
+import shutil
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, List
+
+from shared_storage import backend_from_url
+
+BLOB_KEYS = 16
+BLOB_SIZE = 32 * 1024
+
+def make_blob(worker: int, seq: int) -> bytes:
+    """Payload whose first 32 bytes are the SHA-256 of the rest, so torn reads show"""
+    body = (f"{worker}:{seq}:".encode() * (BLOB_SIZE // 8))[:BLOB_SIZE]
+    return hashlib.sha256(body).digest() + body
+
+def blob_intact(data: bytes) -> bool:
+    return hashlib.sha256(data[32:]).digest() == data[:32]
+
+def worker_main(url: str, run: str, worker: int, ops: int, start, results):
+    storage = backend_from_url(url)
+    start.wait()
+
+    issued: List[int] = []
+    torn = 0
+    timings: Dict[str, float] = {"incr": 0.0, "put": 0.0, "get": 0.0}
+
+    for seq in range(ops):
+        started = time.perf_counter()
+        issued.append(storage.incr(f"bench:{run}:shared"))
+        storage.incr(f"bench:{run}:user:{seq % 10}")
+        timings["incr"] += time.perf_counter() - started
+
+        key = f"blob-{(worker + seq) % BLOB_KEYS}"
+        started = time.perf_counter()
+        storage.put_blob(f"bench:{run}", key, make_blob(worker, seq))
+        timings["put"] += time.perf_counter() - started
+
+        started = time.perf_counter()
+        data = storage.get_blob(f"bench:{run}", f"blob-{(worker * 7 + seq) % BLOB_KEYS}")
+        timings["get"] += time.perf_counter() - started
+        if data is not None and not blob_intact(data):
+            torn += 1
+
+    storage.close()
+    results.put({"worker": worker, "issued": issued, "torn": torn, "timings": timings})
+
+def run_backend(name: str, url: str, workers: int, ops: int) -> bool:
+    ctx = mp.get_context("spawn")
+    run = uuid.uuid4().hex[:8]  # fresh counter names, so reruns against Redis start at 0
+    start = ctx.Event()
+    results = ctx.Queue()
+    processes = [ctx.Process(target=worker_main, args=(url, run, worker, ops, start, results))
+                 for worker in range(workers)]
+    for process in processes:
+        process.start()
+
+    # Let every worker connect before timing
+    time.sleep(1.0)
+    started = time.perf_counter()
+    start.set()
+    reports = [results.get() for _ in processes]
+    elapsed = time.perf_counter() - started
+    for process in processes:
+        process.join()
+
+    storage = backend_from_url(url)
+    expected = workers * ops
+    issued = sorted(value for report in reports for value in report["issued"])
+    per_user = sum(storage.get_counter(f"bench:{run}:user:{user}") for user in range(10))
+    final = storage.get_counter(f"bench:{run}:shared")
+    torn = sum(report["torn"] for report in reports)
+    storage.close()
+
+    unique_increments = issued == list(range(1, expected + 1))
+    ok = unique_increments and final == expected and per_user == expected and torn == 0
+
+    total_ops = expected * 4
+    print(f"=== {name} ({url}) ===")
+    print(f"{workers} processes x {ops} iterations: {elapsed:.2f} s, {total_ops / elapsed:,.0f} ops/s")
+    for op in ("incr", "put", "get"):
+        seconds = sum(report["timings"][op] for report in reports)
+        count = expected * (2 if op == "incr" else 1)
+        print(f"  {op:<5} mean {seconds / count * 1000:7.3f} ms")
+    print(f"  shared counter   {final}/{expected}, increments unique and gap-free: {unique_increments}")
+    print(f"  per-user totals  {per_user}/{expected}")
+    print(f"  torn blob reads  {torn}")
+    print(f"  {'PASS' if ok else 'FAIL'}\n")
+    return ok
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--backends", nargs="+", default=["sqlite", "file"], choices=["sqlite", "file", "redis"])
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--ops", type=int, default=500)
+    parser.add_argument("--redis-url", default="redis://localhost:6379/15",
+                        help="Use a scratch database: bench keys are left behind")
+    args = parser.parse_args()
+
+    scratch = Path(tempfile.mkdtemp(prefix="bench_storage_"))
+    urls = {
+        "sqlite": f"sqlite:///{scratch / 'shared.db'}",
+        "file": f"file:///{scratch / 'files'}",
+        "redis": args.redis_url,
+    }
+
+    try:
+        results = [run_backend(name, urls[name], args.workers, args.ops) for name in args.backends]
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+    raise SystemExit(0 if all(results) else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# bench_usage_meter.py
+"""
+Quota check latency and over-consumption test for the usage meter
+
+Each worker process writes its own ledger, as workers on separate hosts would;
+only the quota counters in shared storage are common to all of them.
+
+Usage:
+    python bench_usage_meter.py [--workers 8] [--attempts 200] [--limit 500] [--checks 20000]
+    python bench_usage_meter.py --storage-url redis://localhost:6379/15
+"""
+
+import argparse
+import multiprocessing as mp
+import shutil
+import statistics
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+from shared_storage import backend_from_url
+from usage_meter import UNLIMITED, UsageMeter
+
+def consume_worker(url: str, db_path: str, owner: str, attempts: int, limit: int, start, results):
+    storage = backend_from_url(url)
+    meter = UsageMeter(db_path, storage=storage)
+    start.wait()
+    granted = sum(meter.consume(owner, "cv_optimization", limit)[0] for _ in range(attempts))
+    ledger_sum = sum(entry.amount for entry in meter.history(owner, limit=10 ** 9))
+    meter.close()
+    storage.close()
+    results.put((granted, ledger_sum))
+
+def check_latency(meter: UsageMeter, owner: str, checks: int) -> list:
+    timings = []
+    for _ in range(checks):
+        started = time.perf_counter()
+        meter.check(owner, "cv_optimization", 1)
+        timings.append(time.perf_counter() - started)
+    return timings
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--attempts", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=500)
+    parser.add_argument("--checks", type=int, default=20000)
+    parser.add_argument("--storage-url", help="Shared storage for the counters (default: a scratch SQLite file)")
+    args = parser.parse_args()
+
+    scratch = Path(tempfile.mkdtemp(prefix="bench_usage_"))
+    url = args.storage_url or f"sqlite:///{scratch / 'storage.db'}"
+    run = uuid.uuid4().hex[:8]  # fresh owners, so reruns against Redis start at 0
+    owner = f"bench-{run}"
+    try:
+        ctx = mp.get_context("spawn")
+        start = ctx.Event()
+        results = ctx.Queue()
+        processes = [ctx.Process(target=consume_worker, args=(url, str(scratch / f"usage-{worker}.db"), owner,
+                                                          args.attempts, args.limit, start, results))
+                     for worker in range(args.workers)]
+        for process in processes:
+            process.start()
+        time.sleep(1.0)
+
+        started = time.perf_counter()
+        start.set()
+        reports = [results.get() for _ in processes]
+        elapsed = time.perf_counter() - started
+        for process in processes:
+            process.join()
+
+        granted = sum(report[0] for report in reports)
+        ledger_sum = sum(report[1] for report in reports)
+        storage = backend_from_url(url)
+        meter = UsageMeter(str(scratch / "usage-main.db"), storage=storage)
+        used = meter.get_usage(owner, "cv_optimization")
+        attempts = args.workers * args.attempts
+        expected = min(attempts, args.limit) if args.limit != UNLIMITED else attempts
+        ok = granted == used == ledger_sum == expected
+
+        print(f"{args.workers} processes x {args.attempts} consume() calls against a limit of {args.limit}")
+        print(f"  {attempts / elapsed:,.0f} consume/s, granted {granted}, total {used}, ledgers' sum {ledger_sum}")
+        print(f"  {'PASS' if ok else 'FAIL'}: expected exactly {expected}\n")
+
+        meter.consume(f"{owner}-latency", "cv_optimization", 1)
+        cached = check_latency(meter, f"{owner}-latency", args.checks)
+
+        # Every check past the cache window reads the counter from storage
+        meter.cache_seconds = 0
+        uncached = check_latency(meter, f"{owner}-latency", min(args.checks, 2000))
+        meter.close()
+        storage.close()
+
+        for label, timings in (("check(), cached", cached), ("check(), read from storage", uncached)):
+            timings.sort()
+            print(f"{label:<34} median {statistics.median(timings) * 1e6:6.1f} us, "
+                  f"p99 {timings[int(len(timings) * 0.99)] * 1e6:6.1f} us")
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+    raise SystemExit(0 if ok else 1)
+
+if __name__ == "__main__":
+    main()
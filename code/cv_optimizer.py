@@ -4,19 +4,20 @@ import os
 import yaml
 import json
 import subprocess
+import uuid
 from pathlib import Path
 from typing import Dict, Tuple, Optional, Any
 from datetime import datetime
 from collections import Counter
-import anthropic
 
-# PDF/DOCX extraction imports
-try:
-    import PyPDF2
-    import pdfplumber
-    from docx import Document
-except ImportError:
-    st.error("Required libraries not installed. Please install: pip install PyPDF2 pdfplumber python-docx")
+from lazy_imports import lazy_import
+from jd_keyword_extractor import cached_keywords
+
+# AI client and PDF/DOCX extraction libraries load on first use
+anthropic = lazy_import("anthropic", "pip install anthropic")
+PyPDF2 = lazy_import("PyPDF2", "pip install PyPDF2")
+pdfplumber = lazy_import("pdfplumber", "pip install pdfplumber")
+docx = lazy_import("docx", "pip install python-docx")
 
 class CVOptimizer:
     """
@@ -145,7 +146,7 @@ class CVOptimizer:
                 temp_file_path = temp_file.name
             
             # Extract text using python-docx
-            doc = Document(temp_file_path)
+            doc = docx.Document(temp_file_path)
             extracted_text = []
             
             for paragraph in doc.paragraphs:
@@ -353,8 +354,9 @@ class CVOptimizer:
         """
         try:
             if not filename:
+                # Random suffix: several workers may save in the same second
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"optimized_cv_{self.selected_template}_{timestamp}.yaml"
+                filename = f"optimized_cv_{self.selected_template}_{timestamp}_{uuid.uuid4().hex[:8]}.yaml"
             
             # Ensure filename has .yaml extension
             if not filename.endswith('.yaml'):
@@ -390,16 +392,18 @@ class CVOptimizer:
             if not yaml_path.exists():
                 return False, f"YAML file not found: {yaml_path}"
             
+            # Each render gets its own output folder, so concurrent renders
+            # (other sessions or workers) can't hand back each other's PDFs
+            output_dir = yaml_path.parent / "rendercv_output" / yaml_path.stem
+            
             # Run the rendercv CLI tool
             result = subprocess.run(
-                ["rendercv", "render", str(yaml_path)], 
+                ["rendercv", "render", str(yaml_path), "--output-folder-name", str(output_dir)], 
                 check=True, 
                 capture_output=True, 
                 text=True,
                 cwd=yaml_path.parent  # Run in the directory containing the YAML file
             )
-            
-            output_dir = yaml_path.parent / "rendercv_output"
 
             # Expected PDF path (rendercv usually creates PDF in same directory)
             # pdf_path = output_dir.with_suffix('.pdf')
@@ -544,10 +548,15 @@ class CVOptimizer:
             if not success:
                 return False, msg
             
-            json_file_path = os.path.join(self.output_dir, "jd_extracted.json")  # or dynamic if needed
-            success, msg = self.load_extracted_keywords(json_file_path)
-            if not success:
-                return False, msg
+            # Keywords extracted for this exact JD (by any worker), else the shared file
+            keywords = cached_keywords(jd_text)
+            if keywords is not None:
+                self.extracted_keywords_json = json.dumps(keywords, ensure_ascii=False)
+            else:
+                json_file_path = os.path.join(self.output_dir, "jd_extracted.json")  # or dynamic if needed
+                success, msg = self.load_extracted_keywords(json_file_path)
+                if not success:
+                    return False, msg
 
 
             # Step 4: Load prompt template
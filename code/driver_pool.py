@@ -0,0 +1,256 @@
+# driver_pool.py
+"""
+Shared, lazily started pool of headless Chrome WebDrivers for the scrapers
+"""
+
+import atexit
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import List, Optional, Tuple
+
+# Selenium is only imported inside the methods that start or drive a browser,
+# so it loads once a browser scraper first needs a driver
+
+def is_webdriver_error(error: BaseException) -> bool:
+    """
+    Whether error is a Selenium WebDriverException (browser crashed, disconnected, ...)
+
+    Scrapers must let these propagate out of WebDriverPool.acquire() so the
+    driver is retired instead of going back into the pool.
+    """
+    exceptions = sys.modules.get("selenium.common.exceptions")
+    return exceptions is not None and isinstance(error, exceptions.WebDriverException)
+
+# ================================
+# 🚦 PAGE READINESS
+# ================================
+
+# Requests the scrapers never need: images, fonts, media and trackers
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm", "*.mp3",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*facebook.net*", "*hotjar.com*", "*segment.io*", "*newrelic.com*",
+    "*optimizely.com*", "*licdn.com/*/tracking*", "*bat.bing.com*",
+]
+
+# Chrome content settings: 2 = block
+BLOCKED_CONTENT_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.media_stream": 2,
+    "profile.default_content_setting_values.notifications": 2,
+    "profile.default_content_setting_values.geolocation": 2,
+}
+
+# ================================
+# 🚗 WEBDRIVER POOL
+# ================================
+
+class PooledDriver:
+    """A WebDriver checked out from the pool, with its page counter"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages_served = 0
+        self.created_at = time.monotonic()
+        self.broken = False
+
+    def get(self, url: str):
+        """Navigate to a page, counting it towards the recycle limit"""
+        self.pages_served += 1
+        self.driver.get(url)
+
+    def load_page(self, url: str, ready_selector: str, timeout: float = 10.0) -> Tuple[bool, float]:
+        """
+        Navigate and wait until the page is usable rather than for a fixed delay
+
+        With the eager load strategy driver.get returns at DOMContentLoaded;
+        this then waits only until an element matching ready_selector exists.
+
+        Args:
+            url: Page to load
+            ready_selector: CSS selector whose presence marks the page as ready
+            timeout: Maximum seconds to wait for the selector
+
+        Returns:
+            Tuple of (ready: bool, elapsed_seconds: float)
+        """
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        started = time.perf_counter()
+        self.get(url)
+
+        try:
+            WebDriverWait(self.driver, timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, ready_selector))
+            )
+            ready = True
+        except TimeoutException:
+            ready = False
+
+        return ready, time.perf_counter() - started
+
+    def quit(self):
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+
+
+class WebDriverPool:
+    """
+    Pool of warm headless Chrome drivers shared across boards and searches.
+
+    Drivers are only launched when a scraper first needs one, and at most
+    max_size run at once. A driver is reused after each checkout until it has
+    served max_pages_per_driver pages, then it is quit and replaced to keep
+    Chrome's memory bounded. All drivers are shut down on process exit.
+    """
+
+    def __init__(self,
+                 max_size: int = 2,
+                 max_pages_per_driver: int = 50,
+                 acquire_timeout: float = 60.0):
+        self.max_size = max_size
+        self.max_pages_per_driver = max_pages_per_driver
+        self.acquire_timeout = acquire_timeout
+
+        self._idle: List[PooledDriver] = []
+        self._in_use = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    def _build_options(self) -> "Options":
+        from selenium.webdriver.chrome.options import Options
+
+        chrome_options = Options()
+        chrome_options.add_argument('--log-level=3')
+        chrome_options.add_argument("--headless")
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--window-size=1920,1080")
+        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_experimental_option("prefs", BLOCKED_CONTENT_PREFS)
+
+        # Return from driver.get at DOMContentLoaded; readiness is waited for explicitly
+        chrome_options.page_load_strategy = 'eager'
+        return chrome_options
+
+    def _create_driver(self) -> PooledDriver:
+        from selenium import webdriver
+        from selenium.common.exceptions import WebDriverException
+
+        driver = webdriver.Chrome(options=self._build_options())
+
+        # Drop fonts, media and tracker requests at the network layer
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        except WebDriverException:
+            pass
+
+        return PooledDriver(driver)
+
+    @contextmanager
+    def acquire(self):
+        """
+        Check out a driver for the duration of a with-block
+
+        Raises:
+            TimeoutError: If no driver frees up within acquire_timeout
+            WebDriverException: If Chrome fails to start
+        """
+        pooled = self._checkout()
+        try:
+            yield pooled
+        except Exception as e:
+            if is_webdriver_error(e):
+                # A crashed or disconnected browser must not go back in the pool
+                pooled.broken = True
+            raise
+        finally:
+            self._release(pooled)
+
+    def _checkout(self) -> PooledDriver:
+        deadline = time.monotonic() + self.acquire_timeout
+
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("WebDriver pool is shut down")
+
+                if self._idle:
+                    self._in_use += 1
+                    return self._idle.pop()
+
+                if self._in_use < self.max_size:
+                    # Reserve the slot before the slow Chrome launch
+                    self._in_use += 1
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError("No WebDriver available in the pool")
+                self._condition.wait(remaining)
+
+        try:
+            return self._create_driver()
+        except Exception:
+            with self._condition:
+                self._in_use -= 1
+                self._condition.notify()
+            raise
+
+    def _release(self, pooled: PooledDriver):
+        retire = (pooled.broken
+                  or pooled.pages_served >= self.max_pages_per_driver)
+
+        with self._condition:
+            self._in_use -= 1
+            if not retire and not self._closed:
+                self._idle.append(pooled)
+                pooled = None
+            self._condition.notify()
+
+        if pooled is not None:
+            pooled.quit()
+
+    def stats(self) -> dict:
+        """Current pool occupancy"""
+        with self._condition:
+            return {
+                "idle": len(self._idle),
+                "in_use": self._in_use,
+                "max_size": self.max_size,
+            }
+
+    def shutdown(self):
+        """Quit all idle drivers; drivers in use are quit when released"""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+
+        for pooled in idle:
+            pooled.quit()
+
+
+_shared_pool: Optional[WebDriverPool] = None
+_shared_lock = threading.Lock()
+
+def get_driver_pool() -> WebDriverPool:
+    """Process-wide WebDriver pool shared by all browser scrapers"""
+    global _shared_pool
+    with _shared_lock:
+        if _shared_pool is None:
+            _shared_pool = WebDriverPool()
+            atexit.register(_shared_pool.shutdown)
+        return _shared_pool
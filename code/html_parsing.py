@@ -0,0 +1,81 @@
+# html_parsing.py
+"""
+Fast lxml-based parsing of job board result pages with precompiled selectors
+"""
+
+import time
+from typing import Dict, List, Optional, Tuple
+
+from lxml import etree, html
+
+# ================================
+# 🧩 SELECTOR HELPERS
+# ================================
+
+def has_class(class_name: str) -> str:
+    """XPath predicate matching an element whose class list contains class_name"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
+def data_at(value: str) -> str:
+    """XPath predicate matching an element by its data-at attribute"""
+    return f'@data-at="{value}"'
+
+# ================================
+# 🧩 CARD PARSER
+# ================================
+
+class CardParser:
+    """
+    Extract job card records from an HTML page in one pass.
+
+    The card XPath and every field XPath are compiled once when the parser is
+    created. Parsing a page builds a single lxml tree, finds all cards, and
+    evaluates each field relative to its card, so the document is never
+    rescanned per field. Records use the same {field: value} shape as the
+    browser scrapers' script extraction.
+    """
+
+    def __init__(self, card_xpath: str, fields: Dict[str, Tuple[str, str]]):
+        """
+        Args:
+            card_xpath: XPath selecting each job card
+            fields: {name: (relative_xpath, "text" or "@attribute")}
+        """
+        self.card_xpath = etree.XPath(card_xpath)
+        self.fields = {
+            name: (etree.XPath(xpath), prop)
+            for name, (xpath, prop) in fields.items()
+        }
+
+    def parse(self, content: bytes, limit: Optional[int] = None) -> Tuple[List[Dict[str, Optional[str]]], float]:
+        """
+        Parse up to limit cards from a page
+
+        Returns:
+            Tuple of (records, parse_seconds)
+        """
+        started = time.perf_counter()
+
+        if not content:
+            return [], time.perf_counter() - started
+
+        tree = html.fromstring(content)
+        cards = self.card_xpath(tree)
+        if limit is not None:
+            cards = cards[:limit]
+
+        records = [self._read_card(card) for card in cards]
+        return records, time.perf_counter() - started
+
+    def _read_card(self, card) -> Dict[str, Optional[str]]:
+        record = {}
+        for name, (xpath, prop) in self.fields.items():
+            matches = xpath(card)
+            if not matches:
+                record[name] = None
+            elif prop == "text":
+                record[name] = " ".join(matches[0].text_content().split())
+            else:
+                record[name] = matches[0].get(prop.lstrip('@'))
+        return record
@@ -0,0 +1,181 @@
+# jd_analysis.py
+"""
+Live job description statistics and memoized keyword coverage analysis
+"""
+
+import re
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from jd_keyword_extractor import cached_keywords, jd_text_hash
+
+# ================================
+# 📊 JD ANALYSIS
+# ================================
+
+# Rough characters-per-token ratio for English prose with Claude's tokenizer
+CHARS_PER_TOKEN = 4
+
+TOP_TERMS = 15
+MAX_CACHED_ANALYSES = 32
+
+_TERM = re.compile(r"[a-z][a-z0-9+#./-]*[a-z0-9+#]|[a-z]")
+
+STOPWORDS = frozenset("""
+a about above across after all also an and any are as at be been being both but by can
+could do does each either etc for from has have having he her here his how if in into is
+it its just may me more most must no not of on or our out over own per please role same
+she should so some such than that the their them then there these they this those through
+to too under up us very via was we well were what when where which while who will with
+within without work working would you your yours able ability candidate candidates
+experience strong team including join looking company opportunity responsibilities required
+requirements skills years year new use using based help make key plus
+""".split())
+
+
+@dataclass(frozen=True)
+class JDStats:
+    """Cheap counters shown on every rerun"""
+    words: int
+    characters: int
+    lines: int
+
+    @property
+    def estimated_tokens(self) -> int:
+        return -(-self.characters // CHARS_PER_TOKEN)
+
+
+@dataclass
+class JDAnalysis:
+    """Keyword terms of a job description and how many of them the CV mentions"""
+    text_hash: str
+    terms: List[str]
+    source: str  # "extracted" (API keywords) or "frequency" (local heuristic)
+    matched: List[str] = field(default_factory=list)
+
+    @property
+    def missing(self) -> List[str]:
+        matched = set(self.matched)
+        return [term for term in self.terms if term not in matched]
+
+    @property
+    def coverage(self) -> float:
+        return len(self.matched) / len(self.terms) if self.terms else 0.0
+
+
+def count_words_incremental(previous: str, previous_words: int, text: str) -> int:
+    """
+    Word count of text, recounting only the part after the last edit point
+
+    Words before the last whitespace shared by both versions are unchanged,
+    so typing at the end of a long description costs O(edited tail).
+    """
+    limit = min(len(previous), len(text))
+    prefix = 0
+    while prefix < limit and previous[prefix] == text[prefix]:
+        prefix += 1
+
+    boundary = prefix - 1
+    while boundary >= 0 and not previous[boundary].isspace():
+        boundary -= 1
+    if boundary < 0:
+        return len(text.split())
+
+    return previous_words - len(previous[boundary:].split()) + len(text[boundary:].split())
+
+
+def frequency_terms(text: str, limit: int = TOP_TERMS) -> List[str]:
+    """Most frequent non-stopword terms, used until API keywords are extracted"""
+    counts = Counter(term for term in _TERM.findall(text.lower())
+                     if len(term) > 2 and term not in STOPWORDS)
+    return [term for term, _ in counts.most_common(limit)]
+
+
+def extracted_terms(data: Dict) -> List[str]:
+    """Flatten the jd_extractor.txt JSON (category -> [{term, context}]) into unique terms"""
+    terms, seen = [], set()
+    for entries in data.values():
+        if not isinstance(entries, list):
+            continue
+        for entry in entries:
+            term = entry.get("term") if isinstance(entry, dict) else entry
+            if isinstance(term, str) and term.strip() and term.lower() not in seen:
+                seen.add(term.lower())
+                terms.append(term.strip())
+    return terms
+
+
+def _normalise(text: str) -> str:
+    # Hyphens separate words, so "machine-learning" and "machine learning" compare equal
+    return " " + " ".join(term.replace("-", " ") for term in _TERM.findall(text.lower())) + " "
+
+
+def match_terms(terms: List[str], cv_text: str) -> List[str]:
+    """Terms that appear in the CV as whole words or phrases (case-insensitive, hyphen-insensitive)"""
+    haystack = _normalise(cv_text)
+    return [term for term in terms if _normalise(term).strip() and _normalise(term) in haystack]
+
+
+class JDAnalysisService:
+    """
+    Per-session job description analysis.
+
+    stats() is called on every rerun and updates the word count incrementally.
+    analyse() is memoized on (JD hash, CV hash), so reruns that don't change
+    the text (the text area only submits on blur or Ctrl+Enter) reuse the
+    previous result.
+    """
+
+    def __init__(self):
+        self._text = ""
+        self._words = 0
+        self._stats = JDStats(words=0, characters=0, lines=0)
+        self._analyses: "OrderedDict[Tuple[str, str], JDAnalysis]" = OrderedDict()
+
+    def stats(self, text: str) -> JDStats:
+        """Word, character and line counts of the current text"""
+        if text != self._text:
+            self._words = count_words_incremental(self._text, self._words, text)
+            self._text = text
+            self._stats = JDStats(words=self._words, characters=len(text),
+                                  lines=text.count("\n") + 1 if text else 0)
+        return self._stats
+
+    def cached_analysis(self, text: str, cv_text: str = "") -> Optional[JDAnalysis]:
+        key = (jd_text_hash(text), jd_text_hash(cv_text))
+        analysis = self._analyses.get(key)
+        if analysis is not None:
+            self._analyses.move_to_end(key)
+        return analysis
+
+    def analyse(self, text: str, cv_text: str = "") -> JDAnalysis:
+        """
+        Keyword terms and CV coverage
+
+        Uses the API-extracted keywords when they are cached for this exact
+        text, otherwise the most frequent terms.
+        """
+        analysis = self.cached_analysis(text, cv_text)
+        if analysis is not None:
+            return analysis
+
+        text_hash = jd_text_hash(text)
+        data = cached_keywords(text)
+        terms = extracted_terms(data) if data else []
+        source = "extracted"
+        if not terms:
+            terms, source = frequency_terms(text), "frequency"
+
+        analysis = JDAnalysis(text_hash=text_hash, terms=terms, source=source,
+                              matched=match_terms(terms, cv_text) if cv_text else [])
+        self._analyses[(text_hash, jd_text_hash(cv_text))] = analysis
+        if len(self._analyses) > MAX_CACHED_ANALYSES:
+            self._analyses.popitem(last=False)
+        return analysis
+
+    def invalidate(self, text: str):
+        """Drop memoized analyses of text (e.g. after new API keywords arrive)"""
+        text_hash = jd_text_hash(text)
+        for key in [key for key in self._analyses if key[0] == text_hash]:
+            del self._analyses[key]
@@ -1,8 +1,28 @@
+import hashlib
 import json
-import anthropic
 from pathlib import Path
-from datetime import datetime
-from typing import Tuple, Dict, Any
+from typing import Tuple, Dict, Any, Optional
+
+from lazy_imports import lazy_import
+from shared_storage import get_shared_storage
+
+anthropic = lazy_import("anthropic", "pip install anthropic")
+
+# Shared-storage namespace of extracted keywords, keyed by text hash
+KEYWORD_NAMESPACE = "jd_keywords"
+
+def jd_text_hash(job_description: str) -> str:
+    """Hash of a job description, ignoring whitespace-only differences"""
+    normalised = " ".join(job_description.split())
+    return hashlib.sha256(normalised.encode('utf-8')).hexdigest()[:16]
+
+def cached_keywords(job_description: str) -> Optional[Dict[str, Any]]:
+    """Previously extracted keywords for this exact job description (by any worker), if any"""
+    data = get_shared_storage().get_blob(KEYWORD_NAMESPACE, jd_text_hash(job_description))
+    try:
+        return json.loads(data) if data else None
+    except json.JSONDecodeError:
+        return None
 
 class JDKeywordExtractor:
     """
@@ -21,6 +41,18 @@ class JDKeywordExtractor:
         self.prompts_dir.mkdir(exist_ok=True)
         self.output_dir.mkdir(exist_ok=True)
     
+    def _write_output(self, extracted_data: Dict[str, Any]) -> Path:
+        """
+        Write keywords to jd_extracted.json for the standalone pipeline
+        
+        The file is shared by everyone on this host; the app reads keywords
+        back with cached_keywords() instead.
+        """
+        output_path = self.output_dir / "jd_extracted.json"
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(extracted_data, f, indent=2, ensure_ascii=False)
+        return output_path
+    
     def setup_ai_client(self, api_key: str) -> bool:
         """Setup Anthropic AI client"""
         try:
@@ -29,18 +61,27 @@ class JDKeywordExtractor:
         except Exception:
             return False
     
-    def extract_keywords(self, job_description: str, api_key: str) -> Tuple[bool, str]:
+    def extract_keywords(self, job_description: str, api_key: str, use_cache: bool = True) -> Tuple[bool, str]:
         """
         Extract keywords from job description using jd_extractor.txt prompt
         
+        Results are cached by text hash, so extracting the same description
+        again only rewrites jd_extracted.json without calling the API.
+        
         Args:
             job_description: The job description text
             api_key: Anthropic API key
+            use_cache: Reuse keywords already extracted for this text
             
         Returns:
             Tuple of (success: bool, result_message: str)
         """
         try:
+            if use_cache:
+                cached = cached_keywords(job_description)
+                if cached is not None:
+                    return True, str(self._write_output(cached))
+            
             # Setup AI client
             if not self.setup_ai_client(api_key):
                 return False, "Failed to setup AI client"
@@ -84,13 +125,15 @@ class JDKeywordExtractor:
                     "raw_response": response_text
                 }
             
-            # Save to jd_extracted.json
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = "jd_extracted.json"
-            output_path = self.output_dir / filename
+            # Cache successful extractions; unparsed responses are retried next time
+            if "error" not in extracted_data:
+                get_shared_storage().put_blob(
+                    KEYWORD_NAMESPACE, jd_text_hash(job_description),
+                    json.dumps(extracted_data, ensure_ascii=False).encode('utf-8')
+                )
             
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(extracted_data, f, indent=2, ensure_ascii=False)
+            # Save to jd_extracted.json
+            output_path = self._write_output(extracted_data)
             
             return True, str(output_path)
             
@@ -1,25 +1,43 @@
 import asyncio
+import hashlib
 import json
+import math
 import time
 import random
+import re
+import threading
+import heapq
+from bisect import bisect_left, insort
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+from dataclasses import dataclass
 from enum import Enum
-import requests
-from bs4 import BeautifulSoup
-import pandas as pd
 import streamlit as st
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+try:
+    from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+except ImportError:
+    add_script_run_ctx = get_script_run_ctx = None
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
+from application_store import ApplicationStore, get_application_store
+from job_dedup import JobDeduplicator
+from job_enrichment import JobDetailEnricher, JobDetails
+from job_store import JobQuery, JobSearchPage, JobStore, get_job_store
+from lazy_imports import lazy_import
+from scraper_http import get_http_backend
+from driver_pool import get_driver_pool, is_webdriver_error
+from html_parsing import CardParser, has_class, data_at
+from search_cursors import SearchCursorStore, get_cursor_store
+from user_identity import current_user_id
+
+# Only needed for analytics exports
+pd = lazy_import("pandas", "pip install pandas")
+
 # ================================
 # 🎯 JOB APPLICATION AUTOMATION
 # ================================
@@ -89,13 +107,110 @@ class AutomationSettings:
     auto_follow_up: bool
     custom_cover_letter: bool
 
+@dataclass
+class PageMetrics:
+    """Timing of a single scraped results page"""
+    job_board: JobBoard
+    url: str
+    load_seconds: float
+    ready: bool
+    cards: int
+    parse_seconds: float = 0.0
+
+def fallback_job_id(title: str, company: str) -> str:
+    """
+    Job ID for a card without a link. It ends up in search cursors and the job
+    store, so it must not change between processes the way hash() of a str does.
+    """
+    return hashlib.sha1(f"{title}{company}".encode("utf-8")).hexdigest()[:16]
+
+def job_id_from_url(url: Optional[str], query_param: Optional[str] = None) -> Optional[str]:
+    """
+    Board job ID from a listing URL, ignoring tracking parameters
+
+    The ID is query_param's value when given (Indeed's jk), otherwise the
+    number the path ends with (LinkedIn's /jobs/view/<slug>-<id>, Reed's
+    /jobs/<slug>/<id>). None if the URL has no recognisable ID.
+    """
+    if not url:
+        return None
+    parsed = urlparse(url)
+    if query_param:
+        values = parse_qs(parsed.query).get(query_param)
+        return values[0] if values else None
+    match = re.search(r"(\d+)/?$", parsed.path)
+    return match.group(1) if match else None
+
+# ================================
+# 🔌 BOARD CIRCUIT BREAKER
+# ================================
+
+class BoardCircuitBreaker:
+    """
+    Stop calling a job board after repeated failures.
+
+    After failure_threshold consecutive failures or timeouts the circuit opens
+    and the board is skipped for reset_timeout seconds. The next search after
+    that is a trial run: success closes the circuit, failure reopens it.
+    """
+    
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 300.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+    
+    @property
+    def state(self) -> str:
+        """Current state: closed, open or half-open"""
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+    
+    def allow_request(self) -> bool:
+        """Whether the board may be called right now"""
+        return self.state != "open"
+    
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+    
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold or self.opened_at is not None:
+                self.opened_at = time.monotonic()
+
+@dataclass
+class BoardSearchResult:
+    """Outcome of searching a single job board"""
+    job_board: JobBoard
+    jobs: List[JobListing]
+    status: str  # ok, error, timeout, skipped
+    elapsed: float
+    error: Optional[str] = None
+
 class JobAutomationEngine:
     """Main job application automation engine"""
     
-    def __init__(self):
+    # Seconds a single board may take before its results are abandoned
+    DEFAULT_BOARD_TIMEOUT = 60.0
+    
+    # Stored listings seen within this window can answer a search without scraping
+    STORE_FRESHNESS = timedelta(hours=6)
+    
+    def __init__(self, board_timeouts: Optional[Dict[JobBoard, float]] = None):
         self.scrapers = {}
-        self.applications_today = 0
-        self.daily_limit_reached = False
+        self.board_timeouts = board_timeouts or {}
+        self.circuit_breakers: Dict[JobBoard, BoardCircuitBreaker] = {}
+        self._abandoned = {}
+        self.deduplicator = JobDeduplicator()
+        self.enricher = JobDetailEnricher()
+        self.job_store = get_job_store()
         
         # Initialize scrapers for different job boards
         self._init_scrapers()
@@ -108,30 +223,42 @@ class JobAutomationEngine:
             JobBoard.REED: ReedScraper(),
             JobBoard.TOTALJOBS: TotalJobsScraper(),
         }
+        self.circuit_breakers = {board: BoardCircuitBreaker() for board in self.scrapers}
     
     def search_jobs(self, 
                    settings: AutomationSettings, 
-                   max_results: int = 100) -> List[JobListing]:
+                   max_results: int = 100,
+                   on_board_complete: Optional[Callable[[BoardSearchResult], None]] = None,
+                   incremental: bool = False,
+                   use_store: bool = True) -> List[JobListing]:
         """
         Search for jobs across multiple platforms
         
         Args:
             settings: User automation preferences
             max_results: Maximum number of jobs to return
+            on_board_complete: Optional callback invoked as each board finishes
+            incremental: Only return postings not seen by earlier runs of the same search
+            use_store: Answer from recently stored listings when there are enough of them
             
         Returns:
             List of job listings matching criteria
         """
+        if use_store and not incremental:
+            stored = self.search_stored_jobs(settings, max_results)
+            if len(stored) >= max_results:
+                return stored
+        
         all_jobs = []
         
-        for job_board, scraper in self.scrapers.items():
-            try:
-                jobs = scraper.search_jobs(settings, max_results // len(self.scrapers))
-                for job in jobs:
-                    job.match_score = self._calculate_match_score(job, settings)
-                all_jobs.extend(jobs)
-            except Exception as e:
-                st.warning(f"Error scraping {job_board.value}: {str(e)}")
+        for result in self.iter_board_results(settings, max_results, incremental):
+            if result.status in ("error", "timeout"):
+                st.warning(f"Error scraping {result.job_board.value}: {result.error}")
+            all_jobs.extend(result.jobs)
+            self._store_jobs(result.jobs)
+            
+            if on_board_complete:
+                on_board_complete(result)
         
         # Sort by match score and remove duplicates
         all_jobs = self._deduplicate_jobs(all_jobs)
@@ -139,6 +266,165 @@ class JobAutomationEngine:
         
         return all_jobs[:max_results]
     
+    def search_stored_jobs(self, settings: AutomationSettings, max_results: int = 100) -> List[JobListing]:
+        """
+        Answer a search from listings already in the job store
+        
+        Only listings seen within STORE_FRESHNESS count, so stale postings
+        don't mask a needed scrape.
+        """
+        try:
+            # Over-fetch so duplicates across boards don't leave the result short
+            jobs = self.job_store.find_for_settings(
+                settings,
+                boards=[board.value for board in self.scrapers],
+                max_age=self.STORE_FRESHNESS,
+                limit=max_results * 2
+            )
+        except Exception as e:
+            st.warning(f"Could not read stored jobs: {str(e)}")
+            return []
+        
+        for job in jobs:
+            job.match_score = self._calculate_match_score(job, settings)
+        
+        jobs = self._deduplicate_jobs(jobs)
+        jobs.sort(key=lambda x: x.match_score, reverse=True)
+        return jobs[:max_results]
+    
+    def query_stored_jobs(self, query: JobQuery, settings: Optional[AutomationSettings] = None) -> JobSearchPage:
+        """
+        Full-text search over every stored listing
+        
+        Args:
+            query: Search text, filters and page
+            settings: If given, match scores are calculated for the returned page
+        """
+        results = self.job_store.search(query)
+        if settings:
+            for job in results.jobs:
+                job.match_score = self._calculate_match_score(job, settings)
+        return results
+    
+    def _store_jobs(self, jobs: List[JobListing]):
+        """Upsert listings into the job store; storage failures never break a search"""
+        try:
+            self.job_store.upsert_jobs(jobs)
+        except Exception as e:
+            st.warning(f"Could not save jobs: {str(e)}")
+    
+    def iter_board_results(self,
+                           settings: AutomationSettings,
+                           max_results: int = 100,
+                           incremental: bool = False) -> Iterator[BoardSearchResult]:
+        """
+        Search all boards concurrently, yielding each board's results as it finishes
+        
+        Boards whose circuit is open, or which are still busy with a previous
+        timed-out search, are skipped. A board exceeding its timeout is
+        abandoned and counted as a failure by its circuit breaker.
+        """
+        per_board = max_results // len(self.scrapers)
+        started = time.monotonic()
+        
+        executor = ThreadPoolExecutor(
+            max_workers=len(self.scrapers),
+            thread_name_prefix="job-board",
+            initializer=self._attach_script_context,
+            initargs=(get_script_run_ctx() if get_script_run_ctx else None,)
+        )
+        
+        pending = {}
+        deadlines = {}
+        
+        try:
+            for job_board, scraper in self.scrapers.items():
+                # Only a timed-out search blocks the board; concurrent searches
+                # from other sessions sharing this engine run side by side
+                previous = self._abandoned.get(job_board)
+                if previous is not None and not previous.done():
+                    yield BoardSearchResult(job_board, [], "skipped", 0.0, "previous search still running")
+                    continue
+                
+                if not self.circuit_breakers[job_board].allow_request():
+                    yield BoardSearchResult(job_board, [], "skipped", 0.0, "circuit open after repeated failures")
+                    continue
+                
+                future = executor.submit(self._search_board, scraper, settings, per_board, incremental)
+                pending[future] = job_board
+                deadlines[future] = started + self.board_timeouts.get(job_board, self.DEFAULT_BOARD_TIMEOUT)
+            
+            while pending:
+                now = time.monotonic()
+                next_deadline = min(deadlines[future] for future in pending)
+                done, _ = wait(pending, timeout=max(next_deadline - now, 0), return_when=FIRST_COMPLETED)
+                
+                for future in done:
+                    job_board = pending.pop(future)
+                    breaker = self.circuit_breakers[job_board]
+                    elapsed = time.monotonic() - started
+                    
+                    try:
+                        jobs = future.result()
+                    except Exception as e:
+                        breaker.record_failure()
+                        yield BoardSearchResult(job_board, [], "error", elapsed, str(e))
+                        continue
+                    
+                    breaker.record_success()
+                    for job in jobs:
+                        job.match_score = self._calculate_match_score(job, settings)
+                    yield BoardSearchResult(job_board, jobs, "ok", elapsed)
+                
+                now = time.monotonic()
+                for future in [f for f in pending if deadlines[f] <= now]:
+                    job_board = pending.pop(future)
+                    self._abandoned[job_board] = future
+                    self.circuit_breakers[job_board].record_failure()
+                    yield BoardSearchResult(job_board, [], "timeout", now - started,
+                                            f"timed out after {deadlines[future] - started:.0f}s")
+        finally:
+            # Don't block on abandoned boards; they finish in the background
+            executor.shutdown(wait=False)
+    
+    @staticmethod
+    def _search_board(scraper, settings: AutomationSettings, max_results: int, incremental: bool) -> List[JobListing]:
+        """Run a single scraper (executed on a worker thread)"""
+        return scraper.search_jobs(settings, max_results, incremental=incremental)
+    
+    @staticmethod
+    def _attach_script_context(ctx):
+        """Let worker threads call st.* so scraper warnings still reach the page"""
+        if ctx is not None and add_script_run_ctx:
+            add_script_run_ctx(threading.current_thread(), ctx)
+    
+    def enrich_jobs(self, jobs: List[JobListing], min_score: float = 0.6, limit: int = 20) -> int:
+        """
+        Fetch full descriptions and requirements for promising listings
+        
+        Args:
+            jobs: Listings to consider
+            min_score: Only listings at or above this match score are fetched
+            limit: Maximum detail pages fetched
+            
+        Returns:
+            Number of listings enriched
+        """
+        try:
+            enriched = self.enricher.enrich(jobs, min_score=min_score, limit=limit)
+        except Exception as e:
+            st.warning(f"Could not load job details: {str(e)}")
+            return 0
+        
+        if enriched:
+            # Keep fetched descriptions so stored searches return them too
+            self._store_jobs([job for job in jobs if job.description])
+        return enriched
+    
+    def get_job_details(self, job: JobListing) -> Optional[JobDetails]:
+        """Structured details for an enriched listing"""
+        return self.enricher.get_details(job)
+    
     def _calculate_match_score(self, job: JobListing, settings: AutomationSettings) -> float:
         """Calculate how well a job matches user preferences"""
         score = 0.0
@@ -174,24 +460,15 @@ class JobAutomationEngine:
         return min(score, 1.0)
     
     def _deduplicate_jobs(self, jobs: List[JobListing]) -> List[JobListing]:
-        """Remove duplicate job listings"""
-        seen = set()
-        unique_jobs = []
-        
-        for job in jobs:
-            # Create a unique identifier
-            job_signature = f"{job.title}-{job.company}-{job.location}".lower()
-            if job_signature not in seen:
-                seen.add(job_signature)
-                unique_jobs.append(job)
-        
-        return unique_jobs
+        """Merge near-duplicate job listings across boards"""
+        return self.deduplicator.deduplicate(jobs)
     
     async def apply_to_jobs(self, 
                            jobs: List[JobListing],
                            settings: AutomationSettings,
                            cv_content: str,
-                           user_profile: Dict) -> List[JobApplication]:
+                           user_profile: Dict,
+                           applications_today: int = 0) -> List[JobApplication]:
         """
         Automatically apply to selected jobs
         
@@ -200,6 +477,7 @@ class JobAutomationEngine:
             settings: User automation settings
             cv_content: Optimized CV content
             user_profile: User profile information
+            applications_today: Applications this user already sent today
             
         Returns:
             List of job applications created
@@ -207,7 +485,7 @@ class JobAutomationEngine:
         applications = []
         
         for job in jobs:
-            if self.applications_today >= settings.max_applications_per_day:
+            if applications_today >= settings.max_applications_per_day:
                 st.warning("Daily application limit reached!")
                 break
             
@@ -222,7 +500,7 @@ class JobAutomationEngine:
                 
                 if application:
                     applications.append(application)
-                    self.applications_today += 1
+                    applications_today += 1
                     
                     # Add random delay to avoid detection
                     await asyncio.sleep(random.uniform(30, 120))
@@ -321,38 +599,262 @@ Kind regards,
 # 🌐 JOB BOARD SCRAPERS
 # ================================
 
+# Returns [{field: value}] for every card in one WebDriver round-trip.
+# Arguments: card selector, {field: [selector, "text" | property]}, limit
+EXTRACT_CARDS_SCRIPT = """
+const [cardSelector, fields, limit] = arguments;
+return Array.from(document.querySelectorAll(cardSelector)).slice(0, limit).map(card => {
+    const record = {};
+    for (const [name, [selector, prop]] of Object.entries(fields)) {
+        const el = card.querySelector(selector);
+        if (!el) {
+            record[name] = null;
+        } else if (prop === "text") {
+            record[name] = (el.innerText || el.textContent || "").trim();
+        } else {
+            record[name] = el[prop] ?? el.getAttribute(prop);
+        }
+    }
+    return record;
+});
+"""
+
 class JobBoardScraper:
     """Base class for job board scrapers"""
     
+    # Boards that render results with JavaScript need a real browser;
+    # server-rendered boards are fetched over the shared async HTTP backend
+    requires_browser = True
+    
+    # CSS selector marking a results page as ready to scrape
+    ready_selector = None
+    
+    # Card fields as {name: (css_selector, "text" or element property)}
+    card_fields: Dict[str, Tuple[str, str]] = {}
+    
+    # Precompiled lxml parser for server-rendered result pages
+    card_parser: Optional[CardParser] = None
+    
+    # Seconds a cached results page stays fresh before it is revalidated
+    cache_ttl = 600
+    
+    # Listings per results page and the deepest page a crawl may reach
+    page_size = 25
+    max_pages = 5
+    
+    # Result pages fetched concurrently per crawl step
+    page_batch_size = 3
+    
+    # "script" pulls every card in one execute_script round-trip;
+    # "element" issues find_element calls per field per card
+    extraction_mode = "script"
+    
     def __init__(self):
-        self.driver = None
-        self._init_driver()
+        self.driver_pool = None
+        self.http = None
+        self.page_metrics = deque(maxlen=200)
+        self.cursors = get_cursor_store()
+        
+        # Browsers are started lazily by the pool on the first search
+        if self.requires_browser:
+            self.driver_pool = get_driver_pool()
+        else:
+            self.http = get_http_backend()
     
-    def _init_driver(self):
-        """Initialize headless Chrome driver"""
-        try:
-            chrome_options = Options()
-            chrome_options.add_argument('--log-level=3')
-            chrome_options.add_argument("--headless")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--window-size=1920,1080")
-            chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
+    def _load_results_page(self, pooled, url: str) -> bool:
+        """Load a results page, waiting for its job cards, and record the timing"""
+        ready, elapsed = pooled.load_page(url, self.ready_selector)
+        self.page_metrics.append(PageMetrics(
+            job_board=self.job_board,
+            url=url,
+            load_seconds=elapsed,
+            ready=ready,
+            cards=0
+        ))
+        return ready
+    
+    def _record_page_cards(self, cards: int, parse_seconds: float = 0.0):
+        """Attach the card count and parse time to the most recent page timing"""
+        if self.page_metrics:
+            self.page_metrics[-1].cards = cards
+            self.page_metrics[-1].parse_seconds = parse_seconds
+    
+    def _parse_results_page(self, result, max_results: int) -> List[JobListing]:
+        """Parse an HTTP-fetched results page with the board's card parser"""
+        records, parse_seconds = self.card_parser.parse(result.content, max_results)
+        
+        self.page_metrics.append(PageMetrics(
+            job_board=self.job_board,
+            url=result.url,
+            load_seconds=result.elapsed,
+            ready=True,
+            cards=len(records),
+            parse_seconds=parse_seconds
+        ))
+        
+        return self._build_jobs(records)
+    
+    def _extract_cards(self, pooled, max_results: int) -> List[Dict[str, Optional[str]]]:
+        """Read the fields of up to max_results job cards from the loaded page"""
+        if self.extraction_mode == "script":
+            return pooled.driver.execute_script(
+                EXTRACT_CARDS_SCRIPT, self.ready_selector, self.card_fields, max_results
+            ) or []
+        
+        from selenium.webdriver.common.by import By
+        
+        cards = pooled.driver.find_elements(By.CSS_SELECTOR, self.ready_selector)
+        return [self._read_card_elements(card) for card in cards[:max_results]]
+    
+    def _read_card_elements(self, card) -> Dict[str, Optional[str]]:
+        """Read card fields with one find_element call per field"""
+        from selenium.webdriver.common.by import By
+        from selenium.common.exceptions import NoSuchElementException
+        
+        record = {}
+        for name, (selector, prop) in self.card_fields.items():
+            try:
+                elem = card.find_element(By.CSS_SELECTOR, selector)
+                record[name] = elem.text.strip() if prop == "text" else elem.get_attribute(prop)
+            except NoSuchElementException:
+                record[name] = None
+        return record
+    
+    def _build_jobs(self, records: List[Dict[str, Optional[str]]]) -> List[JobListing]:
+        """Turn extracted card records into job listings, skipping incomplete cards"""
+        jobs = []
+        for record in records:
+            try:
+                job = self._build_job(record)
+                if job:
+                    jobs.append(job)
+            except Exception as e:
+                continue
+        return jobs
+    
+    def _build_job(self, record: Dict[str, Optional[str]]) -> Optional[JobListing]:
+        """Build a job listing from a card record - to be implemented by subclasses"""
+        raise NotImplementedError
+    
+    def get_page_metrics(self) -> Dict:
+        """Summarize recent page load timings"""
+        if not self.page_metrics:
+            return {"pages": 0}
+        
+        load_times = sorted(m.load_seconds for m in self.page_metrics)
+        return {
+            "pages": len(load_times),
+            "avg_load_seconds": sum(load_times) / len(load_times),
+            "p95_load_seconds": load_times[int(0.95 * (len(load_times) - 1))],
+            "avg_parse_seconds": sum(m.parse_seconds for m in self.page_metrics) / len(load_times),
+            "not_ready": len([m for m in self.page_metrics if not m.ready]),
+        }
+    
+    def _queries(self, settings: AutomationSettings) -> List[Tuple[str, str]]:
+        """Role/location pairs searched on this board"""
+        return [
+            (role, location)
+            for role in settings.target_roles[:2]  # Limit to avoid rate limiting
+            for location in settings.locations[:2]
+        ]
+    
+    def _cursor_key(self, role: str, location: str, settings: AutomationSettings) -> str:
+        """Cursor key identifying a saved search on this board"""
+        filters = f"remote={settings.remote_only};types={','.join(sorted(settings.job_types))}"
+        return SearchCursorStore.make_key(self.job_board.value, role, location, filters)
+    
+    def _page_url(self, url: str, page: int) -> str:
+        """URL of a zero-based results page, sorted newest first - to be implemented by subclasses"""
+        raise NotImplementedError
+    
+    def _crawl(self,
+               search_url: str,
+               target: int,
+               cursor_key: str,
+               incremental: bool,
+               fetch_pages: Callable[[List[str]], List[List[JobListing]]],
+               batch_size: int) -> List[JobListing]:
+        """
+        Crawl result pages until target listings are collected
+        
+        Pages are requested batch_size at a time. The crawl stops early when a
+        page is empty or, in incremental mode, when it reaches a posting the
+        search's cursor has already seen (pages are sorted newest first).
+        
+        Args:
+            search_url: First results page
+            target: Number of listings wanted
+            cursor_key: Cursor identifying this saved search
+            incremental: Skip and stop at postings seen by earlier runs
+            fetch_pages: Fetches and parses a list of page URLs, returning jobs per page in order
+            batch_size: Pages requested per step
+        """
+        seen = self.cursors.seen_ids(cursor_key) if incremental else set()
+        jobs = []
+        page = 0
+        
+        while len(jobs) < target and page < self.max_pages:
+            pages_needed = math.ceil((target - len(jobs)) / self.page_size)
+            batch = list(range(page, min(page + min(pages_needed, batch_size), self.max_pages)))
+            exhausted = False
             
-            self.driver = webdriver.Chrome(options=chrome_options)
-            self.wait = WebDriverWait(self.driver, 10)
+            for page_jobs in fetch_pages([self._page_url(search_url, p) for p in batch]):
+                if not page_jobs:
+                    exhausted = True
+                    break
+                
+                new_jobs = [job for job in page_jobs if job.job_id not in seen]
+                jobs.extend(new_jobs)
+                
+                if len(new_jobs) < len(page_jobs):
+                    # Everything past this point was seen by an earlier run
+                    exhausted = True
+                    break
             
-        except Exception as e:
-            st.warning(f"Failed to initialize web driver: {str(e)}")
-            self.driver = None
+            if exhausted:
+                break
+            page = batch[-1] + 1
+        
+        if jobs:
+            self.cursors.advance(cursor_key, [job.job_id for job in jobs])
+        
+        return jobs[:target]
+    
+    def _fetch_http_pages(self, urls: List[str]) -> List[List[JobListing]]:
+        """Fetch result pages concurrently over HTTP and parse each one"""
+        pages = []
+        for result in self.http.fetch_all(urls, ttl=self.cache_ttl):
+            if not result.ok:
+                st.warning(f"{self.job_board.value.title()} scraping error: {result.error or result.status_code}")
+                pages.append([])
+                continue
+            pages.append(self._parse_results_page(result, self.page_size))
+        return pages
     
-    def close_driver(self):
-        """Close the web driver"""
-        if self.driver:
-            self.driver.quit()
+    def _search_http(self, settings: AutomationSettings, max_results: int, incremental: bool,
+                     build_url: Callable[[str, str], str]) -> List[JobListing]:
+        """Crawl every query of an HTTP board, sharing the result budget between queries"""
+        jobs = []
+        queries = self._queries(settings)
+        
+        for index, (role, location) in enumerate(queries):
+            # Budget left over by exhausted queries rolls over to the next ones
+            target = math.ceil((max_results - len(jobs)) / (len(queries) - index))
+            if target <= 0:
+                break
+            
+            jobs.extend(self._crawl(
+                build_url(role, location),
+                target,
+                self._cursor_key(role, location, settings),
+                incremental,
+                self._fetch_http_pages,
+                self.page_batch_size
+            ))
+        
+        return jobs[:max_results]
     
-    def search_jobs(self, settings: AutomationSettings, max_results: int) -> List[JobListing]:
+    def search_jobs(self, settings: AutomationSettings, max_results: int, incremental: bool = False) -> List[JobListing]:
         """Search for jobs - to be implemented by subclasses"""
         raise NotImplementedError
     
@@ -363,21 +865,37 @@ class JobBoardScraper:
 class LinkedInScraper(JobBoardScraper):
     """LinkedIn Jobs scraper"""
     
-    def search_jobs(self, settings: AutomationSettings, max_results: int) -> List[JobListing]:
+    job_board = JobBoard.LINKEDIN
+    ready_selector = ".job-search-card"
+    card_fields = {
+        "title": (".job-search-card__title", "text"),
+        "company": (".job-search-card__subtitle", "text"),
+        "location": (".job-search-card__location", "text"),
+        "url": ("a", "href"),
+    }
+    
+    def search_jobs(self, settings: AutomationSettings, max_results: int, incremental: bool = False) -> List[JobListing]:
         """Search LinkedIn Jobs"""
-        if not self.driver:
-            return []
-        
         jobs = []
+        queries = self._queries(settings)
         
         try:
-            for role in settings.target_roles[:2]:  # Limit to avoid rate limiting
-                for location in settings.locations[:2]:
+            with self.driver_pool.acquire() as pooled:
+                fetch_pages = lambda urls: [self._scrape_linkedin_page(pooled, url, self.page_size) for url in urls]
+                
+                for index, (role, location) in enumerate(queries):
+                    target = math.ceil((max_results - len(jobs)) / (len(queries) - index))
+                    if target <= 0:
+                        break
+                    
                     search_url = self._build_linkedin_url(role, location, settings)
-                    jobs.extend(self._scrape_linkedin_page(search_url, max_results // 4))
+                    jobs.extend(self._crawl(search_url, target, self._cursor_key(role, location, settings),
+                                            incremental, fetch_pages, batch_size=1))
             
         except Exception as e:
             st.error(f"LinkedIn scraping error: {str(e)}")
+            if is_webdriver_error(e):
+                raise
         
         return jobs[:max_results]
     
@@ -395,67 +913,61 @@ class LinkedInScraper(JobBoardScraper):
         query_string = '&'.join([f"{k}={v}" for k, v in params.items() if v])
         return f"{base_url}?{query_string}"
     
-    def _scrape_linkedin_page(self, url: str, max_results: int) -> List[JobListing]:
+    def _page_url(self, url: str, page: int) -> str:
+        """LinkedIn pages by result offset; sortBy=DD lists newest first"""
+        return f"{url}&sortBy=DD&start={page * self.page_size}"
+    
+    def _scrape_linkedin_page(self, pooled, url: str, max_results: int) -> List[JobListing]:
         """Scrape a LinkedIn search results page"""
         jobs = []
         
         try:
-            self.driver.get(url)
-            time.sleep(3)
+            if not self._load_results_page(pooled, url):
+                return jobs
             
-            # Find job cards
-            job_cards = self.driver.find_elements(By.CSS_SELECTOR, ".job-search-card")
-            
-            for card in job_cards[:max_results]:
-                try:
-                    job = self._extract_linkedin_job_data(card)
-                    if job:
-                        jobs.append(job)
-                except Exception as e:
-                    continue
+            started = time.perf_counter()
+            records = self._extract_cards(pooled, max_results)
+            jobs = self._build_jobs(records)
+            self._record_page_cards(len(records), time.perf_counter() - started)
             
         except Exception as e:
+            if is_webdriver_error(e):
+                # Let the pool retire the browser and the board's circuit breaker count it
+                raise
             st.warning(f"LinkedIn page scraping error: {str(e)}")
         
         return jobs
     
-    def _extract_linkedin_job_data(self, card) -> Optional[JobListing]:
-        """Extract job data from LinkedIn job card"""
-        try:
-            # Extract basic info
-            title_elem = card.find_element(By.CSS_SELECTOR, ".job-search-card__title")
-            company_elem = card.find_element(By.CSS_SELECTOR, ".job-search-card__subtitle")
-            location_elem = card.find_element(By.CSS_SELECTOR, ".job-search-card__location")
-            url_elem = card.find_element(By.CSS_SELECTOR, "a")
-            
-            title = title_elem.text.strip()
-            company = company_elem.text.strip()
-            location = location_elem.text.strip()
-            url = url_elem.get_attribute('href')
-            
-            # Generate job ID from URL
-            job_id = url.split('/')[-1] if url else str(hash(f"{title}{company}"))
-            
-            return JobListing(
-                job_id=job_id,
-                title=title,
-                company=company,
-                location=location,
-                salary=None,  # LinkedIn doesn't always show salary
-                description="",  # Would need to click through for full description
-                requirements=[],
-                url=url,
-                job_board=JobBoard.LINKEDIN,
-                posted_date=datetime.now(),  # Approximate
-                application_deadline=None,
-                job_type="Full-time",  # Default
-                experience_level="Mid",  # Default
-                remote_option="remote" in location.lower(),
-                match_score=0.0
-            )
-            
-        except Exception as e:
+    def _build_job(self, record: Dict[str, Optional[str]]) -> Optional[JobListing]:
+        """Build a job listing from a LinkedIn job card record"""
+        if not all([record.get('title'), record.get('company'), record.get('location'), record.get('url') is not None]):
             return None
+        
+        title = record['title'].strip()
+        company = record['company'].strip()
+        location = record['location'].strip()
+        url = record['url']
+        
+        # Generate job ID from URL (its query string carries per-fetch tracking IDs)
+        job_id = job_id_from_url(url) or fallback_job_id(title, company)
+        
+        return JobListing(
+            job_id=job_id,
+            title=title,
+            company=company,
+            location=location,
+            salary=None,  # LinkedIn doesn't always show salary
+            description="",  # Would need to click through for full description
+            requirements=[],
+            url=url,
+            job_board=JobBoard.LINKEDIN,
+            posted_date=datetime.now(),  # Approximate
+            application_deadline=None,
+            job_type="Full-time",  # Default
+            experience_level="Mid",  # Default
+            remote_option="remote" in location.lower(),
+            match_score=0.0
+        )
     
     async def apply_to_job(self, job: JobListing, cv_content: str, cover_letter: str) -> bool:
         """Apply to LinkedIn job (requires login)"""
@@ -471,21 +983,39 @@ class LinkedInScraper(JobBoardScraper):
 class IndeedScraper(JobBoardScraper):
     """Indeed Jobs scraper"""
     
-    def search_jobs(self, settings: AutomationSettings, max_results: int) -> List[JobListing]:
+    job_board = JobBoard.INDEED
+    ready_selector = ".jobsearch-SerpJobCard"
+    page_size = 10
+    card_fields = {
+        "title": (".jobTitle a", "text"),
+        "url": (".jobTitle a", "href"),
+        "company": (".companyName", "text"),
+        "location": (".companyLocation", "text"),
+        "salary": (".salary-snippet", "text"),
+    }
+    
+    def search_jobs(self, settings: AutomationSettings, max_results: int, incremental: bool = False) -> List[JobListing]:
         """Search Indeed Jobs"""
-        if not self.driver:
-            return []
-        
         jobs = []
+        queries = self._queries(settings)
         
         try:
-            for role in settings.target_roles[:2]:
-                for location in settings.locations[:2]:
+            with self.driver_pool.acquire() as pooled:
+                fetch_pages = lambda urls: [self._scrape_indeed_page(pooled, url, self.page_size) for url in urls]
+                
+                for index, (role, location) in enumerate(queries):
+                    target = math.ceil((max_results - len(jobs)) / (len(queries) - index))
+                    if target <= 0:
+                        break
+                    
                     search_url = self._build_indeed_url(role, location, settings)
-                    jobs.extend(self._scrape_indeed_page(search_url, max_results // 4))
+                    jobs.extend(self._crawl(search_url, target, self._cursor_key(role, location, settings),
+                                            incremental, fetch_pages, batch_size=1))
             
         except Exception as e:
             st.error(f"Indeed scraping error: {str(e)}")
+            if is_webdriver_error(e):
+                raise
         
         return jobs[:max_results]
     
@@ -502,72 +1032,61 @@ class IndeedScraper(JobBoardScraper):
         query_string = '&'.join([f"{k}={v}" for k, v in params.items() if v])
         return f"{base_url}?{query_string}"
     
-    def _scrape_indeed_page(self, url: str, max_results: int) -> List[JobListing]:
+    def _page_url(self, url: str, page: int) -> str:
+        """Indeed pages by result offset; sort=date lists newest first"""
+        return f"{url}&sort=date&start={page * self.page_size}"
+    
+    def _scrape_indeed_page(self, pooled, url: str, max_results: int) -> List[JobListing]:
         """Scrape Indeed search results"""
         jobs = []
         
         try:
-            self.driver.get(url)
-            time.sleep(3)
+            if not self._load_results_page(pooled, url):
+                return jobs
             
-            # Find job cards
-            job_cards = self.driver.find_elements(By.CSS_SELECTOR, ".jobsearch-SerpJobCard")
-            
-            for card in job_cards[:max_results]:
-                try:
-                    job = self._extract_indeed_job_data(card)
-                    if job:
-                        jobs.append(job)
-                except Exception as e:
-                    continue
+            started = time.perf_counter()
+            records = self._extract_cards(pooled, max_results)
+            jobs = self._build_jobs(records)
+            self._record_page_cards(len(records), time.perf_counter() - started)
             
         except Exception as e:
+            if is_webdriver_error(e):
+                # Let the pool retire the browser and the board's circuit breaker count it
+                raise
             st.warning(f"Indeed page scraping error: {str(e)}")
         
         return jobs
     
-    def _extract_indeed_job_data(self, card) -> Optional[JobListing]:
-        """Extract job data from Indeed job card"""
-        try:
-            title_elem = card.find_element(By.CSS_SELECTOR, ".jobTitle a")
-            company_elem = card.find_element(By.CSS_SELECTOR, ".companyName")
-            location_elem = card.find_element(By.CSS_SELECTOR, ".companyLocation")
-            
-            title = title_elem.text.strip()
-            company = company_elem.text.strip()
-            location = location_elem.text.strip()
-            url = title_elem.get_attribute('href')
-            
-            # Try to get salary
-            salary = None
-            try:
-                salary_elem = card.find_element(By.CSS_SELECTOR, ".salary-snippet")
-                salary = salary_elem.text.strip()
-            except:
-                pass
-            
-            job_id = url.split('jk=')[-1] if url else str(hash(f"{title}{company}"))
-            
-            return JobListing(
-                job_id=job_id,
-                title=title,
-                company=company,
-                location=location,
-                salary=salary,
-                description="",
-                requirements=[],
-                url=url,
-                job_board=JobBoard.INDEED,
-                posted_date=datetime.now(),
-                application_deadline=None,
-                job_type="Full-time",
-                experience_level="Mid",
-                remote_option="remote" in location.lower(),
-                match_score=0.0
-            )
-            
-        except Exception as e:
+    def _build_job(self, record: Dict[str, Optional[str]]) -> Optional[JobListing]:
+        """Build a job listing from an Indeed job card record"""
+        if not all([record.get('title'), record.get('company'), record.get('location')]):
             return None
+        
+        title = record['title'].strip()
+        company = record['company'].strip()
+        location = record['location'].strip()
+        url = record.get('url')
+        salary = record.get('salary') or None
+        
+        job_id = job_id_from_url(url, "jk") or fallback_job_id(title, company)
+        
+        return JobListing(
+            job_id=job_id,
+            title=title,
+            company=company,
+            location=location,
+            salary=salary,
+            description="",
+            requirements=[],
+            url=url,
+            job_board=JobBoard.INDEED,
+            posted_date=datetime.now(),
+            application_deadline=None,
+            job_type="Full-time",
+            experience_level="Mid",
+            remote_option="remote" in location.lower(),
+            match_score=0.0
+        )
     
     async def apply_to_job(self, job: JobListing, cv_content: str, cover_letter: str) -> bool:
         """Apply to Indeed job"""
@@ -581,94 +1100,70 @@ class IndeedScraper(JobBoardScraper):
 class ReedScraper(JobBoardScraper):
     """Reed.co.uk Jobs scraper"""
     
-    def search_jobs(self, settings: AutomationSettings, max_results: int) -> List[JobListing]:
+    requires_browser = False
+    job_board = JobBoard.REED
+    cache_ttl = 900
+    card_parser = CardParser(
+        f"//article[{has_class('job-result')}]",
+        {
+            "title": (f".//h3[{has_class('title')}]", "text"),
+            "href": (f".//h3[{has_class('title')}]//a", "@href"),
+            "company": (f".//a[{has_class('gtmJobListingPostedBy')}]", "text"),
+            "location": (f".//li[{has_class('location')}]", "text"),
+            "salary": (f".//li[{has_class('salary')}]", "text"),
+        }
+    )
+    
+    def search_jobs(self, settings: AutomationSettings, max_results: int, incremental: bool = False) -> List[JobListing]:
         """Search Reed Jobs"""
-        jobs = []
-        
         try:
-            # Use requests for Reed API if available, or scraping
-            for role in settings.target_roles[:2]:
-                for location in settings.locations[:2]:
-                    jobs.extend(self._scrape_reed_jobs(role, location, max_results // 4))
+            # Result pages of each query are fetched concurrently
+            return self._search_http(settings, max_results, incremental, self._build_reed_url)
         
         except Exception as e:
             st.error(f"Reed scraping error: {str(e)}")
-        
-        return jobs[:max_results]
+            return []
     
-    def _scrape_reed_jobs(self, role: str, location: str, max_results: int) -> List[JobListing]:
-        """Scrape Reed jobs using requests"""
-        jobs = []
-        
-        try:
-            url = f"https://www.reed.co.uk/jobs/{role.replace(' ', '-')}-jobs-in-{location.replace(' ', '-')}"
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
-            response = requests.get(url, headers=headers)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            job_cards = soup.find_all('article', class_='job-result')[:max_results]
-            
-            for card in job_cards:
-                job = self._extract_reed_job_data(card)
-                if job:
-                    jobs.append(job)
-        
-        except Exception as e:
-            st.warning(f"Reed scraping error: {str(e)}")
-        
-        return jobs
+    def _build_reed_url(self, role: str, location: str) -> str:
+        """Build Reed search URL"""
+        return f"https://www.reed.co.uk/jobs/{role.replace(' ', '-')}-jobs-in-{location.replace(' ', '-')}"
     
-    def _extract_reed_job_data(self, card) -> Optional[JobListing]:
-        """Extract Reed job data"""
-        try:
-            title_elem = card.find('h3', class_='title')
-            company_elem = card.find('a', class_='gtmJobListingPostedBy')
-            location_elem = card.find('li', class_='location')
-            
-            if not all([title_elem, company_elem, location_elem]):
-                return None
-            
-            title = title_elem.text.strip()
-            company = company_elem.text.strip()
-            location = location_elem.text.strip()
-            
-            # Get URL
-            url_elem = title_elem.find('a')
-            url = f"https://www.reed.co.uk{url_elem['href']}" if url_elem else ""
-            
-            # Generate job ID
-            job_id = url.split('/')[-1] if url else str(hash(f"{title}{company}"))
-            
-            # Try to get salary
-            salary = None
-            salary_elem = card.find('li', class_='salary')
-            if salary_elem:
-                salary = salary_elem.text.strip()
-            
-            return JobListing(
-                job_id=job_id,
-                title=title,
-                company=company,
-                location=location,
-                salary=salary,
-                description="",
-                requirements=[],
-                url=url,
-                job_board=JobBoard.REED,
-                posted_date=datetime.now(),
-                application_deadline=None,
-                job_type="Full-time",
-                experience_level="Mid",
-                remote_option="remote" in location.lower(),
-                match_score=0.0
-            )
-            
-        except Exception as e:
+    def _page_url(self, url: str, page: int) -> str:
+        """Reed pages are numbered from 1; sortby=DisplayDate lists newest first"""
+        return f"{url}?sortby=DisplayDate&pageno={page + 1}"
+    
+    def _build_job(self, record: Dict[str, Optional[str]]) -> Optional[JobListing]:
+        """Build a job listing from a Reed job card record"""
+        if not all([record.get('title'), record.get('company'), record.get('location')]):
             return None
+        
+        title = record['title']
+        company = record['company']
+        location = record['location']
+        
+        # Get URL
+        url = f"https://www.reed.co.uk{record['href']}" if record.get('href') else ""
+        
+        # Generate job ID
+        job_id = job_id_from_url(url) or fallback_job_id(title, company)
+        
+        return JobListing(
+            job_id=job_id,
+            title=title,
+            company=company,
+            location=location,
+            salary=record.get('salary') or None,
+            description="",
+            requirements=[],
+            url=url,
+            job_board=JobBoard.REED,
+            posted_date=datetime.now(),
+            application_deadline=None,
+            job_type="Full-time",
+            experience_level="Mid",
+            remote_option="remote" in location.lower(),
+            match_score=0.0
+        )
     
     async def apply_to_job(self, job: JobListing, cv_content: str, cover_letter: str) -> bool:
         """Apply to Reed job"""
@@ -682,10 +1177,69 @@ class ReedScraper(JobBoardScraper):
 class TotalJobsScraper(JobBoardScraper):
     """TotalJobs scraper"""
     
-    def search_jobs(self, settings: AutomationSettings, max_results: int) -> List[JobListing]:
+    requires_browser = False
+    job_board = JobBoard.TOTALJOBS
+    cache_ttl = 1800
+    card_parser = CardParser(
+        f"//article[{data_at('job-item')}]",
+        {
+            "id": (".", "@id"),
+            "title": (f".//*[{data_at('job-item-title')}]", "text"),
+            "href": (f".//*[{data_at('job-item-title')}]", "@href"),
+            "company": (f".//*[{data_at('job-item-company-name')}]", "text"),
+            "location": (f".//*[{data_at('job-item-location')}]", "text"),
+            "salary": (f".//*[{data_at('job-item-salary-info')}]", "text"),
+        }
+    )
+    
+    def search_jobs(self, settings: AutomationSettings, max_results: int, incremental: bool = False) -> List[JobListing]:
         """Search TotalJobs"""
-        # Similar implementation to other scrapers
-        return []
+        try:
+            return self._search_http(settings, max_results, incremental, self._build_totaljobs_url)
+        
+        except Exception as e:
+            st.error(f"TotalJobs scraping error: {str(e)}")
+            return []
+    
+    def _build_totaljobs_url(self, role: str, location: str) -> str:
+        """Build TotalJobs search URL"""
+        return f"https://www.totaljobs.com/jobs/{role.lower().replace(' ', '-')}/in-{location.lower().replace(' ', '-')}"
+    
+    def _page_url(self, url: str, page: int) -> str:
+        """TotalJobs pages are numbered from 1; sort=2 lists newest first"""
+        return f"{url}?sort=2&page={page + 1}"
+    
+    def _build_job(self, record: Dict[str, Optional[str]]) -> Optional[JobListing]:
+        """Build a job listing from a TotalJobs job card record"""
+        if not all([record.get('title'), record.get('company'), record.get('location')]):
+            return None
+        
+        title = record['title']
+        company = record['company']
+        location = record['location']
+        
+        href = record.get('href') or ''
+        url = f"https://www.totaljobs.com{href}" if href.startswith('/') else href
+        
+        job_id = record.get('id') or (urlparse(url).path.rstrip('/').split('-')[-1] if url else fallback_job_id(title, company))
+        
+        return JobListing(
+            job_id=job_id,
+            title=title,
+            company=company,
+            location=location,
+            salary=record.get('salary') or None,
+            description="",
+            requirements=[],
+            url=url,
+            job_board=JobBoard.TOTALJOBS,
+            posted_date=datetime.now(),
+            application_deadline=None,
+            job_type="Full-time",
+            experience_level="Mid",
+            remote_option="remote" in location.lower(),
+            match_score=0.0
+        )
     
     async def apply_to_job(self, job: JobListing, cv_content: str, cover_letter: str) -> bool:
         """Apply to TotalJobs job"""
@@ -696,50 +1250,165 @@ class TotalJobsScraper(JobBoardScraper):
 # ================================
 
 class ApplicationTracker:
-    """Track and manage job applications"""
+    """
+    Track and manage job applications
     
-    def __init__(self):
+    Applications are indexed by ID, by status and by applied date (a sorted
+    list searched with bisect), and per-day counts are maintained as they're
+    added, so lookups, status changes and "last N days" queries stay cheap
+    with tens of thousands of applications. Analytics counters (responses,
+    per-company counts with a top-k heap) are updated the same way, so
+    get_analytics never rescans the history.
+    """
+    
+    # Companies reported by get_analytics
+    TOP_COMPANIES = 10
+    
+    def __init__(self, owner: Optional[str] = None, store: Optional[ApplicationStore] = None):
+        """
+        Args:
+            owner: Whose applications to track (defaults to the signed-in user,
+                or an anonymous ID for this browser)
+            store: Durable backend (defaults to the shared SQLite store)
+        """
+        self.store = store or get_application_store()
+        self.owner = owner or self.session_owner()
         self.applications = []
+        self._reset_indexes()
         self.load_applications()
     
+    @staticmethod
+    def session_owner() -> str:
+        """Signed-in user's email, or this browser's anonymous ID (stable across sessions)"""
+        return current_user_id()
+    
+    def _reset_indexes(self):
+        self._by_id: Dict[str, JobApplication] = {}
+        self._by_status: Dict[ApplicationStatus, Dict[str, JobApplication]] = {status: {} for status in ApplicationStatus}
+        self._by_date: List[Tuple[datetime, str]] = []
+        self._daily_counts: Counter = Counter()
+        self._responded: set = set()
+        self._company_counts: Counter = Counter()
+        self._top_companies: List[Tuple[int, str]] = []  # min-heap of (count, company)
+    
+    def _index(self, application: JobApplication):
+        """Add an application to every index and analytics counter"""
+        self._by_id[application.application_id] = application
+        self._by_status[application.status][application.application_id] = application
+        insort(self._by_date, (application.applied_date, application.application_id))
+        self._daily_counts[application.applied_date.date()] += 1
+        if application.response_received:
+            self._responded.add(application.application_id)
+        self._count_company(application.job.company)
+    
+    def _count_company(self, company: str):
+        """Bump a company's count and keep the top-k heap current"""
+        self._company_counts[company] += 1
+        count = self._company_counts[company]
+        heap = self._top_companies
+        
+        for i, (_, name) in enumerate(heap):
+            if name == company:
+                heap[i] = (count, company)
+                heapq.heapify(heap)
+                return
+        
+        # Counts only grow, so a company can only enter the top k by passing its minimum
+        if len(heap) < self.TOP_COMPANIES:
+            heapq.heappush(heap, (count, company))
+        elif count > heap[0][0]:
+            heapq.heapreplace(heap, (count, company))
+    
+    def _reindex_status(self, application: JobApplication, old_status: ApplicationStatus):
+        if old_status != application.status:
+            self._by_status[old_status].pop(application.application_id, None)
+            self._by_status[application.status][application.application_id] = application
+    
     def add_application(self, application: JobApplication):
         """Add new application to tracking"""
+        if application.application_id in self._by_id:
+            self.update_application(application)
+            return
+        
+        self.store.save(self.owner, application)
         self.applications.append(application)
-        self.save_applications()
+        self._index(application)
+    
+    def update_application(self, application: JobApplication):
+        """Persist changes made directly to a tracked application"""
+        self.store.save(self.owner, application)
+        
+        # Keep indexes in step with status changes made on the object itself
+        for status, bucket in self._by_status.items():
+            if application.application_id in bucket and status != application.status:
+                self._reindex_status(application, status)
+                break
+        
+        if application.response_received:
+            self._responded.add(application.application_id)
+        else:
+            self._responded.discard(application.application_id)
+    
+    def get_application(self, application_id: str) -> Optional[JobApplication]:
+        """Look up a single application by ID"""
+        return self._by_id.get(application_id)
     
     def get_applications(self, 
                         status: Optional[ApplicationStatus] = None,
                         days: Optional[int] = None) -> List[JobApplication]:
         """Get applications with optional filtering"""
-        filtered_apps = self.applications
-        
-        if status:
-            filtered_apps = [app for app in filtered_apps if app.status == status]
-        
         if days:
             cutoff_date = datetime.now() - timedelta(days=days)
-            filtered_apps = [app for app in filtered_apps if app.applied_date >= cutoff_date]
+            start = bisect_left(self._by_date, (cutoff_date, ""))
+            recent = [self._by_id[app_id] for _, app_id in self._by_date[start:]]
+            
+            if status:
+                return [app for app in recent if app.status == status]
+            return recent
+        
+        if status:
+            return list(self._by_status[status].values())
         
-        return filtered_apps
+        return self.applications
+    
+    def count_applications(self, days: int) -> int:
+        """Number of applications made within the last `days` days"""
+        cutoff_date = datetime.now() - timedelta(days=days)
+        return len(self._by_date) - bisect_left(self._by_date, (cutoff_date, ""))
+    
+    def count_on_date(self, day) -> int:
+        """Number of applications made on a calendar day"""
+        return self._daily_counts.get(day, 0)
     
     def update_application_status(self, application_id: str, status: ApplicationStatus, notes: str = ""):
         """Update application status"""
-        for app in self.applications:
-            if app.application_id == application_id:
-                app.status = status
-                app.notes += f"\n{datetime.now().strftime('%Y-%m-%d')}: {notes}"
-                self.save_applications()
-                break
+        app = self._by_id.get(application_id)
+        if app is None:
+            return
+        
+        new_notes = app.notes + f"\n{datetime.now().strftime('%Y-%m-%d')}: {notes}"
+        self.store.update_status(self.owner, application_id, status.value, new_notes)
+        
+        old_status = app.status
+        app.status = status
+        app.notes = new_notes
+        self._reindex_status(app, old_status)
+    
+    def clear_applications(self):
+        """Delete this owner's whole application history"""
+        self.store.delete_all(self.owner)
+        self.applications = []
+        self._reset_indexes()
     
     def get_analytics(self) -> Dict:
-        """Get application analytics"""
-        total_apps = len(self.applications)
+        """Get application analytics from the maintained counters"""
+        total_apps = len(self._by_id)
         
         if total_apps == 0:
             return {"total": 0, "response_rate": 0, "interview_rate": 0}
         
-        responses = len([app for app in self.applications if app.response_received])
-        interviews = len([app for app in self.applications if app.status == ApplicationStatus.INTERVIEW])
+        responses = len(self._responded)
+        interviews = len(self._by_status[ApplicationStatus.INTERVIEW])
         
         return {
             "total_applications": total_apps,
@@ -752,50 +1421,61 @@ class ApplicationTracker:
     
     def _get_status_breakdown(self) -> Dict[str, int]:
         """Get breakdown of application statuses"""
-        breakdown = {}
-        for app in self.applications:
-            status = app.status.value
-            breakdown[status] = breakdown.get(status, 0) + 1
-        return breakdown
+        return {status.value: len(bucket) for status, bucket in self._by_status.items() if bucket}
     
     def _get_top_companies(self) -> List[Tuple[str, int]]:
         """Get companies with most applications"""
-        companies = {}
-        for app in self.applications:
-            company = app.job.company
-            companies[company] = companies.get(company, 0) + 1
-        
-        return sorted(companies.items(), key=lambda x: x[1], reverse=True)[:10]
+        return [(company, count) for count, company in sorted(self._top_companies, reverse=True)]
     
     def _get_applications_by_date(self) -> Dict[str, int]:
-        """Get applications grouped by date"""
-        by_date = {}
-        for app in self.applications:
-            date_str = app.applied_date.strftime('%Y-%m-%d')
-            by_date[date_str] = by_date.get(date_str, 0) + 1
+        """Get applications grouped by date, oldest first"""
+        return {day.strftime('%Y-%m-%d'): count for day, count in sorted(self._daily_counts.items())}
+    
+    def to_dataframe(self) -> "pd.DataFrame":
+        """
+        Columnar export of every application for ad-hoc analysis
         
-        return by_date
+        Low-cardinality columns (status, company, board, location) are
+        categoricals, so grouping and filtering stay cheap on large histories.
+        """
+        apps = self.applications
+        jobs = [app.job for app in apps]
+        
+        return pd.DataFrame({
+            "application_id": [app.application_id for app in apps],
+            "applied_date": pd.to_datetime([app.applied_date for app in apps]),
+            "status": pd.Categorical([app.status.value for app in apps],
+                                     categories=[status.value for status in ApplicationStatus]),
+            "company": pd.Categorical([job.company for job in jobs]),
+            "title": [job.title for job in jobs],
+            "location": pd.Categorical([job.location for job in jobs]),
+            "job_board": pd.Categorical([job.job_board.value for job in jobs],
+                                        categories=[board.value for board in JobBoard]),
+            "salary": [job.salary for job in jobs],
+            "job_type": pd.Categorical([job.job_type for job in jobs]),
+            "remote": pd.array([bool(job.remote_option) for job in jobs], dtype="bool"),
+            "match_score": pd.array([job.match_score for job in jobs], dtype="float64"),
+            "response_received": pd.array([bool(app.response_received) for app in apps], dtype="bool"),
+            "interview_scheduled": pd.to_datetime([app.interview_scheduled for app in apps]),
+            "notes": [app.notes for app in apps],
+            "url": [job.url for job in jobs],
+        })
     
     def save_applications(self):
-        """Save applications to session state"""
-        if 'job_applications' not in st.session_state:
-            st.session_state.job_applications = []
-        
-        # Convert to dict for JSON serialization
-        st.session_state.job_applications = [asdict(app) for app in self.applications]
+        """Write every tracked application to the store in one transaction"""
+        self.store.save_many(self.owner, self.applications)
     
     def load_applications(self):
-        """Load applications from session state"""
-        if 'job_applications' in st.session_state:
-            # Convert back from dict
+        """Load this owner's applications from the store"""
+        try:
+            self.applications = self.store.load(self.owner)
+        except Exception as e:
+            st.warning(f"Could not load application history: {str(e)}")
             self.applications = []
-            for app_dict in st.session_state.job_applications:
-                # Reconstruct objects (simplified for demo)
-                try:
-                    app = JobApplication(**app_dict)
-                    self.applications.append(app)
-                except:
-                    continue
+        
+        self._reset_indexes()
+        for application in self.applications:
+            self._index(application)
 
 # ================================
 # 📧 FOLLOW-UP AUTOMATION
@@ -5,11 +5,8 @@ Streamlit UI components for job application automation
 
 import asyncio
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import time
 
 from job_automation import (
@@ -24,8 +21,52 @@ from job_automation import (
     JobListing,
     JobApplication
 )
+from job_store import JobQuery
+from lazy_imports import lazy_import
+from session_artifacts import get_session_artifact, put_session_artifact, session_artifact_version
 from payment_processor import PlanType
 
+# Charting and dataframe libraries load when a page first needs them
+pd = lazy_import("pandas", "pip install pandas")
+plotly = lazy_import("plotly", "pip install plotly")
+
+# ================================
+# 🧰 SHARED SERVICES
+# ================================
+
+@st.cache_resource(show_spinner=False)
+def get_automation_engine() -> JobAutomationEngine:
+    """
+    Process-wide search engine
+    
+    The engine only holds shared infrastructure (scrapers, browser pool,
+    HTTP client, stores, circuit breakers, the deduplicator's index), each of
+    which locks its own state, so every session reuses one instance and
+    reruns never pay its startup cost.
+    """
+    return JobAutomationEngine()
+
+@st.cache_resource(show_spinner=False)
+def get_follow_up_manager() -> FollowUpManager:
+    """Process-wide follow-up manager (stateless email templates)"""
+    return FollowUpManager()
+
+def get_session_tracker() -> ApplicationTracker:
+    """This user's application tracker, rebuilt only when the user changes"""
+    owner = ApplicationTracker.session_owner()
+    tracker = st.session_state.get('application_tracker')
+    
+    if tracker is None or tracker.owner != owner:
+        tracker = ApplicationTracker(owner)
+        st.session_state.application_tracker = tracker
+    return tracker
+
+def get_session_smart_targeting() -> SmartTargeting:
+    """Per-session targeting analysis (holds this user's success patterns)"""
+    if 'smart_targeting' not in st.session_state:
+        st.session_state.smart_targeting = SmartTargeting()
+    return st.session_state.smart_targeting
+
 # ================================
 # 🎯 JOB AUTOMATION UI COMPONENTS
 # ================================
@@ -34,10 +75,11 @@ class JobAutomationUI:
     """Streamlit UI for job automation features"""
     
     def __init__(self):
-        self.automation_engine = JobAutomationEngine()
-        self.tracker = ApplicationTracker()
-        self.follow_up_manager = FollowUpManager()
-        self.smart_targeting = SmartTargeting()
+        # Heavy services are shared; per-user state lives in session_state
+        self.automation_engine = get_automation_engine()
+        self.tracker = get_session_tracker()
+        self.follow_up_manager = get_follow_up_manager()
+        self.smart_targeting = get_session_smart_targeting()
         
         # Initialize session state
         self._init_session_state()
@@ -47,9 +89,6 @@ class JobAutomationUI:
         if 'automation_active' not in st.session_state:
             st.session_state.automation_active = False
         
-        if 'job_search_results' not in st.session_state:
-            st.session_state.job_search_results = []
-        
         if 'automation_settings' not in st.session_state:
             st.session_state.automation_settings = None
         
@@ -307,6 +346,11 @@ class JobAutomationUI:
     
     def _render_automation_dashboard(self):
         """Render automation dashboard with analytics"""
+        if not plotly:
+            st.error("❌ The dashboard needs plotly. Please install: pip install plotly")
+            return
+        import plotly.express as px
+        
         st.markdown("### 📊 Automation Dashboard")
         
         # Get analytics
@@ -339,7 +383,7 @@ class JobAutomationUI:
             )
         
         with col4:
-            today_count = len([app for app in self.tracker.get_applications(days=1)])
+            today_count = self.tracker.count_applications(days=1)
             st.metric(
                 "Applied Today",
                 today_count,
@@ -444,24 +488,118 @@ class JobAutomationUI:
             )
             
             max_results = st.slider("Maximum jobs to find", 10, 200, 50)
+            
+            only_new = st.checkbox(
+                "Only new postings since my last search",
+                value=False,
+                help="Stops crawling each board at the first posting a previous run of this search already found"
+            )
         
         with col2:
             st.markdown("#### Search Status")
             
-            if st.session_state.job_search_results:
-                st.success(f"✅ Found {len(st.session_state.job_search_results)} jobs")
+            search_results = get_session_artifact("job_search_results", [])
+            if search_results:
+                st.success(f"✅ Found {len(search_results)} jobs")
             else:
                 st.info("🔍 Click 'Search Jobs' to find opportunities")
             
             # Search button
             if st.button("🚀 Search Jobs", type="primary", use_container_width=True):
-                self._run_job_search(search_roles, search_locations, max_results)
+                self._run_job_search(search_roles, search_locations, max_results, only_new)
         
         # Display search results
-        if st.session_state.job_search_results:
+        if get_session_artifact("job_search_results"):
             self._display_job_results()
+        
+        self._render_saved_job_search()
     
-    def _run_job_search(self, override_roles: List[str], override_locations: List[str], max_results: int):
+    def _render_saved_job_search(self):
+        """Full-text search over every listing found by previous searches"""
+        # An expander's body runs even while collapsed; a toggle lets the
+        # store queries below run only while the section is open
+        if not st.toggle("🗂️ Search all saved listings", key="saved_search_open"):
+            return
+        
+        with st.container(border=True):
+            text = st.text_input(
+                "Search titles, companies and descriptions",
+                key="saved_search_text",
+                placeholder='e.g. python "data engineer" -junior',
+                help='Use "quotes" for phrases, OR between alternatives, -word to exclude, '
+                     'and title:, company:, location: or description: to search one field'
+            )
+            
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                boards = st.multiselect(
+                    "Job boards",
+                    options=[board.value for board in JobBoard],
+                    format_func=str.title,
+                    key="saved_search_boards"
+                )
+                remote_only = st.checkbox("Remote only", key="saved_search_remote")
+            
+            with col2:
+                job_types = st.multiselect(
+                    "Job type",
+                    options=self.automation_engine.job_store.job_types(),
+                    key="saved_search_job_types"
+                )
+            
+            with col3:
+                salary_range = st.slider(
+                    "Salary range (£k)", 0, 200, (0, 200), 5,
+                    key="saved_search_salary",
+                    help="Listings without an advertised salary are hidden when a range is set"
+                )
+            
+            page = st.session_state.get("saved_search_page", 1)
+            query = JobQuery(
+                text=text,
+                boards=boards,
+                job_types=job_types,
+                remote_only=remote_only,
+                salary_min=salary_range[0] * 1000 if salary_range[0] > 0 else None,
+                salary_max=salary_range[1] * 1000 if salary_range[1] < 200 else None,
+                page=page,
+                page_size=10
+            )
+            
+            # Go back to the first page whenever the query itself changes
+            query_key = (text, tuple(boards), tuple(job_types), remote_only, salary_range)
+            if st.session_state.get("saved_search_key") != query_key:
+                st.session_state.saved_search_key = query_key
+                query.page = st.session_state.saved_search_page = 1
+            
+            try:
+                results = self.automation_engine.query_stored_jobs(query, st.session_state.automation_settings)
+            except Exception as e:
+                st.error(f"❌ Search failed: {str(e)}")
+                return
+            
+            st.caption(f"{results.total:,} listings • page {results.page} of {results.pages} • {results.took_ms:.0f} ms")
+            
+            for i, job in enumerate(results.jobs):
+                self._render_job_card(job, i, key_prefix="saved_")
+            
+            col1, col2, col3 = st.columns([1, 2, 1])
+            
+            with col1:
+                if st.button("⬅️ Previous", key="saved_search_prev", disabled=results.page <= 1,
+                             use_container_width=True):
+                    st.session_state.saved_search_page = results.page - 1
+                    st.rerun()
+            
+            with col3:
+                if st.button("Next ➡️", key="saved_search_next", disabled=results.page >= results.pages,
+                             use_container_width=True):
+                    st.session_state.saved_search_page = results.page + 1
+                    st.rerun()
+    
+    def _run_job_search(self, override_roles: List[str], override_locations: List[str], max_results: int,
+                        only_new: bool = False):
         """Execute job search"""
         settings = st.session_state.automation_settings
         
@@ -473,8 +611,40 @@ class JobAutomationUI:
         
         with st.spinner("🔍 Searching for jobs across multiple platforms..."):
             try:
+                # Show each board's results as soon as it finishes
+                board_status = st.empty()
+                partial_results = st.empty()
+                boards_done = []
+                partial_jobs = []
+                
+                def on_board_complete(result):
+                    icon = {"ok": "✅", "timeout": "⏱️", "skipped": "⏭️"}.get(result.status, "❌")
+                    boards_done.append(
+                        f"{icon} {result.job_board.value.title()}: {len(result.jobs)} jobs ({result.elapsed:.1f}s)"
+                    )
+                    board_status.markdown("  \n".join(boards_done))
+                    
+                    partial_jobs.extend(result.jobs)
+                    if partial_jobs:
+                        partial_results.dataframe(pd.DataFrame([
+                            {"Title": job.title, "Company": job.company, "Location": job.location,
+                             "Board": job.job_board.value.title(), "Match": f"{job.match_score:.0%}"}
+                            for job in sorted(partial_jobs, key=lambda x: x.match_score, reverse=True)
+                        ]), use_container_width=True)
+                
                 # Run job search
-                jobs = self.automation_engine.search_jobs(settings, max_results)
+                jobs = self.automation_engine.search_jobs(
+                    settings, max_results,
+                    on_board_complete=on_board_complete,
+                    incremental=only_new
+                )
+                partial_results.empty()
+                
+                # Load full descriptions only for the strongest matches
+                if jobs:
+                    board_status.markdown("📄 Loading details for top matches...")
+                    self.automation_engine.enrich_jobs(jobs, min_score=0.6, limit=20)
+                    board_status.empty()
                 
                 # Use AI to enhance job matching if available
                 if st.session_state.get('cv_optimizer'):
@@ -491,7 +661,7 @@ class JobAutomationUI:
                     # For demo, just sort by existing match score
                     jobs.sort(key=lambda x: x.match_score, reverse=True)
                 
-                st.session_state.job_search_results = jobs
+                put_session_artifact("job_search_results", jobs)
                 
                 if jobs:
                     st.success(f"✅ Found {len(jobs)} relevant job opportunities!")
@@ -501,14 +671,47 @@ class JobAutomationUI:
             except Exception as e:
                 st.error(f"❌ Job search failed: {str(e)}")
     
+    def _job_results_frame(self, jobs: List[JobListing]) -> Tuple["pd.DataFrame", Dict[str, "pd.Series"]]:
+        """
+        Columnar view of the search results plus facet counts, built once per search
+        
+        The frame holds one row per job (its position in the results list plus
+        the filterable fields), so filters run as vectorised masks instead of
+        list comprehensions over JobListing objects on every rerun.
+        """
+        results_version = session_artifact_version("job_search_results")
+        cached = st.session_state.get('job_results_frame')
+        if cached and cached[0] == results_version:
+            return cached[1], cached[2]
+        
+        frame = pd.DataFrame({
+            "position": range(len(jobs)),
+            "company": pd.Categorical([job.company for job in jobs]),
+            "location": pd.Categorical([job.location for job in jobs]),
+            "board": pd.Categorical([job.job_board.value for job in jobs]),
+            "match_score": [job.match_score for job in jobs],
+        })
+        facets = {
+            column: frame[column].value_counts()
+            for column in ("company", "location", "board")
+        }
+        
+        st.session_state.job_results_frame = (results_version, frame, facets)
+        return frame, facets
+    
     def _display_job_results(self):
         """Display job search results with application options"""
         st.markdown("### 📋 Job Search Results")
         
-        jobs = st.session_state.job_search_results
+        jobs = get_session_artifact("job_search_results", [])
+        frame, facets = self._job_results_frame(jobs)
+        
+        def facet_label(column: str):
+            counts = facets[column]
+            return lambda value: "All" if value == "All" else f"{value} ({counts[value]})"
         
         # Filters
-        col1, col2, col3 = st.columns(3)
+        col1, col2, col3, col4 = st.columns(4)
         
         with col1:
             min_match_score = st.slider("Minimum Match Score", 0.0, 1.0, 0.5, 0.1)
@@ -516,28 +719,57 @@ class JobAutomationUI:
         with col2:
             company_filter = st.selectbox(
                 "Filter by Company",
-                options=["All"] + list(set([job.company for job in jobs])),
+                options=["All"] + facets["company"].index.tolist(),
+                format_func=facet_label("company"),
                 index=0
             )
         
         with col3:
             location_filter = st.selectbox(
                 "Filter by Location",
-                options=["All"] + list(set([job.location for job in jobs])),
+                options=["All"] + facets["location"].index.tolist(),
+                format_func=facet_label("location"),
+                index=0
+            )
+        
+        with col4:
+            board_filter = st.selectbox(
+                "Filter by Job Board",
+                options=["All"] + facets["board"].index.tolist(),
+                format_func=facet_label("board"),
                 index=0
             )
         
         # Apply filters
-        filtered_jobs = jobs
-        filtered_jobs = [job for job in filtered_jobs if job.match_score >= min_match_score]
+        mask = frame["match_score"] >= min_match_score
         
         if company_filter != "All":
-            filtered_jobs = [job for job in filtered_jobs if job.company == company_filter]
+            mask &= frame["company"] == company_filter
         
         if location_filter != "All":
-            filtered_jobs = [job for job in filtered_jobs if job.location == location_filter]
+            mask &= frame["location"] == location_filter
+        
+        if board_filter != "All":
+            mask &= frame["board"] == board_filter
+        
+        filtered = frame[mask]
+        
+        # Pagination: only the visible page of cards is rendered
+        col1, col2 = st.columns([3, 1])
+        
+        with col2:
+            page_size = st.selectbox("Jobs per page", [10, 25, 50], index=0)
+        
+        total_pages = max(1, -(-len(filtered) // page_size))
+        filter_key = (min_match_score, company_filter, location_filter, board_filter, page_size,
+                      session_artifact_version("job_search_results"))
+        if st.session_state.get('job_results_filter_key') != filter_key:
+            st.session_state.job_results_filter_key = filter_key
+            st.session_state.job_results_page = 1
+        page = min(st.session_state.get('job_results_page', 1), total_pages)
         
-        st.write(f"Showing {len(filtered_jobs)} of {len(jobs)} jobs")
+        with col1:
+            st.write(f"Showing {len(filtered)} of {len(jobs)} jobs • page {page} of {total_pages}")
         
         # Bulk actions
         col1, col2, col3 = st.columns(3)
@@ -545,7 +777,7 @@ class JobAutomationUI:
         with col1:
             if st.button("✅ Select All High Matches (>0.7)", use_container_width=True):
                 st.session_state.selected_jobs = [
-                    job for job in filtered_jobs if job.match_score > 0.7
+                    jobs[position] for position in filtered.loc[filtered["match_score"] > 0.7, "position"]
                 ]
                 st.rerun()
         
@@ -560,11 +792,26 @@ class JobAutomationUI:
             selected_count = len(st.session_state.selected_jobs)
             st.metric("Selected Jobs", selected_count)
         
-        # Job cards
-        for i, job in enumerate(filtered_jobs):
-            self._render_job_card(job, i)
+        # Job cards for the current page, keyed by position so widget keys stay stable across pages
+        page_positions = filtered["position"].iloc[(page - 1) * page_size:page * page_size]
+        for position in page_positions:
+            self._render_job_card(jobs[position], int(position))
+        
+        if total_pages > 1:
+            col1, col2, col3 = st.columns([1, 2, 1])
+            
+            with col1:
+                if st.button("⬅️ Previous", key="job_results_prev", disabled=page <= 1, use_container_width=True):
+                    st.session_state.job_results_page = page - 1
+                    st.rerun()
+            
+            with col3:
+                if st.button("Next ➡️", key="job_results_next", disabled=page >= total_pages,
+                             use_container_width=True):
+                    st.session_state.job_results_page = page + 1
+                    st.rerun()
     
-    def _render_job_card(self, job: JobListing, index: int):
+    def _render_job_card(self, job: JobListing, index: int, key_prefix: str = ""):
         """Render individual job card"""
         
         # Match score color
@@ -646,12 +893,12 @@ class JobAutomationUI:
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            if st.button("👁️ View Details", key=f"view_{index}", use_container_width=True):
+            if st.button("👁️ View Details", key=f"{key_prefix}view_{index}", use_container_width=True):
                 self._show_job_details(job)
         
         with col2:
             select_text = "✅ Selected" if is_selected else "➕ Select"
-            if st.button(select_text, key=f"select_{index}", use_container_width=True):
+            if st.button(select_text, key=f"{key_prefix}select_{index}", use_container_width=True):
                 if is_selected:
                     st.session_state.selected_jobs.remove(job)
                 else:
@@ -659,15 +906,22 @@ class JobAutomationUI:
                 st.rerun()
         
         with col3:
-            if st.button("🚀 Apply Now", key=f"apply_{index}", type="primary", use_container_width=True):
+            if st.button("🚀 Apply Now", key=f"{key_prefix}apply_{index}", type="primary", use_container_width=True):
                 self._apply_to_single_job(job)
         
         with col4:
-            if st.button("🔗 Open Job", key=f"open_{index}", use_container_width=True):
+            if st.button("🔗 Open Job", key=f"{key_prefix}open_{index}", use_container_width=True):
                 st.markdown(f'<a href="{job.url}" target="_blank">Open in new tab</a>', unsafe_allow_html=True)
     
     def _show_job_details(self, job: JobListing):
         """Show detailed job information in modal"""
+        # Details are fetched on demand for listings the search didn't enrich
+        if not job.description:
+            with st.spinner("Loading job details..."):
+                self.automation_engine.enrich_jobs([job], min_score=0.0, limit=1)
+        
+        details = self.automation_engine.get_job_details(job)
+        
         with st.expander(f"📋 {job.title} at {job.company} - Full Details", expanded=True):
             
             col1, col2 = st.columns(2)
@@ -697,6 +951,11 @@ class JobAutomationUI:
                 for req in job.requirements:
                     st.markdown(f"• {req}")
             
+            if details and (details.skills or details.years_experience):
+                st.markdown("**Key Skills:** " + (', '.join(details.skills) if details.skills else 'Not specified'))
+                if details.years_experience:
+                    st.markdown(f"**Experience Required:** {details.years_experience}+ years")
+            
             st.markdown(f"**Apply directly:** [View on {job.job_board.value.title()}]({job.url})")
     
     def _bulk_apply_jobs(self):
@@ -709,7 +968,7 @@ class JobAutomationUI:
         
         # Check daily limits
         settings = st.session_state.automation_settings
-        applications_today = len(self.tracker.get_applications(days=1))
+        applications_today = self.tracker.count_applications(days=1)
         
         remaining_today = settings.max_applications_per_day - applications_today
         
@@ -763,13 +1022,13 @@ class JobAutomationUI:
                     interview_scheduled=None
                 )
                 
-                # Add to tracker
-                self.tracker.add_application(application)
-                
                 # Schedule follow-ups if enabled
                 if settings.auto_follow_up:
                     self.follow_up_manager.schedule_follow_ups(application)
                 
+                # Add to tracker
+                self.tracker.add_application(application)
+                
                 successful_applications += 1
                 
             except Exception as e:
@@ -1041,7 +1300,7 @@ class JobAutomationUI:
         
         with col2:
             st.markdown("**Today's Progress:**")
-            applications_today = len(self.tracker.get_applications(days=1))
+            applications_today = self.tracker.count_applications(days=1)
             progress = applications_today / settings.max_applications_per_day
             st.progress(progress)
             st.text(f"{applications_today}/{settings.max_applications_per_day} applications sent")
@@ -1058,8 +1317,7 @@ class JobAutomationUI:
         with col2:
             if st.button("🗑️ Clear Application History", use_container_width=True):
                 if st.confirm("Are you sure you want to clear all application history?"):
-                    st.session_state.job_applications = []
-                    self.tracker.applications = []
+                    self.tracker.clear_applications()
                     st.success("✅ Application history cleared!")
                     st.rerun()
         
@@ -1115,31 +1373,26 @@ class JobAutomationUI:
     
     def _export_application_data(self):
         """Export application data as CSV"""
-        applications = self.tracker.get_applications()
-        
-        if not applications:
+        if not self.tracker.applications:
             st.warning("No application data to export!")
             return
         
-        # Prepare data for export
-        export_data = []
-        for app in applications:
-            export_data.append({
-                'Application Date': app.applied_date.strftime('%Y-%m-%d'),
-                'Company': app.job.company,
-                'Job Title': app.job.title,
-                'Location': app.job.location,
-                'Status': app.status.value.title(),
-                'Job Board': app.job.job_board.value.title(),
-                'Salary': app.job.salary or 'Not specified',
-                'Job Type': app.job.job_type,
-                'Remote': 'Yes' if app.job.remote_option else 'No',
-                'Response Received': 'Yes' if app.response_received else 'No',
-                'Notes': app.notes,
-                'Job URL': app.job.url
-            })
-        
-        df = pd.DataFrame(export_data)
+        # Prepare data for export from the tracker's columnar frame
+        data = self.tracker.to_dataframe()
+        df = pd.DataFrame({
+            'Application Date': data['applied_date'].dt.strftime('%Y-%m-%d'),
+            'Company': data['company'],
+            'Job Title': data['title'],
+            'Location': data['location'],
+            'Status': data['status'].astype(str).str.title(),
+            'Job Board': data['job_board'].astype(str).str.title(),
+            'Salary': data['salary'].fillna('Not specified'),
+            'Job Type': data['job_type'],
+            'Remote': data['remote'].map({True: 'Yes', False: 'No'}),
+            'Response Received': data['response_received'].map({True: 'Yes', False: 'No'}),
+            'Notes': data['notes'],
+            'Job URL': data['url']
+        })
         csv = df.to_csv(index=False)
         
         st.download_button(
@@ -0,0 +1,397 @@
+# job_dedup.py
+"""
+Fuzzy job deduplication across job boards using MinHash/LSH signatures
+"""
+
+import json
+import os
+import re
+import random
+import hashlib
+import tempfile
+import threading
+import time
+from dataclasses import replace
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+# ================================
+# 🧹 TOKEN NORMALIZATION
+# ================================
+
+# Words that vary between boards for the same role and carry no identity
+TITLE_NOISE_WORDS = {
+    'a', 'an', 'and', 'the', 'of', 'for', 'in', 'at', 'to', 'with', 'on',
+    'job', 'jobs', 'role', 'vacancy', 'position', 'opportunity',
+    'remote', 'hybrid', 'onsite', 'uk', 'urgent', 'immediate', 'start',
+    'permanent', 'perm', 'contract', 'temporary', 'temp',
+    'full', 'time', 'fulltime', 'part', 'parttime',
+}
+
+# Legal suffixes boards add or drop from company names
+COMPANY_SUFFIXES = {
+    'ltd', 'limited', 'plc', 'llp', 'llc', 'inc', 'incorporated',
+    'group', 'uk', 'co', 'company', 'corp', 'corporation', 'holdings',
+}
+
+# Common title abbreviations expanded so "Sr. Dev" matches "Senior Developer"
+TITLE_ABBREVIATIONS = {
+    'sr': 'senior',
+    'snr': 'senior',
+    'jr': 'junior',
+    'jnr': 'junior',
+    'dev': 'developer',
+    'eng': 'engineer',
+    'mgr': 'manager',
+    'swe': 'software engineer',
+}
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9+#]+")
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def normalize_title_tokens(title: str) -> List[str]:
+    """Lowercase, expand abbreviations and drop noise words from a job title"""
+    tokens = []
+    for raw in _TOKEN_PATTERN.findall((title or "").lower()):
+        expanded = TITLE_ABBREVIATIONS.get(raw, raw)
+        for token in expanded.split():
+            if token not in TITLE_NOISE_WORDS:
+                tokens.append(token)
+    return tokens
+
+
+def normalize_company(company: str) -> str:
+    """Normalize a company name by dropping punctuation and legal suffixes"""
+    tokens = [t for t in _TOKEN_PATTERN.findall((company or "").lower()) if t not in COMPANY_SUFFIXES]
+    return " ".join(tokens)
+
+
+def normalize_location(location: str) -> str:
+    """Reduce a location to its primary place name (e.g. "London, Greater London" -> "london")"""
+    primary = (location or "").split(',')[0]
+    tokens = _TOKEN_PATTERN.findall(primary.lower())
+    return " ".join(tokens)
+
+
+def job_shingles(job) -> Set[str]:
+    """Build the token set used for the MinHash signature of a job"""
+    title_tokens = normalize_title_tokens(job.title)
+    shingles = set(title_tokens)
+
+    # Bigrams keep some word order information
+    for first, second in zip(title_tokens, title_tokens[1:]):
+        shingles.add(f"{first}_{second}")
+
+    company = normalize_company(job.company)
+    if company:
+        shingles.add(f"company:{company}")
+
+    return shingles
+
+# ================================
+# 🔢 MINHASH / LSH
+# ================================
+
+class MinHasher:
+    """Compute fixed-size MinHash signatures for token sets"""
+
+    def __init__(self, num_perm: int = 64, seed: int = 42):
+        self.num_perm = num_perm
+
+        # Deterministic permutations so persisted signatures stay comparable
+        rng = random.Random(seed)
+        self.permutations = [
+            (rng.randint(1, _MERSENNE_PRIME - 1), rng.randint(0, _MERSENNE_PRIME - 1))
+            for _ in range(num_perm)
+        ]
+
+    @staticmethod
+    def _hash_token(token: str) -> int:
+        """Stable 32-bit hash of a token (independent of PYTHONHASHSEED)"""
+        digest = hashlib.blake2b(token.encode('utf-8'), digest_size=4).digest()
+        return int.from_bytes(digest, 'little')
+
+    def signature(self, tokens: Set[str]) -> List[int]:
+        """Return the MinHash signature for a token set"""
+        if not tokens:
+            return [_MAX_HASH] * self.num_perm
+
+        hashes = [self._hash_token(token) for token in tokens]
+        return [
+            min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+            for a, b in self.permutations
+        ]
+
+    @staticmethod
+    def similarity(sig_a: List[int], sig_b: List[int]) -> float:
+        """Estimate Jaccard similarity from two signatures"""
+        if not sig_a or len(sig_a) != len(sig_b):
+            return 0.0
+        matches = sum(1 for a, b in zip(sig_a, sig_b) if a == b)
+        return matches / len(sig_a)
+
+
+class LSHIndex:
+    """Banded locality-sensitive hashing index over MinHash signatures"""
+
+    def __init__(self, num_perm: int = 64, bands: int = 16):
+        if num_perm % bands != 0:
+            raise ValueError("num_perm must be divisible by bands")
+
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.buckets: Dict[Tuple[int, str], Set[str]] = {}
+
+    def _band_keys(self, signature: List[int]) -> List[Tuple[int, str]]:
+        keys = []
+        for band in range(self.bands):
+            start = band * self.rows
+            chunk = signature[start:start + self.rows]
+            keys.append((band, ",".join(str(value) for value in chunk)))
+        return keys
+
+    def insert(self, key: str, signature: List[int]):
+        """Add a signature to the index under the given key"""
+        for band_key in self._band_keys(signature):
+            self.buckets.setdefault(band_key, set()).add(key)
+
+    def remove(self, key: str, signature: List[int]):
+        """Remove a previously inserted signature"""
+        for band_key in self._band_keys(signature):
+            bucket = self.buckets.get(band_key)
+            if bucket:
+                bucket.discard(key)
+                if not bucket:
+                    del self.buckets[band_key]
+
+    def query(self, signature: List[int]) -> Set[str]:
+        """Return keys sharing at least one band with the signature"""
+        candidates = set()
+        for band_key in self._band_keys(signature):
+            candidates.update(self.buckets.get(band_key, ()))
+        return candidates
+
+# ================================
+# 🧹 JOB DEDUPLICATOR
+# ================================
+
+class JobDeduplicator:
+    """
+    Merge near-duplicate job listings across boards.
+
+    Each listing is reduced to normalized title/company tokens and a MinHash
+    signature. Signatures are bucketed with LSH so only likely duplicates are
+    compared, keeping deduplication near-linear in the number of listings.
+    Clusters are persisted to disk so the same role keeps the same cluster ID
+    between searches.
+
+    One instance is safe to share between threads: the index is only touched
+    under a lock, and it is written back (atomically, via a temp file) only
+    when clusters were added, or every save_interval seconds for last-seen
+    refreshes alone.
+    """
+
+    def __init__(self,
+                 index_path: str = "../output/job_dedup_index.json",
+                 num_perm: int = 64,
+                 bands: int = 16,
+                 threshold: float = 0.6,
+                 max_entries: int = 20000,
+                 save_interval: float = 300.0):
+        """
+        Initialize the deduplicator
+
+        Args:
+            index_path: JSON file holding persisted clusters (relative to code/ directory)
+            num_perm: Number of MinHash permutations per signature
+            bands: Number of LSH bands (num_perm must be divisible by bands)
+            threshold: Minimum estimated Jaccard similarity to treat jobs as duplicates
+            max_entries: Maximum clusters kept in the persisted index
+            save_interval: Seconds between saves when only last-seen times changed
+        """
+        script_dir = Path(__file__).parent
+        self.index_path = script_dir / index_path
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.save_interval = save_interval
+
+        self.hasher = MinHasher(num_perm=num_perm)
+        self.lsh = LSHIndex(num_perm=num_perm, bands=bands)
+
+        # cluster_id -> {"signature", "company", "location", "last_seen"}
+        self.clusters: Dict[str, Dict] = {}
+
+        self._lock = threading.RLock()
+        self._dirty = False    # clusters added or evicted since the last save
+        self._touched = False  # only last_seen times changed since the last save
+        self._last_save = time.monotonic()
+
+        self.load_index()
+
+    def deduplicate(self, jobs: List) -> List:
+        """
+        Merge near-duplicate listings, keeping the richest record per cluster
+
+        Args:
+            jobs: Job listings from one or more boards
+
+        Returns:
+            One merged listing per distinct role, in first-seen order
+        """
+        merged: Dict[str, object] = {}
+        order: List[str] = []
+
+        with self._lock:
+            for job in jobs:
+                cluster_id = self.assign_cluster(job)
+
+                if cluster_id in merged:
+                    merged[cluster_id] = self._merge_jobs(merged[cluster_id], job)
+                else:
+                    merged[cluster_id] = job
+                    order.append(cluster_id)
+
+            if self._dirty or (self._touched and time.monotonic() - self._last_save >= self.save_interval):
+                self.save_index()
+
+        return [merged[cluster_id] for cluster_id in order]
+
+    def assign_cluster(self, job) -> str:
+        """Return the cluster ID for a job, creating a new cluster if needed"""
+        signature = self.hasher.signature(job_shingles(job))
+        company = normalize_company(job.company)
+        location = normalize_location(job.location)
+
+        with self._lock:
+            cluster_id = self._find_cluster(signature, company, location)
+
+            if cluster_id is None:
+                cluster_id = f"{job.job_board.value}:{job.job_id}"
+                # Board job IDs can collide with an unrelated persisted cluster
+                if cluster_id in self.clusters:
+                    cluster_id = f"{cluster_id}:{len(self.clusters)}"
+
+                self.clusters[cluster_id] = {
+                    "signature": signature,
+                    "company": company,
+                    "location": location,
+                }
+                self.lsh.insert(cluster_id, signature)
+                self._dirty = True
+
+            self.clusters[cluster_id]["last_seen"] = datetime.now().isoformat()
+            self._touched = True
+            return cluster_id
+
+    def _find_cluster(self, signature: List[int], company: str, location: str) -> Optional[str]:
+        """Find the most similar existing cluster above the threshold"""
+        best_id = None
+        best_score = self.threshold
+
+        for candidate_id in self.lsh.query(signature):
+            cluster = self.clusters.get(candidate_id)
+            if not cluster:
+                continue
+
+            # Same role at a different company or city is a different job
+            if company and cluster["company"] and company != cluster["company"]:
+                continue
+            if location and cluster["location"] and location != cluster["location"]:
+                continue
+
+            score = MinHasher.similarity(signature, cluster["signature"])
+            if score >= best_score:
+                best_id = candidate_id
+                best_score = score
+
+        return best_id
+
+    @staticmethod
+    def _richness(job) -> int:
+        """Score how much useful information a listing carries"""
+        score = 0
+        if job.salary:
+            score += 2
+        if job.description:
+            score += 2 + min(len(job.description) // 500, 3)
+        score += min(len(job.requirements or []), 5)
+        if job.application_deadline:
+            score += 1
+        if job.url:
+            score += 1
+        return score
+
+    def _merge_jobs(self, current, candidate):
+        """Keep the richer listing and fill its gaps from the other one"""
+        if self._richness(candidate) > self._richness(current):
+            primary, secondary = candidate, current
+        else:
+            primary, secondary = current, candidate
+
+        return replace(
+            primary,
+            salary=primary.salary or secondary.salary,
+            description=primary.description or secondary.description,
+            requirements=primary.requirements or secondary.requirements,
+            application_deadline=primary.application_deadline or secondary.application_deadline,
+            remote_option=primary.remote_option or secondary.remote_option,
+            match_score=max(primary.match_score, secondary.match_score),
+        )
+
+    def load_index(self):
+        """Load persisted clusters and rebuild the LSH buckets"""
+        if not self.index_path.exists():
+            return
+
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+
+        # Signatures from a different configuration are not comparable
+        if data.get("num_perm") != self.hasher.num_perm or data.get("bands") != self.lsh.bands:
+            return
+
+        for cluster_id, cluster in data.get("clusters", {}).items():
+            self.clusters[cluster_id] = cluster
+            self.lsh.insert(cluster_id, cluster["signature"])
+
+    def save_index(self):
+        """Persist clusters, evicting the least recently seen beyond max_entries"""
+        with self._lock:
+            if len(self.clusters) > self.max_entries:
+                by_age = sorted(self.clusters.items(), key=lambda item: item[1].get("last_seen", ""))
+                for cluster_id, cluster in by_age[:len(self.clusters) - self.max_entries]:
+                    self.lsh.remove(cluster_id, cluster["signature"])
+                    del self.clusters[cluster_id]
+
+            payload = json.dumps({
+                "num_perm": self.hasher.num_perm,
+                "bands": self.lsh.bands,
+                "clusters": self.clusters,
+            })
+
+            # Write a temp file and rename it over the index, so a crash
+            # mid-write leaves the previous index intact
+            tmp_path = None
+            try:
+                self.index_path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=self.index_path.parent, prefix=".tmp-", suffix=".json")
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(payload)
+                os.replace(tmp_path, self.index_path)
+            except OSError:
+                if tmp_path:
+                    try:
+                        os.unlink(tmp_path)
+                    except OSError:
+                        pass
+                return
+
+            self._dirty = False
+            self._touched = False
+            self._last_save = time.monotonic()
@@ -0,0 +1,255 @@
+# job_enrichment.py
+"""
+Lazy job-detail enrichment: fetch detail pages only for promising listings
+"""
+
+import re
+from dataclasses import dataclass, asdict, field
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from lxml import etree, html
+
+from job_store import JobStore, get_job_store
+from scraper_http import get_http_backend
+
+# ================================
+# 📄 DETAIL PARSING
+# ================================
+
+# Where each board puts the full description on its job detail page. Only
+# boards that serve detail pages over plain HTTP are listed: LinkedIn and
+# Indeed need a browser, so their listings are never fetched here.
+DETAIL_XPATHS = {
+    "reed": etree.XPath("//span[@itemprop='description'] | //div[contains(@class, 'description')]"),
+    "totaljobs": etree.XPath("//*[@data-at='section-text-jobDescription-content'] | //div[contains(@class, 'job-description')]"),
+}
+
+REQUIREMENT_HEADING = re.compile(
+    r"^(key |essential |desirable )?(requirements|skills|qualifications|experience|about you|"
+    r"what you('ll| will)? (need|bring)|who you are|you('ll| will)? have|must haves?)"
+    r"( (and|&) \w+)?$",
+    re.IGNORECASE
+)
+
+SKILL_KEYWORDS = [
+    # Not 'go' or 'r': they match prose like "go-to" and "R&D"
+    'python', 'java', 'javascript', 'typescript', 'c#', 'c++', 'golang', 'rust', 'ruby', 'php', 'scala',
+    'sql', 'nosql', 'postgresql', 'mysql', 'mongodb', 'redis', 'spark', 'hadoop', 'kafka', 'airflow',
+    'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'terraform', 'linux', 'git', 'ci/cd',
+    'react', 'angular', 'vue', 'node.js', 'django', 'flask', 'fastapi', 'spring', '.net',
+    'machine learning', 'deep learning', 'pytorch', 'tensorflow', 'pandas', 'nlp',
+    'excel', 'power bi', 'tableau', 'salesforce', 'sap', 'jira', 'agile', 'scrum',
+    'figma', 'seo', 'crm', 'stakeholder management', 'project management',
+]
+
+_SKILL_PATTERNS = {
+    skill: re.compile(r"(?<![\w+#.])" + re.escape(skill) + r"(?![\w+#])", re.IGNORECASE)
+    for skill in SKILL_KEYWORDS
+}
+_YEARS_PATTERN = re.compile(r"(\d{1,2})\s*\+?\s*(?:-\s*\d{1,2}\s*)?years?", re.IGNORECASE)
+_SALARY_PATTERN = re.compile(r"£\s?\d[\d,]*(?:\.\d+)?\s?[kK]?(?:\s?(?:-|to)\s?£?\s?\d[\d,]*(?:\.\d+)?\s?[kK]?)?")
+_BULLET_PREFIX = re.compile(r"^[•·\-\*–▪●]\s*")
+
+@dataclass
+class JobDetails:
+    """Structured fields parsed from a job detail page"""
+    description: str
+    requirements: List[str]
+    skills: List[str] = field(default_factory=list)
+    years_experience: Optional[int] = None
+    salary: Optional[str] = None
+    job_type: Optional[str] = None
+    experience_level: Optional[str] = None
+    remote: bool = False
+    fetched_at: str = ""
+
+
+def extract_description(content: bytes, board: str) -> str:
+    """Pull the description text from a detail page, one line per block"""
+    if not content:
+        return ""
+
+    tree = html.fromstring(content)
+    xpath = DETAIL_XPATHS.get(board)
+    nodes = xpath(tree) if xpath is not None else []
+    node = nodes[0] if nodes else tree.find('body')
+    if node is None:
+        return ""
+
+    lines = [" ".join(text.split()) for text in node.itertext()]
+    return "\n".join(line for line in lines if line)
+
+
+def parse_requirements(lines: List[str], limit: int = 15) -> List[str]:
+    """Collect requirement lines, preferring those under a requirements heading"""
+    requirements = []
+    in_section = False
+
+    for line in lines:
+        heading = line.rstrip(':').strip()
+        if len(heading) < 60 and REQUIREMENT_HEADING.match(heading):
+            in_section = True
+            continue
+
+        if in_section:
+            # A different short heading ends the requirements block
+            if len(line) < 60 and line.endswith(':'):
+                in_section = False
+                continue
+            requirements.append(_BULLET_PREFIX.sub('', line))
+
+    if not requirements:
+        requirements = [_BULLET_PREFIX.sub('', line) for line in lines if _BULLET_PREFIX.match(line)]
+
+    return [req for req in requirements if len(req) > 3][:limit]
+
+
+def parse_job_details(description: str) -> JobDetails:
+    """Derive structured fields from a description"""
+    lines = [line.strip() for line in description.split('\n') if line.strip()]
+    lower = description.lower()
+
+    years = [int(match) for match in _YEARS_PATTERN.findall(description) if 0 < int(match) <= 30]
+    salary_match = _SALARY_PATTERN.search(description)
+
+    if 'contract' in lower or 'day rate' in lower:
+        job_type = "Contract"
+    elif 'part-time' in lower or 'part time' in lower:
+        job_type = "Part-time"
+    elif 'full-time' in lower or 'full time' in lower or 'permanent' in lower:
+        job_type = "Full-time"
+    else:
+        job_type = None
+
+    if re.search(r"\b(head of|director|principal|vp)\b", lower):
+        experience_level = "Executive"
+    elif re.search(r"\b(senior|lead|staff)\b", lower):
+        experience_level = "Senior"
+    elif re.search(r"\b(junior|graduate|entry[- ]level|trainee)\b", lower):
+        experience_level = "Entry"
+    else:
+        experience_level = None
+
+    return JobDetails(
+        description=description,
+        requirements=parse_requirements(lines),
+        skills=[skill for skill, pattern in _SKILL_PATTERNS.items() if pattern.search(description)],
+        years_experience=min(years) if years else None,
+        salary=salary_match.group(0).strip() if salary_match else None,
+        job_type=job_type,
+        experience_level=experience_level,
+        remote=bool(re.search(r"\b(remote|work from home|wfh)\b", lower)),
+        fetched_at=datetime.now().isoformat(),
+    )
+
+# ================================
+# 🔎 JOB ENRICHER
+# ================================
+
+class JobDetailEnricher:
+    """
+    Fill in descriptions and requirements for the listings that matter.
+
+    Scrapers only see search cards, so listings arrive without descriptions.
+    The enricher fetches detail pages concurrently over the shared HTTP
+    backend, but only for listings at or above a match-score threshold (or
+    ones the user opens), and caches the parsed details in the job store.
+    Failed fetches are cached too, for failure_ttl seconds, so a dead link
+    isn't fetched again on every rerun.
+    """
+
+    def __init__(self, store: Optional[JobStore] = None, max_entries: int = 5000, failure_ttl: float = 900.0):
+        """
+        Args:
+            store: Job store holding the details (defaults to the shared store)
+            max_entries: Maximum cached job details
+            failure_ttl: Seconds before a failed detail page is fetched again
+        """
+        self.store = store or get_job_store()
+        self.max_entries = max_entries
+        self.failure_ttl = failure_ttl
+        self.http = get_http_backend()
+
+    @staticmethod
+    def cache_key(job) -> Tuple[str, str]:
+        return job.job_board.value, str(job.job_id)
+
+    @staticmethod
+    def can_fetch(job) -> bool:
+        """Whether the job's detail page can be read without a browser"""
+        return bool(job.url) and job.job_board.value in DETAIL_XPATHS
+
+    def get_details(self, job) -> Optional[JobDetails]:
+        """Cached details for a job, if it has been enriched"""
+        cached = self.store.load_details([self.cache_key(job)]).get(self.cache_key(job))
+        return JobDetails(**cached) if cached else None
+
+    def enrich(self, jobs: List, min_score: float = 0.6, limit: int = 20) -> int:
+        """
+        Enrich the best-matching listings in place
+
+        Args:
+            jobs: Candidate listings
+            min_score: Only listings with match_score at or above this are fetched
+            limit: Maximum detail pages fetched in this call
+
+        Returns:
+            Number of listings enriched (from cache or network)
+        """
+        candidates = sorted(
+            [job for job in jobs if job.match_score >= min_score and not job.description and self.can_fetch(job)],
+            key=lambda job: job.match_score,
+            reverse=True
+        )[:limit]
+        if not candidates:
+            return 0
+
+        cached = self.store.load_details([self.cache_key(job) for job in candidates])
+
+        enriched = 0
+        to_fetch = []
+        for job in candidates:
+            key = self.cache_key(job)
+            if key not in cached:
+                to_fetch.append(job)
+            elif cached[key] is not None:
+                self._apply(job, JobDetails(**cached[key]))
+                enriched += 1
+            # else: fetch failed recently; wait for failure_ttl
+
+        if not to_fetch:
+            return enriched
+
+        # Detail pages rarely change; keep them fresh in the HTTP cache for a day
+        results = self.http.fetch_all([job.url for job in to_fetch], ttl=86400)
+
+        fetched = {}
+        failed = []
+        for job, result in zip(to_fetch, results):
+            description = extract_description(result.content, job.job_board.value) if result.ok else ""
+            if not description:
+                failed.append(self.cache_key(job))
+                continue
+
+            details = parse_job_details(description)
+            fetched[self.cache_key(job)] = asdict(details)
+            self._apply(job, details)
+            enriched += 1
+
+        # One transaction for the whole batch
+        self.store.save_details(fetched, failed, retry_after=self.failure_ttl, max_entries=self.max_entries)
+
+        return enriched
+
+    @staticmethod
+    def _apply(job, details: JobDetails):
+        """Copy parsed details onto a listing without discarding card data"""
+        job.description = details.description
+        job.requirements = details.requirements
+        job.salary = job.salary or details.salary
+        job.remote_option = job.remote_option or details.remote
+        if details.job_type:
+            job.job_type = details.job_type
+        if details.experience_level:
+            job.experience_level = details.experience_level
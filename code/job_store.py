@@ -0,0 +1,690 @@
+# job_store.py
+"""
+Persistent SQLite store of scraped job listings with full-text indexes
+"""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# ================================
+# 🗄️ JOB LISTING STORE
+# ================================
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    job_board TEXT NOT NULL,
+    job_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    company TEXT NOT NULL,
+    location TEXT NOT NULL,
+    salary TEXT,
+    description TEXT NOT NULL DEFAULT '',
+    requirements TEXT NOT NULL DEFAULT '[]',
+    url TEXT,
+    posted_date TEXT,
+    application_deadline TEXT,
+    job_type TEXT,
+    experience_level TEXT,
+    remote_option INTEGER NOT NULL DEFAULT 0,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    UNIQUE (job_board, job_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_jobs_title ON jobs (title COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs (company COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_jobs_location ON jobs (location COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_jobs_posted_date ON jobs (posted_date);
+CREATE INDEX IF NOT EXISTS idx_jobs_last_seen ON jobs (last_seen);
+"""
+
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+    title, company, location, description,
+    content='jobs', content_rowid='id'
+);
+
+CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs BEGIN
+    INSERT INTO jobs_fts (rowid, title, company, location, description)
+    VALUES (new.id, new.title, new.company, new.location, new.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs BEGIN
+    INSERT INTO jobs_fts (jobs_fts, rowid, title, company, location, description)
+    VALUES ('delete', old.id, old.title, old.company, old.location, old.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS jobs_fts_update AFTER UPDATE ON jobs BEGIN
+    INSERT INTO jobs_fts (jobs_fts, rowid, title, company, location, description)
+    VALUES ('delete', old.id, old.title, old.company, old.location, old.description);
+    INSERT INTO jobs_fts (rowid, title, company, location, description)
+    VALUES (new.id, new.title, new.company, new.location, new.description);
+END;
+"""
+
+UPSERT_SQL = """
+INSERT INTO jobs (
+    job_board, job_id, title, company, location, salary, salary_min, salary_max, description, requirements,
+    url, posted_date, application_deadline, job_type, experience_level, remote_option,
+    first_seen, last_seen
+) VALUES (
+    :job_board, :job_id, :title, :company, :location, :salary, :salary_min, :salary_max, :description, :requirements,
+    :url, :posted_date, :application_deadline, :job_type, :experience_level, :remote_option,
+    :seen, :seen
+)
+ON CONFLICT (job_board, job_id) DO UPDATE SET
+    title = excluded.title,
+    company = excluded.company,
+    location = excluded.location,
+    salary = COALESCE(excluded.salary, jobs.salary),
+    salary_min = COALESCE(excluded.salary_min, jobs.salary_min),
+    salary_max = COALESCE(excluded.salary_max, jobs.salary_max),
+    description = CASE WHEN excluded.description != '' THEN excluded.description ELSE jobs.description END,
+    requirements = CASE WHEN excluded.requirements != '[]' THEN excluded.requirements ELSE jobs.requirements END,
+    url = COALESCE(excluded.url, jobs.url),
+    application_deadline = COALESCE(excluded.application_deadline, jobs.application_deadline),
+    job_type = excluded.job_type,
+    experience_level = excluded.experience_level,
+    remote_option = excluded.remote_option,
+    last_seen = excluded.last_seen
+"""
+
+# Schema changes applied in order to databases created by older versions
+MIGRATIONS = [
+    # 1: numeric salary bounds and filter indexes for the search API
+    """
+    ALTER TABLE jobs ADD COLUMN salary_min INTEGER;
+    ALTER TABLE jobs ADD COLUMN salary_max INTEGER;
+    CREATE INDEX IF NOT EXISTS idx_jobs_board_posted ON jobs (job_board, posted_date);
+    CREATE INDEX IF NOT EXISTS idx_jobs_salary ON jobs (salary_min, salary_max);
+    CREATE INDEX IF NOT EXISTS idx_jobs_job_type ON jobs (job_type);
+    CREATE INDEX IF NOT EXISTS idx_jobs_remote ON jobs (remote_option);
+    """,
+    # 2: parsed detail pages; details is NULL for a failed fetch until retry_after
+    """
+    CREATE TABLE IF NOT EXISTS job_details (
+        job_board TEXT NOT NULL,
+        job_id TEXT NOT NULL,
+        details TEXT,
+        fetched_at REAL NOT NULL,
+        retry_after REAL,
+        PRIMARY KEY (job_board, job_id)
+    ) WITHOUT ROWID;
+    CREATE INDEX IF NOT EXISTS idx_job_details_fetched_at ON job_details (fetched_at);
+    """,
+    # 3: salary bounds are re-parsed with the £-anchored pattern (see MIGRATION_STEPS)
+    """
+    UPDATE jobs SET salary_min = NULL, salary_max = NULL;
+    """,
+    # 4: job IDs that kept the URL's tracking parameters are re-keyed (see MIGRATION_STEPS)
+    "",
+]
+
+# Python steps run in the same transaction, after the migration with that number
+MIGRATION_STEPS = {
+    3: "_backfill_salaries_locked",
+    4: "_rekey_tracked_job_ids_locked",
+}
+
+_FTS_TOKEN = re.compile(r"\w+", re.UNICODE)
+_QUERY_TERM = re.compile(r'(-)?(?:(title|company|location|description):)?(?:"([^"]*)"|(\S+))', re.IGNORECASE)
+# A £ amount, optionally followed by the end of a range whose £ may be left out ("£30-40k")
+_SALARY_RANGE = re.compile(
+    r"£\s*(\d[\d,]*(?:\.\d+)?)\s*([kK])?"
+    r"(?:\s*(?:-|–|to)\s*£?\s*(\d[\d,]*(?:\.\d+)?)\s*([kK])?)?"
+)
+
+# BM25 weights for title, company, location, description
+BM25_WEIGHTS = (10.0, 4.0, 2.0, 1.0)
+
+# Text searches with up to FULL_RANK_LIMIT matches rank all of them by BM25;
+# broader ones rank only the RANK_WINDOW newest matches
+FULL_RANK_LIMIT = 20000
+RANK_WINDOW = 2000
+
+# Multipliers turning hourly/daily rates into annual salaries
+_SALARY_PERIODS = (
+    (re.compile(r"per hour|/\s*h(ou)?r|hourly", re.IGNORECASE), 1950),
+    (re.compile(r"per day|/\s*day|daily|day rate", re.IGNORECASE), 230),
+    (re.compile(r"per month|/\s*month|monthly", re.IGNORECASE), 12),
+)
+
+
+def parse_salary_range(salary: Optional[str]) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Annual salary bounds from free-text salary strings
+
+    Handles "£30,000 - £40,000", "£30-40k", "£45k", "£350 per day" and
+    similar. Only the first £ amount or range counts, so numbers such as
+    "10% bonus" or "25 days holiday" are ignored. Returns (None, None) when
+    no £ amount is present.
+    """
+    match = _SALARY_RANGE.search(salary or "")
+    if not match:
+        return None, None
+
+    first, first_k, second, second_k = match.groups()
+    low = float(first.replace(',', '')) * (1000 if first_k else 1)
+    high = float(second.replace(',', '')) * (1000 if second_k else 1) if second else low
+
+    # "£30-40k": the k on the upper bound applies to both
+    if second_k and not first_k and low < 1000:
+        low *= 1000
+
+    multiplier = next((m for pattern, m in _SALARY_PERIODS if pattern.search(salary)), 1)
+    low, high = min(low, high) * multiplier, max(low, high) * multiplier
+    return int(low), int(high)
+
+
+def build_fts_query(text: str) -> Optional[str]:
+    """
+    Translate a user query into an FTS5 expression
+
+    Supports bare words (all must match), "quoted phrases", OR between
+    terms, column prefixes (title:, company:, location:, description:) and
+    -exclusions. Everything else is stripped so user input can never raise
+    an FTS syntax error.
+    """
+    positives: List[str] = []
+    negatives: List[str] = []
+
+    for negate, column, phrase, word in _QUERY_TERM.findall(text or ""):
+        if not negate and not column and not phrase and word.upper() == "OR":
+            if positives and positives[-1] != "OR":
+                positives.append("OR")
+            continue
+
+        tokens = _FTS_TOKEN.findall(phrase or word)
+        if not tokens:
+            continue
+
+        term = '"' + " ".join(tokens) + '"'
+        if column:
+            term = f"{column.lower()} : {term}"
+        (negatives if negate else positives).append(term)
+
+    while positives and positives[-1] == "OR":
+        positives.pop()
+
+    if not positives:
+        return None
+
+    expression = " ".join(positives)
+    if negatives:
+        expression = f"({expression}) NOT " + " NOT ".join(negatives)
+    return expression
+
+
+def fts_phrase(text: str) -> Optional[str]:
+    """Quote free text as an FTS5 phrase, dropping query syntax characters"""
+    tokens = _FTS_TOKEN.findall(text or "")
+    if not tokens:
+        return None
+    return '"' + " ".join(tokens) + '"'
+
+
+@dataclass
+class JobQuery:
+    """Search over stored listings"""
+    text: str = ""
+    boards: List[str] = field(default_factory=list)
+    job_types: List[str] = field(default_factory=list)
+    remote_only: bool = False
+    salary_min: Optional[int] = None
+    salary_max: Optional[int] = None
+    posted_since: Optional[datetime] = None
+    page: int = 1
+    page_size: int = 20
+
+
+@dataclass
+class JobSearchPage:
+    """One page of search results"""
+    jobs: List
+    total: int
+    page: int
+    page_size: int
+    took_ms: float
+
+    @property
+    def pages(self) -> int:
+        return max(1, -(-self.total // self.page_size))
+
+
+class JobStore:
+    """
+    Local store of every scraped job listing.
+
+    Listings are upserted keyed on (job_board, job_id): re-scraping a posting
+    refreshes its last_seen time without losing a description or salary found
+    earlier. Title, company, location and posted date are indexed, and an
+    FTS5 table mirrors the text fields so repeat and filtered searches can be
+    answered without scraping.
+    """
+
+    def __init__(self, db_path: str = "../output/jobs.db"):
+        """
+        Args:
+            db_path: SQLite database file (relative to code/ directory)
+        """
+        script_dir = Path(__file__).parent
+        self.db_path = script_dir / db_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        # (PRAGMA data_version, job types) from the last job_types() query
+        self._job_types: Optional[Tuple[int, List[str]]] = None
+
+        # WAL lets several app sessions read while one writes
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+
+        self.has_fts = self._init_schema()
+        self._migrate()
+
+    def _init_schema(self) -> bool:
+        """Create tables and indexes; returns whether FTS5 is available"""
+        with self._lock, self.conn:
+            self.conn.executescript(SCHEMA)
+            try:
+                self.conn.executescript(FTS_SCHEMA)
+                # Make "ORDER BY rank" use the weighted BM25 so FTS5 can sort internally
+                self.conn.execute(
+                    "INSERT INTO jobs_fts (jobs_fts, rank) VALUES ('rank', ?)",
+                    ("bm25({}, {}, {}, {})".format(*BM25_WEIGHTS),)
+                )
+                return True
+            except sqlite3.OperationalError:
+                # SQLite built without FTS5: fall back to LIKE queries
+                return False
+
+    def _migrate(self):
+        """
+        Apply pending MIGRATIONS, tracked in PRAGMA user_version
+
+        Each migration runs in its own BEGIN IMMEDIATE transaction that
+        re-reads user_version first, so when several workers start at once
+        only one of them applies it.
+        """
+        with self._lock:
+            for number, script in enumerate(MIGRATIONS, start=1):
+                if self.conn.execute("PRAGMA user_version").fetchone()[0] >= number:
+                    continue
+
+                self.conn.execute("BEGIN IMMEDIATE")
+                try:
+                    if self.conn.execute("PRAGMA user_version").fetchone()[0] < number:
+                        # executescript would commit first, so run statements one by one
+                        for statement in script.split(";"):
+                            if statement.strip():
+                                self.conn.execute(statement)
+                        if number in MIGRATION_STEPS:
+                            getattr(self, MIGRATION_STEPS[number])()
+                        self.conn.execute(f"PRAGMA user_version = {number}")
+                    self.conn.execute("COMMIT")
+                except BaseException:
+                    self.conn.execute("ROLLBACK")
+                    raise
+
+    def _backfill_salaries_locked(self):
+        rows = self.conn.execute("SELECT id, salary FROM jobs WHERE salary IS NOT NULL").fetchall()
+        self.conn.executemany(
+            "UPDATE jobs SET salary_min = ?, salary_max = ? WHERE id = ?",
+            [(*parse_salary_range(row["salary"]), row["id"]) for row in rows]
+        )
+
+    def _rekey_tracked_job_ids_locked(self):
+        """Give rows keyed on URL tracking parameters their real ID, dropping duplicates"""
+        rows = self.conn.execute(
+            "SELECT id, job_board, job_id, url FROM jobs "
+            "WHERE job_board IN ('linkedin', 'indeed', 'reed') AND (instr(job_id, '?') OR instr(job_id, '&')) "
+            "ORDER BY last_seen DESC"
+        ).fetchall()
+        if not rows:
+            return
+
+        from job_automation import job_id_from_url
+
+        for row in rows:
+            job_id = job_id_from_url(row["url"], "jk" if row["job_board"] == "indeed" else None)
+            if not job_id:
+                continue
+            moved = self.conn.execute(
+                "UPDATE OR IGNORE jobs SET job_id = ? WHERE id = ?", (job_id, row["id"])
+            ).rowcount
+            if not moved:
+                # A more recently seen copy already has the real ID
+                self.conn.execute("DELETE FROM jobs WHERE id = ?", (row["id"],))
+
+    @staticmethod
+    def _job_to_row(job, seen: str) -> Dict:
+        salary_min, salary_max = parse_salary_range(job.salary)
+        return {
+            "job_board": job.job_board.value,
+            "job_id": str(job.job_id),
+            "title": job.title,
+            "company": job.company,
+            "location": job.location,
+            "salary": job.salary,
+            "salary_min": salary_min,
+            "salary_max": salary_max,
+            "description": job.description or "",
+            "requirements": json.dumps(job.requirements or []),
+            "url": job.url,
+            "posted_date": job.posted_date.isoformat() if job.posted_date else None,
+            "application_deadline": job.application_deadline.isoformat() if job.application_deadline else None,
+            "job_type": job.job_type,
+            "experience_level": job.experience_level,
+            "remote_option": int(bool(job.remote_option)),
+            "seen": seen,
+        }
+
+    @staticmethod
+    def _row_to_job(row: sqlite3.Row):
+        from job_automation import JobListing, JobBoard
+
+        return JobListing(
+            job_id=row["job_id"],
+            title=row["title"],
+            company=row["company"],
+            location=row["location"],
+            salary=row["salary"],
+            description=row["description"],
+            requirements=json.loads(row["requirements"] or "[]"),
+            url=row["url"],
+            job_board=JobBoard(row["job_board"]),
+            posted_date=datetime.fromisoformat(row["posted_date"]) if row["posted_date"] else None,
+            application_deadline=datetime.fromisoformat(row["application_deadline"]) if row["application_deadline"] else None,
+            job_type=row["job_type"],
+            experience_level=row["experience_level"],
+            remote_option=bool(row["remote_option"]),
+            match_score=0.0
+        )
+
+    def upsert_jobs(self, jobs: List) -> int:
+        """
+        Insert or refresh listings in a single transaction
+
+        Returns:
+            Number of listings written
+        """
+        if not jobs:
+            return 0
+
+        seen = datetime.now().isoformat()
+        rows = [self._job_to_row(job, seen) for job in jobs]
+
+        with self._lock, self.conn:
+            self.conn.executemany(UPSERT_SQL, rows)
+            # Our own commits don't change data_version
+            self._job_types = None
+
+        return len(rows)
+
+    def get_job(self, job_board: str, job_id: str):
+        """Fetch a single stored listing"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT * FROM jobs WHERE job_board = ? AND job_id = ?", (job_board, job_id)
+            ).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def find_for_settings(self, settings, boards: List[str], max_age: timedelta, limit: int) -> List:
+        """
+        Stored listings matching a saved search that were seen recently
+
+        Args:
+            settings: AutomationSettings with target roles and locations
+            boards: Job board values to include
+            max_age: Only listings seen within this window count as fresh
+            limit: Maximum listings to return
+
+        Returns:
+            Matching listings, most recently seen first
+        """
+        clauses = ["jobs.last_seen >= ?"]
+        params: List = [(datetime.now() - max_age).isoformat()]
+
+        if boards:
+            clauses.append(f"jobs.job_board IN ({','.join('?' * len(boards))})")
+            params.extend(boards)
+
+        role_phrases = [phrase for phrase in (fts_phrase(role) for role in settings.target_roles) if phrase]
+        if role_phrases and self.has_fts:
+            clauses.append("jobs.id IN (SELECT rowid FROM jobs_fts WHERE jobs_fts MATCH ?)")
+            params.append("title : (" + " OR ".join(role_phrases) + ")")
+        elif settings.target_roles:
+            clauses.append("(" + " OR ".join("jobs.title LIKE ?" for _ in settings.target_roles) + ")")
+            params.extend(f"%{role}%" for role in settings.target_roles)
+
+        if settings.locations:
+            clauses.append("(" + " OR ".join("jobs.location LIKE ?" for _ in settings.locations) + ")")
+            params.extend(f"%{location}%" for location in settings.locations)
+
+        if settings.remote_only:
+            clauses.append("jobs.remote_option = 1")
+
+        sql = f"SELECT * FROM jobs WHERE {' AND '.join(clauses)} ORDER BY jobs.last_seen DESC LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+
+        return [self._row_to_job(row) for row in rows]
+
+    def search(self, query: JobQuery) -> JobSearchPage:
+        """
+        Ranked, filtered and paginated search over stored listings
+
+        Text queries run against the FTS5 index and are ordered by BM25, with
+        title matches weighted highest (BM25_WEIGHTS). Queries matching up to
+        FULL_RANK_LIMIT listings rank every match. Scoring every match of a
+        broader query is what makes it slow, so only its RANK_WINDOW most
+        recently stored matches are ranked and pages past that window continue
+        in recency order; an older listing can then not rank first however
+        well it matches. Without text, listings are ordered by posted date.
+
+        A salary filter keeps listings whose advertised range overlaps the
+        requested one; listings without a salary are excluded.
+
+        Args:
+            query: Search text, filters and page
+
+        Returns:
+            The requested page plus the total number of matches
+        """
+        started = time.perf_counter()
+
+        clauses: List[str] = []
+        params: List = []
+
+        if query.boards:
+            clauses.append(f"jobs.job_board IN ({','.join('?' * len(query.boards))})")
+            params.extend(query.boards)
+
+        if query.job_types:
+            clauses.append(f"jobs.job_type IN ({','.join('?' * len(query.job_types))})")
+            params.extend(query.job_types)
+
+        if query.remote_only:
+            clauses.append("jobs.remote_option = 1")
+
+        if query.salary_min is not None:
+            clauses.append("jobs.salary_max >= ?")
+            params.append(query.salary_min)
+
+        if query.salary_max is not None:
+            clauses.append("jobs.salary_min <= ?")
+            params.append(query.salary_max)
+
+        if query.posted_since is not None:
+            clauses.append("jobs.posted_date >= ?")
+            params.append(query.posted_since.isoformat())
+
+        fts_query = build_fts_query(query.text)
+        ranked = bool(fts_query and self.has_fts)
+        if ranked:
+            # CROSS JOIN keeps the FTS index as the outer loop; otherwise the
+            # planner may scan a filter index and run MATCH row by row
+            source = "jobs_fts CROSS JOIN jobs ON jobs.id = jobs_fts.rowid"
+            order = None
+            # Without filters the FTS index alone can count, skipping the join
+            count_sql = None if clauses else "SELECT COUNT(*) FROM jobs_fts WHERE jobs_fts MATCH ?"
+            clauses.insert(0, "jobs_fts MATCH ?")
+            params.insert(0, fts_query)
+        else:
+            source = "jobs"
+            count_sql = None
+            order = "jobs.posted_date DESC"
+            if query.text.strip():
+                # No FTS5: every word must appear somewhere in the text fields
+                for word in _FTS_TOKEN.findall(query.text):
+                    clauses.append("(jobs.title || ' ' || jobs.company || ' ' || jobs.location || ' ' || jobs.description) LIKE ?")
+                    params.append(f"%{word}%")
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        page = max(1, query.page)
+        offset = (page - 1) * query.page_size
+
+        with self._lock:
+            total = self.conn.execute(count_sql or f"SELECT COUNT(*) FROM {source} {where}", params).fetchone()[0]
+            if ranked:
+                rows = self._ranked_page_locked(source, where, params, offset, query.page_size, total)
+            else:
+                rows = self.conn.execute(
+                    f"SELECT jobs.* FROM {source} {where} ORDER BY {order} LIMIT ? OFFSET ?",
+                    params + [query.page_size, offset]
+                ).fetchall()
+
+        return JobSearchPage(
+            jobs=[self._row_to_job(row) for row in rows],
+            total=total,
+            page=page,
+            page_size=query.page_size,
+            took_ms=(time.perf_counter() - started) * 1000
+        )
+
+    def _ranked_page_locked(self, source: str, where: str, params: List, offset: int,
+                            page_size: int, total: int) -> List[sqlite3.Row]:
+        """One page of FTS matches: BM25 order within the ranked window, then newest first"""
+        bm25 = "bm25(jobs_fts, {}, {}, {}, {})".format(*BM25_WEIGHTS)
+        window = total if total <= FULL_RANK_LIMIT else RANK_WINDOW
+        rows: List[sqlite3.Row] = []
+
+        if offset < window:
+            # FTS5 walks its index in rowid order, so the window is read without scoring the rest
+            rows = self.conn.execute(
+                f"SELECT * FROM (SELECT jobs.*, {bm25} AS score FROM {source} {where} "
+                f"ORDER BY jobs_fts.rowid DESC LIMIT ?) ORDER BY score LIMIT ? OFFSET ?",
+                params + [window, page_size, offset]
+            ).fetchall()
+
+        if len(rows) < page_size and total > window:
+            rows += self.conn.execute(
+                f"SELECT jobs.* FROM {source} {where} ORDER BY jobs_fts.rowid DESC LIMIT ? OFFSET ?",
+                params + [page_size - len(rows), max(offset, window)]
+            ).fetchall()
+
+        return rows
+
+    def load_details(self, keys: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Optional[Dict]]:
+        """
+        Cached detail pages for (job_board, job_id) keys
+
+        Returns:
+            Parsed details per key found, or None for keys whose last fetch
+            failed and shouldn't be retried yet; other keys are absent
+        """
+        if not keys:
+            return {}
+
+        values = ", ".join("(?, ?)" for _ in keys)
+        params = [part for key in keys for part in key]
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT job_board, job_id, details, retry_after FROM job_details "
+                f"WHERE (job_board, job_id) IN (VALUES {values})",
+                params
+            ).fetchall()
+
+        now = time.time()
+        found: Dict[Tuple[str, str], Optional[Dict]] = {}
+        for row in rows:
+            key = (row["job_board"], row["job_id"])
+            if row["details"] is not None:
+                found[key] = json.loads(row["details"])
+            elif row["retry_after"] and row["retry_after"] > now:
+                found[key] = None
+        return found
+
+    def save_details(self, details: Dict[Tuple[str, str], Dict], failed: List[Tuple[str, str]],
+                     retry_after: float, max_entries: int = 5000):
+        """
+        Record fetched details and failed fetches in one transaction
+
+        Args:
+            details: Parsed details per (job_board, job_id)
+            failed: Keys whose fetch failed
+            retry_after: Seconds before a failed key is fetched again
+            max_entries: Oldest entries beyond this are dropped
+        """
+        if not details and not failed:
+            return
+
+        now = time.time()
+        rows = [(board, job_id, json.dumps(value), now, None) for (board, job_id), value in details.items()]
+        rows += [(board, job_id, None, now, now + retry_after) for board, job_id in failed]
+
+        with self._lock, self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO job_details (job_board, job_id, details, fetched_at, retry_after) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            self.conn.execute(
+                "DELETE FROM job_details WHERE fetched_at < "
+                "(SELECT fetched_at FROM job_details ORDER BY fetched_at DESC LIMIT 1 OFFSET ?)",
+                (max_entries - 1,)
+            )
+
+    def job_types(self) -> List[str]:
+        """Distinct job types present in the store (cached until the database changes)"""
+        with self._lock:
+            version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+            if self._job_types is None or self._job_types[0] != version:
+                rows = self.conn.execute(
+                    "SELECT DISTINCT job_type FROM jobs WHERE job_type IS NOT NULL ORDER BY job_type"
+                ).fetchall()
+                self._job_types = (version, [row[0] for row in rows])
+            return list(self._job_types[1])
+
+    def count(self) -> int:
+        """Number of stored listings"""
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+_shared_store: Optional[JobStore] = None
+_shared_lock = threading.Lock()
+
+def get_job_store() -> JobStore:
+    """Process-wide job store shared by all engines"""
+    global _shared_store
+    with _shared_lock:
+        if _shared_store is None:
+            _shared_store = JobStore()
+        return _shared_store
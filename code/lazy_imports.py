@@ -0,0 +1,76 @@
+# lazy_imports.py
+"""
+Deferred imports for heavy optional dependencies
+"""
+
+import importlib
+import importlib.util
+import sys
+import threading
+from types import ModuleType
+from typing import Optional
+
+# ================================
+# 💤 LAZY MODULES
+# ================================
+
+_lock = threading.Lock()
+
+
+class MissingModule(ModuleType):
+    """Placeholder for a dependency that isn't installed; fails when first used"""
+
+    def __init__(self, name: str, install_hint: str):
+        super().__init__(name)
+        self._install_hint = install_hint
+
+    def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
+        raise ImportError(f"{self.__name__} is required for this feature. Please install: {self._install_hint}")
+
+    def __bool__(self):
+        return False
+
+
+def lazy_import(name: str, install_hint: Optional[str] = None) -> ModuleType:
+    """
+    Return a module that is only executed when one of its attributes is first used
+
+    Use the result as a namespace (`pd = lazy_import("pandas")`, then
+    `pd.DataFrame(...)`); `from x import y` would load it immediately. Type
+    annotations referring to lazy modules must be strings for the same
+    reason. If the package isn't installed, a MissingModule is returned that
+    raises ImportError (with install_hint) at first use instead of at import.
+
+    Args:
+        name: Top-level module or package name
+        install_hint: Install command shown when the package is missing
+    """
+    if "." in name:
+        # find_spec would import the parent packages right away
+        raise ValueError(f"lazy_import takes a top-level package, not {name}; import submodules where they are used")
+
+    with _lock:
+        if name in sys.modules:
+            return sys.modules[name]
+
+        spec = importlib.util.find_spec(name)
+        if spec is None:
+            return MissingModule(name, install_hint or f"pip install {name}")
+
+        loader = importlib.util.LazyLoader(spec.loader)
+        spec.loader = loader
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        loader.exec_module(module)
+        return module
+
+
+def is_loaded(name: str) -> bool:
+    """Whether a module has actually been executed (not just registered lazily)"""
+    module = sys.modules.get(name)
+    if module is None:
+        return False
+    # LazyLoader swaps the module's class back to ModuleType once it executes
+    return not isinstance(module, importlib.util._LazyModule)
@@ -4,6 +4,8 @@ Integration module to connect payment processing with your existing CV optimizer
 
 import streamlit as st
 from payment_processor import PaymentProcessor, PaymentUI, PlanType
+from usage_meter import UNLIMITED, get_usage_meter
+from user_identity import current_user_id, verified_email
 from typing import Dict, Optional
 
 # ================================
@@ -11,10 +13,21 @@ from typing import Dict, Optional
 # ================================
 
 class UserSubscriptionManager:
-    """Manage user subscription state and access control"""
+    """
+    Manage user subscription state and access control
+    
+    CV usage is metered in shared storage (CV_STORAGE_URL) rather than
+    session_state, so every session and app worker, on any host, sees the
+    same count for a user, and quota checks hold under concurrent requests.
+    Usage is counted against a verified sign-in or an unguessable per-browser
+    ID, never against an email typed into a form.
+    """
+    
+    CV_METRIC = "cv_optimization"
     
     def __init__(self, payment_processor: PaymentProcessor):
         self.processor = payment_processor
+        self.meter = get_usage_meter()
         self.init_user_session()
     
     def init_user_session(self):
@@ -31,6 +44,19 @@ class UserSubscriptionManager:
         if 'subscription_id' not in st.session_state:
             st.session_state.subscription_id = None
     
+    def usage_owner(self) -> str:
+        """Who CV usage is counted against: the signed-in email, else this browser's anonymous ID"""
+        return current_user_id()
+    
+    def cv_limit(self) -> int:
+        """CV optimizations allowed by the user's plan (UNLIMITED is -1)"""
+        return self.processor.get_plan_details(self.get_user_plan()).cv_limit
+    
+    def get_cv_usage(self) -> int:
+        """CV optimizations used so far (mirrored to session_state for display)"""
+        st.session_state.cv_usage_count = self.meter.get_usage(self.usage_owner(), self.CV_METRIC)
+        return st.session_state.cv_usage_count
+    
     def get_user_plan(self) -> PlanType:
         """Get user's current plan"""
         try:
@@ -43,25 +69,50 @@ class UserSubscriptionManager:
         user_plan = st.session_state.user_subscription
         return self.processor.validate_user_access(user_plan, feature)
     
+    def _quota_message(self, allowed: bool, used: int, limit: int) -> str:
+        if limit == UNLIMITED:
+            return "Unlimited optimizations available"
+        if not allowed:
+            return f"You've reached your limit of {limit} CV optimization(s). Upgrade to Pro for unlimited access."
+        return f"{limit - used} optimization(s) remaining"
+    
     def can_optimize_cv(self) -> tuple[bool, str]:
-        """Check if user can optimize another CV"""
-        user_plan = self.get_user_plan()
-        plan_details = self.processor.get_plan_details(user_plan)
-        
-        # Unlimited for Pro and Enterprise
-        if plan_details.cv_limit == -1:
-            return True, "Unlimited optimizations available"
-        
-        # Check usage for Free plan
-        if st.session_state.cv_usage_count >= plan_details.cv_limit:
-            return False, f"You've reached your limit of {plan_details.cv_limit} CV optimization(s). Upgrade to Pro for unlimited access."
+        """Check if user can optimize another CV (cached read; doesn't consume quota)"""
+        limit = self.cv_limit()
+        allowed, used = self.meter.check(self.usage_owner(), self.CV_METRIC, limit)
+        st.session_state.cv_usage_count = used
+        return allowed, self._quota_message(allowed, used, limit)
+    
+    def reserve_cv_optimization(self) -> tuple[bool, str]:
+        """
+        Atomically check the quota and count one CV optimization
         
-        remaining = plan_details.cv_limit - st.session_state.cv_usage_count
-        return True, f"{remaining} optimization(s) remaining"
-    
-    def increment_cv_usage(self):
-        """Increment CV usage counter"""
-        st.session_state.cv_usage_count += 1
+        Call before starting the work, and refund_cv_optimization() if it
+        fails, so two sessions can't both spend the last optimization.
+        """
+        limit = self.cv_limit()
+        allowed, used = self.meter.consume(self.usage_owner(), self.CV_METRIC, limit,
+                                           reason=f"optimize:{self.get_user_plan().value}")
+        st.session_state.cv_usage_count = used
+        return allowed, self._quota_message(allowed, used, limit)
+    
+    def refund_cv_optimization(self):
+        """Give back a reserved optimization whose work failed"""
+        st.session_state.cv_usage_count = self.meter.refund(self.usage_owner(), self.CV_METRIC)
+    
+    def transfer_cv_usage(self, from_owner: str) -> int:
+        """Count usage recorded under another ID (e.g. before sign-in) against the verified user"""
+        email = verified_email()
+        if not email:
+            return 0
+        moved = self.meter.transfer(from_owner, email, self.CV_METRIC)
+        self.get_cv_usage()
+        return moved
+    
+    def increment_cv_usage(self) -> bool:
+        """Increment CV usage counter; False if the plan's limit was already reached"""
+        allowed, _ = self.reserve_cv_optimization()
+        return allowed
     
     def upgrade_user_plan(self, new_plan: PlanType, subscription_id: str = None):
         """Upgrade user to a new plan"""
@@ -71,8 +122,20 @@ class UserSubscriptionManager:
         
         # Reset usage counter for new plans
         if new_plan != PlanType.FREE:
+            self.meter.reset(self.usage_owner(), self.CV_METRIC, reason=f"upgrade:{new_plan.value}")
             st.session_state.cv_usage_count = 0
 
+def get_subscription_manager() -> UserSubscriptionManager:
+    """This session's subscription manager, created with its payment processor on first use"""
+    if 'payment_processor' not in st.session_state:
+        st.session_state.payment_processor = PaymentProcessor()
+    
+    if 'subscription_manager' not in st.session_state:
+        st.session_state.subscription_manager = UserSubscriptionManager(
+            st.session_state.payment_processor
+        )
+    return st.session_state.subscription_manager
+
 # ================================
 # 🎨 ENHANCED UI COMPONENTS
 # ================================
@@ -129,7 +192,7 @@ def render_upgrade_prompt():
     user_plan = PlanType(st.session_state.user_subscription)
     
     if user_plan == PlanType.FREE:
-        can_optimize, message = st.session_state.subscription_manager.can_optimize_cv()
+        can_optimize, message = get_subscription_manager().can_optimize_cv()
         
         if not can_optimize:
             st.markdown(f"""
@@ -219,8 +282,8 @@ def render_feature_access_check(feature: str, feature_name: str = None):
 
 def enhanced_optimize_cv():
     """Enhanced CV optimization with subscription checks"""
-    # Check if user can optimize
-    can_optimize, message = st.session_state.subscription_manager.can_optimize_cv()
+    # Reserve the optimization up front; concurrent sessions can't both take the last one
+    can_optimize, message = st.session_state.subscription_manager.reserve_cv_optimization()
     
     if not can_optimize:
         st.error(f"❌ {message}")
@@ -237,8 +300,7 @@ def enhanced_optimize_cv():
         # Your existing optimize_cv() function code here
         # ... (same as before)
         
-        # After successful optimization, increment usage
-        st.session_state.subscription_manager.increment_cv_usage()
+        # Usage was already counted by reserve_cv_optimization()
         
         # Show success message with upgrade prompt for free users
         if user_plan == PlanType.FREE:
@@ -251,6 +313,7 @@ def enhanced_optimize_cv():
                 st.success(f"🎉 CV optimized successfully! {remaining}")
     
     except Exception as e:
+        st.session_state.subscription_manager.refund_cv_optimization()
         st.error(f"❌ Optimization failed: {str(e)}")
 
 def enhanced_template_selection():
@@ -379,17 +442,11 @@ def integrate_payments_with_main_app():
     """
     
     # Initialize payment system
-    if 'payment_processor' not in st.session_state:
-        st.session_state.payment_processor = PaymentProcessor()
+    get_subscription_manager()
     
     if 'payment_ui' not in st.session_state:
         st.session_state.payment_ui = PaymentUI(st.session_state.payment_processor)
     
-    if 'subscription_manager' not in st.session_state:
-        st.session_state.subscription_manager = UserSubscriptionManager(
-            st.session_state.payment_processor
-        )
-    
     # Handle payment callbacks first
     if handle_payment_callback():
         return  # Stop here if handling payment callback
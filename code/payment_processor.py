@@ -1,5 +1,4 @@
 import os
-import stripe
 import streamlit as st
 import hashlib
 import hmac
@@ -10,6 +9,10 @@ from typing import Dict, Tuple, Optional, Any
 from dataclasses import dataclass
 from enum import Enum
 
+from lazy_imports import lazy_import
+
+stripe = lazy_import("stripe", "pip install stripe")
+
 # ================================
 # 🏗️ PAYMENT CONFIGURATION
 # ================================
@@ -0,0 +1,121 @@
+# pdf_preview.py
+"""
+PDF preview served by URL (or as cached page thumbnails) instead of inline base64
+"""
+
+import hashlib
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List
+
+import streamlit as st
+
+from lazy_imports import lazy_import
+from static_assets import STATIC_URL_PREFIX
+
+fitz = lazy_import("fitz", "pip install pymupdf")
+
+# ================================
+# 📖 PDF PREVIEW
+# ================================
+
+PREVIEW_DIR = "previews"
+PREVIEW_TTL_SECONDS = 60 * 60
+THUMBNAIL_ZOOM = 1.5
+MAX_THUMBNAIL_PAGES = 5
+
+
+@dataclass(frozen=True)
+class PdfArtifact:
+    """A rendered PDF read into memory once and shared by preview and download"""
+    name: str
+    data: bytes
+    content_hash: str
+
+    @property
+    def filename(self) -> str:
+        return f"{Path(self.name).stem}.{self.content_hash}.pdf"
+
+    @property
+    def url(self) -> str:
+        return f"{STATIC_URL_PREFIX}/{PREVIEW_DIR}/{self.filename}"
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self.data)
+
+
+def load_pdf(pdf_path: str) -> PdfArtifact:
+    """Read a PDF once; the full-length hash makes its preview URL unguessable"""
+    data = Path(pdf_path).read_bytes()
+    return PdfArtifact(name=Path(pdf_path).name, data=data,
+                       content_hash=hashlib.sha256(data).hexdigest()[:32])
+
+
+def publish_pdf(artifact: PdfArtifact, static_dir: str = "static") -> Path:
+    """
+    Write a PDF to the static folder so the browser fetches it by URL
+
+    Streamlit serves static files through Tornado's StaticFileHandler, which
+    supports Range requests, so the viewer can load pages progressively.
+    Previews older than PREVIEW_TTL_SECONDS are removed, since they contain
+    users' CVs.
+
+    Args:
+        artifact: PDF to publish
+        static_dir: Streamlit static folder next to the main script
+    """
+    preview_path = Path(__file__).parent / static_dir / PREVIEW_DIR
+    preview_path.mkdir(parents=True, exist_ok=True)
+
+    cutoff = time.time() - PREVIEW_TTL_SECONDS
+    for stale in preview_path.glob("*.pdf"):
+        try:
+            if stale.stat().st_mtime < cutoff:
+                stale.unlink()
+        except OSError:
+            pass
+
+    target = preview_path / artifact.filename
+    if not target.exists():
+        target.write_bytes(artifact.data)
+    return target
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def render_thumbnails(content_hash: str, _data: bytes, max_pages: int = MAX_THUMBNAIL_PAGES) -> List[bytes]:
+    """PNG images of the first pages, rendered once per PDF content hash"""
+    document = fitz.open(stream=_data, filetype="pdf")
+    try:
+        matrix = fitz.Matrix(THUMBNAIL_ZOOM, THUMBNAIL_ZOOM)
+        return [page.get_pixmap(matrix=matrix).tobytes("png")
+                for page in list(document)[:max_pages]]
+    finally:
+        document.close()
+
+
+def render_pdf_preview(artifact: PdfArtifact, height: int = 800):
+    """
+    Show a PDF without sending it over the websocket as base64
+
+    With server.enableStaticServing the PDF is published and embedded by URL.
+    Otherwise the first pages are shown as PNG thumbnails (needs pymupdf).
+    """
+    st.markdown("### 📖 PDF Preview")
+
+    if st.get_option("server.enableStaticServing"):
+        publish_pdf(artifact)
+        st.markdown(
+            f'<iframe src="{artifact.url}" width="100%" height="{height}px" type="application/pdf"></iframe>',
+            unsafe_allow_html=True
+        )
+        return
+
+    if not fitz:
+        st.info("💡 Enable static serving or install `pymupdf` to preview the PDF here; "
+                "you can still download it below.")
+        return
+
+    for page_number, image in enumerate(render_thumbnails(artifact.content_hash, artifact.data), start=1):
+        st.image(image, caption=f"Page {page_number}", use_container_width=True)
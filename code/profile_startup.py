@@ -0,0 +1,106 @@
+# profile_startup.py
+"""
+Profile cold-start import cost of the app modules with -X importtime
+
+Usage:
+    python profile_startup.py [--modules app job_automation_ui] [--runs 5] [--top 15]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+CODE_DIR = Path(__file__).parent
+
+# Dependencies that should stay unloaded until their feature is used
+HEAVY_MODULES = ["selenium.webdriver", "pandas", "plotly.express", "stripe",
+                 "pdfplumber", "PyPDF2", "docx", "anthropic"]
+
+LOADED_CHECK = (
+    "import sys, lazy_imports; "
+    "print(','.join(m for m in {modules!r} if lazy_imports.is_loaded(m)))"
+)
+
+def run_python(args: List[str]) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *args], cwd=CODE_DIR, capture_output=True, text=True)
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int, int]]:
+    """Parse -X importtime output into (module, depth, self_us, cumulative_us)"""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((name.strip(), depth, int(self_us), int(cumulative_us)))
+    return entries
+
+def importtime_report(module: str, top: int) -> Dict:
+    """Import a module once with -X importtime and summarise where the time went"""
+    result = run_python(["-X", "importtime", "-c", f"import {module}"])
+    entries = parse_importtime(result.stderr)
+
+    by_package: Dict[str, int] = defaultdict(int)
+    for name, _, self_us, _ in entries:
+        by_package[name.split(".")[0]] += self_us
+
+    total_us = sum(self_us for _, _, self_us, _ in entries)
+    return {
+        "ok": result.returncode == 0,
+        "error": result.stderr.strip().splitlines()[-1] if result.returncode else "",
+        "total_ms": total_us / 1000,
+        "packages": sorted(by_package.items(), key=lambda item: item[1], reverse=True)[:top],
+    }
+
+def startup_benchmark(module: str, runs: int) -> Tuple[float, float]:
+    """Median and best wall-clock seconds for a fresh interpreter to import a module"""
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        run_python(["-c", f"import {module}"])
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings), min(timings)
+
+def loaded_heavy_modules(module: str) -> List[str]:
+    """Heavy dependencies actually executed by importing a module"""
+    check = LOADED_CHECK.format(modules=HEAVY_MODULES)
+    result = run_python(["-c", f"import {module}; {check}"])
+    return [name for name in result.stdout.strip().split(",") if name]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--modules", nargs="+", default=["app", "job_automation_ui"])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    baseline, _ = startup_benchmark("sys", args.runs)
+    print(f"Bare interpreter start: {baseline * 1000:.0f} ms (median of {args.runs})\n")
+
+    for module in args.modules:
+        report = importtime_report(module, args.top)
+        print(f"=== import {module} ===")
+        if not report["ok"]:
+            print(f"Import failed: {report['error']}\n")
+            continue
+
+        median, best = startup_benchmark(module, args.runs)
+        print(f"Cold start:     {median * 1000:.0f} ms median, {best * 1000:.0f} ms best "
+              f"({(median - baseline) * 1000:.0f} ms over bare interpreter)")
+        print(f"Import time:    {report['total_ms']:.0f} ms (sum of -X importtime self times)")
+
+        loaded = loaded_heavy_modules(module)
+        print(f"Heavy deps loaded at import: {', '.join(loaded) if loaded else 'none'}")
+
+        print(f"\n{'package':<30} {'self ms':>10}")
+        for package, self_us in report["packages"]:
+            print(f"{package:<30} {self_us / 1000:>10.1f}")
+        print()
+
+if __name__ == "__main__":
+    main()
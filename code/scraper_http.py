@@ -0,0 +1,384 @@
+# scraper_http.py
+"""
+Async HTTP scraping backend for job boards that serve server-rendered HTML
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+# ================================
+# 🌐 ASYNC HTTP BACKEND
+# ================================
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-GB,en;q=0.9',
+}
+
+@dataclass
+class FetchResult:
+    """Response of a single page fetch"""
+    url: str
+    status_code: int
+    content: bytes
+    elapsed: float
+    error: Optional[str] = None
+    from_cache: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and 200 <= self.status_code < 300
+
+# ================================
+# 💾 RESPONSE CACHE
+# ================================
+
+class ResponseCache:
+    """
+    On-disk cache of fetched pages keyed by URL.
+
+    Bodies are stored zlib-compressed next to a small JSON metadata file with
+    the validators (ETag / Last-Modified), fetch time and a digest of the
+    body. Both files are written to a temp file and renamed into place, the
+    metadata last, and a body whose digest doesn't match its metadata is
+    treated as a miss, so a concurrent writer can't pair one response's ETag
+    with another's body. Fresh entries are served without a request; stale
+    ones are revalidated with a conditional request so an unchanged page
+    costs only a 304.
+
+    Entries not fetched or revalidated for max_age seconds are deleted, and
+    the least recently fetched go first once the cache exceeds max_bytes.
+    Eviction runs at most once per EVICT_INTERVAL seconds, after a put.
+    """
+
+    DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+    DEFAULT_MAX_AGE = 7 * 24 * 60 * 60
+    EVICT_INTERVAL = 300
+
+    def __init__(self, cache_dir: str = "../output/http_cache",
+                 max_bytes: int = DEFAULT_MAX_BYTES,
+                 max_age: float = DEFAULT_MAX_AGE):
+        """
+        Args:
+            cache_dir: Cache directory (relative to code/ directory)
+            max_bytes: Disk space the cache may use
+            max_age: Seconds an entry is kept after it was last fetched or revalidated
+        """
+        script_dir = Path(__file__).parent
+        self.cache_dir = script_dir / cache_dir
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+
+        self._evict_lock = threading.Lock()
+        self._last_evict = 0.0
+
+    def _paths(self, url: str):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.z"
+
+    def _write_atomic(self, path: Path, data: bytes):
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def get(self, url: str) -> Optional[Dict]:
+        """Return cached metadata plus the decompressed body, or None"""
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            body = body_path.read_bytes()
+            if hashlib.sha256(body).hexdigest() != entry.get("body_sha256"):
+                return None
+            entry["content"] = zlib.decompress(body)
+            return entry
+        except (OSError, ValueError, zlib.error):
+            return None
+
+    def put(self, url: str, content: bytes, etag: Optional[str], last_modified: Optional[str]):
+        """Store a page body with its validators"""
+        meta_path, body_path = self._paths(url)
+        body = zlib.compress(content, 6)
+        try:
+            self._write_atomic(body_path, body)
+            self._write_atomic(meta_path, json.dumps({
+                "url": url,
+                "etag": etag,
+                "last_modified": last_modified,
+                "fetched_at": time.time(),
+                "body_sha256": hashlib.sha256(body).hexdigest(),
+            }).encode('utf-8'))
+        except OSError:
+            return
+        self._maybe_evict()
+
+    def touch(self, url: str):
+        """Mark a revalidated (304) entry as freshly fetched"""
+        meta_path, _ = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            entry["fetched_at"] = time.time()
+            self._write_atomic(meta_path, json.dumps(entry).encode('utf-8'))
+        except (OSError, ValueError):
+            pass
+
+    def _maybe_evict(self):
+        if time.monotonic() - self._last_evict >= self.EVICT_INTERVAL or not self._last_evict:
+            self.evict()
+
+    def evict(self, now: Optional[float] = None) -> int:
+        """Apply the age and size limits; returns how many entries were deleted"""
+        now = time.time() if now is None else now
+        if not self._evict_lock.acquire(blocking=False):
+            return 0  # Another thread is already evicting
+        try:
+            self._last_evict = time.monotonic()
+            # key -> [last fetched (metadata mtime), bytes of both files]
+            entries: Dict[str, List[float]] = {}
+            for path in self.cache_dir.iterdir():
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                if path.name.startswith(".tmp-"):
+                    # Left behind by a writer that died mid-write
+                    if now - stat.st_mtime > self.EVICT_INTERVAL:
+                        self._unlink(path)
+                    continue
+                entry = entries.setdefault(path.stem, [0.0, 0])
+                entry[1] += stat.st_size
+                # The metadata's mtime is the last fetch; a body without one ages by its own
+                if path.suffix == ".json" or not entry[0]:
+                    entry[0] = stat.st_mtime
+
+            total = sum(size for _, size in entries.values())
+            evicted = 0
+            for key, (fetched_at, size) in sorted(entries.items(), key=lambda item: item[1][0]):
+                if now - fetched_at <= self.max_age and total <= self.max_bytes:
+                    break
+                self._unlink(self.cache_dir / f"{key}.json")
+                self._unlink(self.cache_dir / f"{key}.z")
+                total -= size
+                evicted += 1
+            return evicted
+        finally:
+            self._evict_lock.release()
+
+    @staticmethod
+    def _unlink(path: Path):
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+    def clear(self):
+        """Delete every cached page"""
+        for path in self.cache_dir.glob("*"):
+            self._unlink(path)
+
+
+class AsyncHTTPBackend:
+    """
+    Shared asyncio HTTP client for scraping.
+
+    One httpx.AsyncClient with HTTP/2 and a pooled connection set lives on a
+    dedicated event-loop thread, so synchronous scrapers (including ones
+    running on the engine's worker threads) can fetch many pages concurrently
+    while reusing connections between searches. Concurrency is capped per host
+    to stay polite to each job board.
+    """
+
+    # Seconds a cached page is served without revalidation
+    DEFAULT_CACHE_TTL = 600
+
+    def __init__(self,
+                 per_host_limit: int = 4,
+                 max_connections: int = 20,
+                 timeout: float = 15.0,
+                 http2: bool = True,
+                 cache: Optional[ResponseCache] = None,
+                 offline: Optional[bool] = None):
+        """
+        Args:
+            per_host_limit: Maximum concurrent requests per host
+            max_connections: Connection pool size
+            timeout: Per-request timeout in seconds
+            http2: Negotiate HTTP/2 when the h2 package is installed
+            cache: Response cache (defaults to the on-disk cache in output/)
+            offline: Serve only from cache, never hitting the network
+                (defaults to the SCRAPER_OFFLINE environment variable)
+        """
+        self.per_host_limit = per_host_limit
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.http2 = http2
+        self.cache = cache or ResponseCache()
+        self.offline = offline if offline is not None else os.getenv('SCRAPER_OFFLINE') == '1'
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._start_lock = threading.Lock()
+
+    def _ensure_loop(self):
+        """Start the background event loop and client on first use"""
+        with self._start_lock:
+            if self._loop is not None:
+                return
+
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self._loop.run_forever, name="scraper-http", daemon=True)
+            self._thread.start()
+
+            asyncio.run_coroutine_threadsafe(self._create_client(), self._loop).result()
+
+    async def _create_client(self):
+        try:
+            self._client = httpx.AsyncClient(
+                http2=self.http2,
+                headers=DEFAULT_HEADERS,
+                timeout=self.timeout,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+            )
+        except ImportError:
+            # http2=True needs the optional h2 package
+            self._client = httpx.AsyncClient(
+                headers=DEFAULT_HEADERS,
+                timeout=self.timeout,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=self.max_connections),
+            )
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        host = urlparse(url).netloc
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.per_host_limit)
+        return self._host_semaphores[host]
+
+    async def fetch(self, url: str, ttl: Optional[float] = None) -> FetchResult:
+        """
+        Fetch a single URL through the cache, respecting the per-host concurrency limit
+
+        Args:
+            url: Page to fetch
+            ttl: Freshness lifetime in seconds for cached copies of this page
+        """
+        ttl = self.DEFAULT_CACHE_TTL if ttl is None else ttl
+        # Disk IO runs on a worker thread so it doesn't stall other in-flight requests
+        cached = await asyncio.to_thread(self.cache.get, url)
+
+        if cached and (self.offline or time.time() - cached["fetched_at"] < ttl):
+            return FetchResult(url=url, status_code=200, content=cached["content"],
+                               elapsed=0.0, from_cache=True)
+
+        if self.offline:
+            return FetchResult(url=url, status_code=0, content=b"", elapsed=0.0,
+                               error="not cached (offline mode)")
+
+        headers = {}
+        if cached and cached.get("etag"):
+            headers['If-None-Match'] = cached["etag"]
+        if cached and cached.get("last_modified"):
+            headers['If-Modified-Since'] = cached["last_modified"]
+
+        async with self._host_semaphore(url):
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            try:
+                response = await self._client.get(url, headers=headers)
+            except httpx.HTTPError as e:
+                return FetchResult(url=url, status_code=0, content=b"",
+                                   elapsed=loop.time() - started, error=str(e))
+            elapsed = loop.time() - started
+
+        if response.status_code == 304 and cached:
+            await asyncio.to_thread(self.cache.touch, url)
+            return FetchResult(url=url, status_code=200, content=cached["content"],
+                               elapsed=elapsed, from_cache=True)
+
+        if response.status_code == 200:
+            await asyncio.to_thread(self.cache.put, url, response.content,
+                                    response.headers.get('ETag'),
+                                    response.headers.get('Last-Modified'))
+
+        return FetchResult(url=url, status_code=response.status_code,
+                           content=response.content, elapsed=elapsed)
+
+    async def fetch_many(self, urls: List[str], ttl: Optional[float] = None) -> List[FetchResult]:
+        """Fetch several URLs concurrently, preserving input order"""
+        return await asyncio.gather(*(self.fetch(url, ttl) for url in urls))
+
+    def fetch_all(self, urls: List[str], ttl: Optional[float] = None,
+                  timeout: Optional[float] = None) -> List[FetchResult]:
+        """
+        Synchronous entry point for scrapers
+
+        Args:
+            urls: Pages to fetch
+            ttl: Freshness lifetime in seconds for cached copies (board-specific)
+            timeout: Overall deadline in seconds for the whole batch
+
+        Returns:
+            One FetchResult per URL, in the same order
+        """
+        if not urls:
+            return []
+
+        self._ensure_loop()
+        future = asyncio.run_coroutine_threadsafe(self.fetch_many(urls, ttl), self._loop)
+        return future.result(timeout=timeout)
+
+    def close(self):
+        """Close the client and stop the background loop"""
+        if self._loop is None:
+            return
+
+        if self._client is not None:
+            asyncio.run_coroutine_threadsafe(self._client.aclose(), self._loop).result(timeout=5)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+
+        self._loop = None
+        self._thread = None
+        self._client = None
+        self._host_semaphores = {}
+
+
+_shared_backend: Optional[AsyncHTTPBackend] = None
+_shared_lock = threading.Lock()
+
+def get_http_backend() -> AsyncHTTPBackend:
+    """Process-wide HTTP backend shared by all HTTP scrapers"""
+    global _shared_backend
+    with _shared_lock:
+        if _shared_backend is None:
+            _shared_backend = AsyncHTTPBackend()
+        return _shared_backend
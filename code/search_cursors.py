@@ -0,0 +1,109 @@
+# search_cursors.py
+"""
+Persistent per-search cursors so repeat searches only crawl new postings
+"""
+
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+# ================================
+# 🧭 SEARCH CURSORS
+# ================================
+
+class SearchCursorStore:
+    """
+    Remember which postings each saved search has already seen.
+
+    A cursor is keyed by board and query (role, location, filters) and holds
+    the most recently seen job IDs, newest first, plus the time of the last
+    run. Result pages are sorted newest-first, so a crawl can stop as soon as
+    it reaches a posting the cursor already knows.
+    """
+
+    def __init__(self, cursor_path: str = "../output/search_cursors.json", max_ids: int = 1000):
+        """
+        Args:
+            cursor_path: JSON file holding cursors (relative to code/ directory)
+            max_ids: Maximum job IDs remembered per search
+        """
+        script_dir = Path(__file__).parent
+        self.cursor_path = script_dir / cursor_path
+        self.max_ids = max_ids
+        self.cursors: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+        self.load()
+
+    @staticmethod
+    def make_key(board: str, role: str, location: str, filters: str = "") -> str:
+        """Build the cursor key for a board query"""
+        return "|".join([board, role.strip().lower(), location.strip().lower(), filters])
+
+    def seen_ids(self, key: str) -> Set[str]:
+        """Job IDs already seen by a search"""
+        with self._lock:
+            return set(self.cursors.get(key, {}).get("seen_ids", []))
+
+    def last_run(self, key: str) -> Optional[datetime]:
+        """When the search last ran, if ever"""
+        with self._lock:
+            last_run = self.cursors.get(key, {}).get("last_run")
+        return datetime.fromisoformat(last_run) if last_run else None
+
+    def advance(self, key: str, job_ids: List[str]):
+        """Record newly seen job IDs (newest first) and persist the cursor"""
+        with self._lock:
+            cursor = self.cursors.setdefault(key, {"seen_ids": []})
+
+            known = set(cursor["seen_ids"])
+            new_ids = [job_id for job_id in dict.fromkeys(job_ids) if job_id not in known]
+
+            cursor["seen_ids"] = (new_ids + cursor["seen_ids"])[:self.max_ids]
+            cursor["last_run"] = datetime.now().isoformat()
+
+            self._save_locked()
+
+    def reset(self, key: Optional[str] = None):
+        """Forget one search's cursor, or all cursors"""
+        with self._lock:
+            if key is None:
+                self.cursors = {}
+            else:
+                self.cursors.pop(key, None)
+            self._save_locked()
+
+    def load(self):
+        """Load cursors from disk"""
+        if not self.cursor_path.exists():
+            return
+
+        try:
+            with open(self.cursor_path, 'r', encoding='utf-8') as f:
+                self.cursors = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            self.cursors = {}
+
+    def _save_locked(self):
+        try:
+            self.cursor_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cursor_path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.cursors, f)
+            tmp_path.replace(self.cursor_path)
+        except OSError:
+            pass
+
+
+_shared_store: Optional[SearchCursorStore] = None
+_shared_lock = threading.Lock()
+
+def get_cursor_store() -> SearchCursorStore:
+    """Process-wide cursor store shared by all scrapers"""
+    global _shared_store
+    with _shared_lock:
+        if _shared_store is None:
+            _shared_store = SearchCursorStore()
+        return _shared_store
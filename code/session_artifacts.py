@@ -0,0 +1,335 @@
+# session_artifacts.py
+"""
+Server-side store for large per-session values (CV text, results, search lists)
+"""
+
+import pickle
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import streamlit as st
+
+# ================================
+# 🗄️ SESSION ARTIFACT STORE
+# ================================
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS artifacts (
+    session_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    value BLOB NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    last_access REAL NOT NULL,
+    PRIMARY KEY (session_id, name)
+);
+
+CREATE INDEX IF NOT EXISTS idx_artifacts_last_access ON artifacts (last_access);
+
+CREATE TABLE IF NOT EXISTS artifact_version_seq (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    value INTEGER NOT NULL
+);
+
+INSERT OR IGNORE INTO artifact_version_seq (id, value)
+    SELECT 0, COALESCE(MAX(version), 0) FROM artifacts;
+"""
+
+MEMORY_LIMIT_BYTES = 64 * 1024 * 1024
+SESSION_QUOTA_BYTES = 8 * 1024 * 1024
+IDLE_TIMEOUT_SECONDS = 2 * 60 * 60
+SWEEP_INTERVAL_SECONDS = 60
+
+
+@dataclass(frozen=True)
+class ArtifactHandle:
+    """What session_state keeps instead of the value itself"""
+    session_id: str
+    name: str
+    version: int
+    size_bytes: int
+
+
+class ArtifactTooLarge(ValueError):
+    """A single value is bigger than the per-session quota"""
+
+
+class SessionArtifactStore:
+    """
+    Large session values in SQLite with an LRU in-memory tier in front.
+
+    Values are pickled once on put; their pickled size counts towards a
+    per-session quota (the session's least recently used artefacts are
+    dropped to make room) and towards the process-wide memory tier limit
+    (least recently used entries fall back to SQLite only). Sessions idle for
+    longer than idle_timeout are removed entirely, since Streamlit gives no
+    notice when a browser tab goes away.
+
+    Versions come from one store-wide sequence, so a handle never matches a
+    later value even after its artefact was evicted and stored again.
+    """
+
+    def __init__(self, db_path: str = "../output/session_artifacts.db",
+                 memory_limit: int = MEMORY_LIMIT_BYTES,
+                 session_quota: int = SESSION_QUOTA_BYTES,
+                 idle_timeout: float = IDLE_TIMEOUT_SECONDS):
+        """
+        Args:
+            db_path: SQLite database file (relative to code/ directory)
+            memory_limit: Bytes of values kept unpickled in memory, all sessions together
+            session_quota: Bytes one session may store
+            idle_timeout: Seconds without access before a session's artefacts are dropped
+        """
+        script_dir = Path(__file__).parent
+        self.db_path = script_dir / db_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.memory_limit = memory_limit
+        self.session_quota = session_quota
+        self.idle_timeout = idle_timeout
+
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=5.0)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        with self._lock, self.conn:
+            self.conn.executescript(SCHEMA)
+
+        # (session_id, name) -> (version, value, size_bytes), most recently used last
+        self._memory: "OrderedDict[Tuple[str, str], Tuple[int, Any, int]]" = OrderedDict()
+        self._memory_bytes = 0
+        self._last_seen: Dict[str, float] = {}
+        self._accessed: Dict[Tuple[str, str], float] = {}
+        self._last_sweep = 0.0
+        self.counters = {"memory_hits": 0, "disk_hits": 0, "misses": 0,
+                         "memory_evictions": 0, "quota_evictions": 0, "idle_evictions": 0}
+
+    # --- memory tier -------------------------------------------------------
+
+    def _remember(self, key: Tuple[str, str], version: int, value: Any, size: int):
+        self._forget(key)
+        if size > self.memory_limit:
+            return
+        self._memory[key] = (version, value, size)
+        self._memory_bytes += size
+        while self._memory_bytes > self.memory_limit:
+            _, (_, _, evicted_size) = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted_size
+            self.counters["memory_evictions"] += 1
+
+    def _forget(self, key: Tuple[str, str]):
+        entry = self._memory.pop(key, None)
+        if entry:
+            self._memory_bytes -= entry[2]
+
+    def _touch(self, key: Tuple[str, str], now: float):
+        session_id = key[0]
+        self._accessed[key] = now
+        self._last_seen[session_id] = now
+        if now - self._last_sweep >= SWEEP_INTERVAL_SECONDS:
+            self._last_sweep = now
+            self.evict_idle(now)
+
+    # --- public API --------------------------------------------------------
+
+    def put(self, session_id: str, name: str, value: Any) -> ArtifactHandle:
+        """Store a value for a session, replacing any previous one with that name"""
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        size = len(blob)
+        if size > self.session_quota:
+            raise ArtifactTooLarge(f"'{name}' is {size} bytes; the session quota is {self.session_quota}")
+
+        now = time.time()
+        with self._lock:
+            with self.conn:
+                version = self._next_version()
+                self._make_room(session_id, name, size)
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO artifacts (session_id, name, version, value, size_bytes, last_access) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (session_id, name, version, blob, size, now)
+                )
+            self._remember((session_id, name), version, value, size)
+            self._touch((session_id, name), now)
+        return ArtifactHandle(session_id=session_id, name=name, version=version, size_bytes=size)
+
+    def _next_version(self) -> int:
+        """Next store-wide version; shared by every process using the database"""
+        return self.conn.execute(
+            "UPDATE artifact_version_seq SET value = value + 1 WHERE id = 0 RETURNING value"
+        ).fetchall()[0][0]
+
+    def _make_room(self, session_id: str, name: str, size: int):
+        """Drop the session's least recently used artefacts until size fits its quota"""
+        rows = self.conn.execute(
+            "SELECT name, size_bytes, last_access FROM artifacts WHERE session_id = ? AND name != ?",
+            (session_id, name)
+        ).fetchall()
+        # Reads only update the in-process access times, so prefer those
+        rows.sort(key=lambda row: self._accessed.get((session_id, row[0]), row[2]))
+        used = sum(row[1] for row in rows)
+        for evicted_name, evicted_size, _ in rows:
+            if used + size <= self.session_quota:
+                break
+            self.conn.execute("DELETE FROM artifacts WHERE session_id = ? AND name = ?",
+                              (session_id, evicted_name))
+            self._forget((session_id, evicted_name))
+            self._accessed.pop((session_id, evicted_name), None)
+            used -= evicted_size
+            self.counters["quota_evictions"] += 1
+
+    def get(self, handle: ArtifactHandle, default: Any = None) -> Any:
+        """Value a handle refers to, or default if it was evicted or replaced"""
+        key = (handle.session_id, handle.name)
+        now = time.time()
+        with self._lock:
+            self._touch(key, now)
+            entry = self._memory.get(key)
+            if entry and entry[0] == handle.version:
+                self._memory.move_to_end(key)
+                self.counters["memory_hits"] += 1
+                return entry[1]
+
+            row = self.conn.execute(
+                "SELECT value, size_bytes FROM artifacts WHERE session_id = ? AND name = ? AND version = ?",
+                (handle.session_id, handle.name, handle.version)
+            ).fetchone()
+            if row is None:
+                self.counters["misses"] += 1
+                return default
+
+            value = pickle.loads(row[0])
+            self._remember(key, handle.version, value, row[1])
+            self.counters["disk_hits"] += 1
+            return value
+
+    def delete_session(self, session_id: str):
+        """Remove everything a session stored"""
+        with self._lock:
+            with self.conn:
+                self.conn.execute("DELETE FROM artifacts WHERE session_id = ?", (session_id,))
+            for key in [key for key in self._memory if key[0] == session_id]:
+                self._forget(key)
+            for key in [key for key in self._accessed if key[0] == session_id]:
+                del self._accessed[key]
+            self._last_seen.pop(session_id, None)
+
+    def evict_idle(self, now: Optional[float] = None) -> int:
+        """Drop sessions not accessed for idle_timeout seconds; returns how many"""
+        now = time.time() if now is None else now
+        cutoff = now - self.idle_timeout
+        with self._lock:
+            # Bring last-access times of sessions active in this process up to date
+            with self.conn:
+                self.conn.executemany(
+                    "UPDATE artifacts SET last_access = MAX(last_access, ?) WHERE session_id = ?",
+                    [(seen, session_id) for session_id, seen in self._last_seen.items() if seen >= cutoff]
+                )
+            idle = [row[0] for row in self.conn.execute(
+                "SELECT session_id FROM artifacts GROUP BY session_id HAVING MAX(last_access) < ?", (cutoff,)
+            )]
+            for session_id in idle:
+                self.delete_session(session_id)
+            for session_id in [sid for sid, seen in self._last_seen.items() if seen < cutoff]:
+                del self._last_seen[session_id]
+            self._accessed = {key: seen for key, seen in self._accessed.items() if seen >= cutoff}
+            self.counters["idle_evictions"] += len(idle)
+        return len(idle)
+
+    def session_metrics(self) -> List[Dict]:
+        """Per-session artefact count, stored bytes and bytes held in memory"""
+        with self._lock:
+            in_memory: Dict[str, int] = {}
+            for (session_id, _), (_, _, size) in self._memory.items():
+                in_memory[session_id] = in_memory.get(session_id, 0) + size
+            rows = self.conn.execute(
+                "SELECT session_id, COUNT(*), SUM(size_bytes), MAX(last_access) "
+                "FROM artifacts GROUP BY session_id ORDER BY SUM(size_bytes) DESC"
+            ).fetchall()
+        return [{
+            "session_id": session_id,
+            "artifacts": count,
+            "stored_bytes": stored,
+            "memory_bytes": in_memory.get(session_id, 0),
+            "quota_used": stored / self.session_quota,
+            "last_access": max(last_access, self._last_seen.get(session_id, 0.0)),
+        } for session_id, count, stored, last_access in rows]
+
+    def stats(self) -> Dict:
+        """Store-wide totals and hit/eviction counters"""
+        with self._lock:
+            sessions, stored = self.conn.execute(
+                "SELECT COUNT(DISTINCT session_id), COALESCE(SUM(size_bytes), 0) FROM artifacts"
+            ).fetchone()
+            return {
+                "sessions": sessions,
+                "stored_bytes": stored,
+                "memory_bytes": self._memory_bytes,
+                "memory_entries": len(self._memory),
+                "memory_per_session": self._memory_bytes / sessions if sessions else 0.0,
+                **self.counters,
+            }
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+_shared_store: Optional[SessionArtifactStore] = None
+_shared_lock = threading.Lock()
+
+def get_session_artifact_store() -> SessionArtifactStore:
+    """Process-wide artefact store shared by all sessions"""
+    global _shared_store
+    with _shared_lock:
+        if _shared_store is None:
+            _shared_store = SessionArtifactStore()
+        return _shared_store
+
+# ================================
+# 🔗 SESSION STATE HANDLES
+# ================================
+
+def current_artifact_session() -> str:
+    """ID under which this browser session's artefacts are stored"""
+    if 'artifact_session_id' not in st.session_state:
+        st.session_state.artifact_session_id = uuid.uuid4().hex
+    return st.session_state.artifact_session_id
+
+
+def put_session_artifact(name: str, value: Any) -> Optional[ArtifactHandle]:
+    """
+    Store a large value server-side and keep only its handle in session_state
+
+    Returns:
+        The new handle, or None if the value exceeds the session quota
+    """
+    handles = st.session_state.setdefault('artifact_handles', {})
+    try:
+        handle = get_session_artifact_store().put(current_artifact_session(), name, value)
+    except ArtifactTooLarge as e:
+        st.warning(f"⚠️ Could not keep {name} for this session: {e}")
+        handles.pop(name, None)
+        return None
+    handles[name] = handle
+    return handle
+
+
+def get_session_artifact(name: str, default: Any = None) -> Any:
+    """Value stored with put_session_artifact, or default if missing or evicted"""
+    handle = st.session_state.get('artifact_handles', {}).get(name)
+    if handle is None:
+        return default
+    return get_session_artifact_store().get(handle, default)
+
+
+def session_artifact_version(name: str) -> Optional[int]:
+    """Version of a stored value, for caches derived from it (unique per put)"""
+    handle = st.session_state.get('artifact_handles', {}).get(name)
+    return handle.version if handle else None
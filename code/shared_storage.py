@@ -0,0 +1,307 @@
+# shared_storage.py
+"""
+Storage shared by every app worker: blobs (artefacts, keyword results) and counters
+"""
+
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import List, Optional
+from urllib.parse import quote, unquote
+
+from lazy_imports import lazy_import
+
+redis = lazy_import("redis", "pip install redis")
+
+# ================================
+# 🌐 SHARED STORAGE BACKENDS
+# ================================
+
+# sqlite:///relative/path or sqlite:////absolute/path (relative to code/), the same for
+# file://, or redis://host:port/db
+STORAGE_URL_ENV = "CV_STORAGE_URL"
+DEFAULT_STORAGE_URL = "sqlite:///../output/shared_storage.db"
+
+
+class StorageBackend(ABC):
+    """
+    Blobs and counters that every worker process (and host) sees the same way.
+
+    Blobs are bytes under (namespace, key); writes replace the whole value
+    atomically, so readers never see a partial blob. Counters are integers
+    updated with an atomic increment that returns the new value, which is
+    what makes read-check-write races between workers impossible; resets go
+    through set_counter for the same reason, never through incr(-current).
+    """
+
+    @abstractmethod
+    def put_blob(self, namespace: str, key: str, data: bytes): ...
+
+    @abstractmethod
+    def get_blob(self, namespace: str, key: str) -> Optional[bytes]: ...
+
+    @abstractmethod
+    def delete_blob(self, namespace: str, key: str): ...
+
+    @abstractmethod
+    def list_keys(self, namespace: str) -> List[str]: ...
+
+    @abstractmethod
+    def incr(self, counter: str, amount: int = 1) -> int:
+        """Atomically add amount to a counter (created at 0) and return the new value"""
+
+    @abstractmethod
+    def get_counter(self, counter: str) -> int: ...
+
+    @abstractmethod
+    def set_counter(self, counter: str, value: int) -> int:
+        """Atomically replace a counter's value and return the previous one"""
+
+    def reset_counter(self, counter: str) -> int:
+        """Atomically set a counter back to 0 and return the value it had"""
+        return self.set_counter(counter, 0)
+
+    def close(self):
+        pass
+
+
+class SQLiteBackend(StorageBackend):
+    """
+    One SQLite file in WAL mode; correct across processes on the same host
+    (or any filesystem with working POSIX locks)
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS blobs (
+        namespace TEXT NOT NULL,
+        key TEXT NOT NULL,
+        data BLOB NOT NULL,
+        updated_at REAL NOT NULL,
+        PRIMARY KEY (namespace, key)
+    );
+
+    CREATE TABLE IF NOT EXISTS counters (
+        name TEXT PRIMARY KEY,
+        value INTEGER NOT NULL
+    );
+    """
+
+    def __init__(self, db_path: str = "../output/shared_storage.db"):
+        """
+        Args:
+            db_path: SQLite database file (relative to code/ directory)
+        """
+        self.db_path = Path(__file__).parent / db_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30.0)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        with self._lock, self.conn:
+            self.conn.executescript(self.SCHEMA)
+
+    def put_blob(self, namespace: str, key: str, data: bytes):
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO blobs (namespace, key, data, updated_at) VALUES (?, ?, ?, ?)",
+                (namespace, key, sqlite3.Binary(data), time.time())
+            )
+
+    def get_blob(self, namespace: str, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT data FROM blobs WHERE namespace = ? AND key = ?", (namespace, key)
+            ).fetchone()
+        return bytes(row[0]) if row else None
+
+    def delete_blob(self, namespace: str, key: str):
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM blobs WHERE namespace = ? AND key = ?", (namespace, key))
+
+    def list_keys(self, namespace: str) -> List[str]:
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT key FROM blobs WHERE namespace = ? ORDER BY key", (namespace,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def incr(self, counter: str, amount: int = 1) -> int:
+        # A single upsert statement is atomic; RETURNING needs SQLite 3.35+
+        with self._lock, self.conn:
+            row = self.conn.execute(
+                "INSERT INTO counters (name, value) VALUES (?, ?) "
+                "ON CONFLICT (name) DO UPDATE SET value = value + excluded.value RETURNING value",
+                (counter, amount)
+            ).fetchone()
+        return row[0]
+
+    def get_counter(self, counter: str) -> int:
+        with self._lock:
+            row = self.conn.execute("SELECT value FROM counters WHERE name = ?", (counter,)).fetchone()
+        return row[0] if row else 0
+
+    def set_counter(self, counter: str, value: int) -> int:
+        # The read and the write share one write-locked transaction
+        with self._lock, self.conn:
+            self.conn.execute("BEGIN IMMEDIATE")
+            row = self.conn.execute("SELECT value FROM counters WHERE name = ?", (counter,)).fetchone()
+            self.conn.execute(
+                "INSERT INTO counters (name, value) VALUES (?, ?) "
+                "ON CONFLICT (name) DO UPDATE SET value = excluded.value",
+                (counter, value)
+            )
+        return row[0] if row else 0
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+class LocalFileBackend(StorageBackend):
+    """
+    Blobs as files under root/<namespace>/, written to a temp file and renamed
+    into place. Plain files have no portable atomic increment, so counters
+    live in a SQLite file inside the same root.
+    """
+
+    def __init__(self, root: str = "../output/shared"):
+        """
+        Args:
+            root: Storage directory (relative to code/ directory)
+        """
+        self.root = (Path(__file__).parent / root).resolve()
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._counters = SQLiteBackend(str(self.root / "counters.db"))
+
+    def _path(self, namespace: str, key: str) -> Path:
+        # Percent-encode so keys can't escape the namespace directory
+        parts = [quote(part, safe="") for part in (namespace, key)]
+        if any(part in ("", ".", "..") or part.startswith(".tmp-") for part in parts):
+            raise ValueError(f"Invalid storage key: {namespace}/{key}")
+        return self.root / parts[0] / parts[1]
+
+    def put_blob(self, namespace: str, key: str, data: bytes):
+        path = self._path(namespace, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def get_blob(self, namespace: str, key: str) -> Optional[bytes]:
+        try:
+            return self._path(namespace, key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def delete_blob(self, namespace: str, key: str):
+        try:
+            self._path(namespace, key).unlink()
+        except FileNotFoundError:
+            pass
+
+    def list_keys(self, namespace: str) -> List[str]:
+        directory = self.root / quote(namespace, safe="")
+        if not directory.exists():
+            return []
+        return sorted(unquote(path.name) for path in directory.iterdir() if not path.name.startswith(".tmp-"))
+
+    def incr(self, counter: str, amount: int = 1) -> int:
+        return self._counters.incr(counter, amount)
+
+    def get_counter(self, counter: str) -> int:
+        return self._counters.get_counter(counter)
+
+    def set_counter(self, counter: str, value: int) -> int:
+        return self._counters.set_counter(counter, value)
+
+    def close(self):
+        self._counters.close()
+
+
+class RedisBackend(StorageBackend):
+    """Any Redis-protocol server (Redis, Valkey, KeyDB, ...); works across hosts"""
+
+    def __init__(self, url: str = "redis://localhost:6379/0", prefix: str = "cv_enhancer"):
+        """
+        Args:
+            url: Redis connection URL
+            prefix: Key prefix, so several apps can share one server
+        """
+        self.client = redis.Redis.from_url(url)
+        self.prefix = prefix
+
+    def _blob_key(self, namespace: str, key: str) -> str:
+        return f"{self.prefix}:blob:{namespace}:{key}"
+
+    def _index_key(self, namespace: str) -> str:
+        return f"{self.prefix}:keys:{namespace}"
+
+    def put_blob(self, namespace: str, key: str, data: bytes):
+        pipe = self.client.pipeline(transaction=True)
+        pipe.set(self._blob_key(namespace, key), data)
+        pipe.sadd(self._index_key(namespace), key)
+        pipe.execute()
+
+    def get_blob(self, namespace: str, key: str) -> Optional[bytes]:
+        return self.client.get(self._blob_key(namespace, key))
+
+    def delete_blob(self, namespace: str, key: str):
+        pipe = self.client.pipeline(transaction=True)
+        pipe.delete(self._blob_key(namespace, key))
+        pipe.srem(self._index_key(namespace), key)
+        pipe.execute()
+
+    def list_keys(self, namespace: str) -> List[str]:
+        return sorted(key.decode("utf-8") for key in self.client.smembers(self._index_key(namespace)))
+
+    def incr(self, counter: str, amount: int = 1) -> int:
+        return int(self.client.incrby(f"{self.prefix}:counter:{counter}", amount))
+
+    def get_counter(self, counter: str) -> int:
+        value = self.client.get(f"{self.prefix}:counter:{counter}")
+        return int(value) if value else 0
+
+    def set_counter(self, counter: str, value: int) -> int:
+        previous = self.client.getset(f"{self.prefix}:counter:{counter}", value)
+        return int(previous) if previous else 0
+
+    def close(self):
+        self.client.close()
+
+
+def backend_from_url(url: str) -> StorageBackend:
+    """Create a backend from a storage URL (see STORAGE_URL_ENV)"""
+    scheme, _, rest = url.partition("://")
+    path = rest[1:] if rest.startswith("/") else rest
+    if scheme == "sqlite":
+        return SQLiteBackend(path)
+    if scheme == "file":
+        return LocalFileBackend(path)
+    if scheme in ("redis", "rediss", "unix"):
+        return RedisBackend(url)
+    raise ValueError(f"Unsupported storage URL: {url}")
+
+
+_shared_storage: Optional[StorageBackend] = None
+_shared_lock = threading.Lock()
+
+def get_shared_storage() -> StorageBackend:
+    """Process-wide storage backend, chosen by the CV_STORAGE_URL environment variable"""
+    global _shared_storage
+    with _shared_lock:
+        if _shared_storage is None:
+            _shared_storage = backend_from_url(os.environ.get(STORAGE_URL_ENV, DEFAULT_STORAGE_URL))
+        return _shared_storage
@@ -44,7 +44,7 @@ class WorkingReedScraper:
             if response.status_code != 200:
                 return
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             
             print(f"\n📈 Page Statistics:")
             print(f"   - Page title: {soup.title.string if soup.title else 'No title'}")
@@ -119,9 +119,17 @@ class WorkingReedScraper:
         
         print(f"\n🎯 Attempting job extraction...")
         
+        # Single traversal collects candidates for both strategies
+        articles = []
+        job_links = []
+        for element in soup.find_all(['article', 'a']):
+            if element.name == 'article':
+                articles.append(element)
+            elif 'job' in element.get('href', ''):
+                job_links.append(element)
+        
         # Strategy 1: Look for articles (most likely)
         print("📋 Strategy 1: Checking <article> tags...")
-        articles = soup.find_all('article')
         for i, article in enumerate(articles[:max_jobs]):
             try:
                 job = self.extract_job_from_element(article, f"article-{i}")
@@ -136,7 +144,6 @@ class WorkingReedScraper:
         # Strategy 2: Look for divs with links that contain "job"
         if len(jobs) < max_jobs:
             print(f"📋 Strategy 2: Looking for job links...")
-            job_links = soup.find_all('a', href=lambda x: x and 'job' in x)
             processed_titles = set()
             
             for link in job_links[:max_jobs*2]:  # Check more links
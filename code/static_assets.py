@@ -0,0 +1,152 @@
+# static_assets.py
+"""
+Minified, content-hashed CSS served through Streamlit static file serving
+"""
+
+import hashlib
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+# ================================
+# 🎨 STYLESHEET ASSETS
+# ================================
+
+STATIC_URL_PREFIX = "app/static"
+
+_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+_WHITESPACE = re.compile(r"\s+")
+_AROUND_PUNCTUATION = re.compile(r"\s*([{};,])\s*")
+_AFTER_COLON = re.compile(r":\s+")
+
+
+@dataclass(frozen=True)
+class CssAsset:
+    """A minified stylesheet written to the static folder under a content hash"""
+    name: str
+    filename: str
+    content_hash: str
+    css: str
+    source_bytes: int
+
+    @property
+    def url(self) -> str:
+        # Tornado's static handler sends a far-future Cache-Control when ?v= is present
+        return f"{STATIC_URL_PREFIX}/{self.filename}?v={self.content_hash}"
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self.css.encode('utf-8'))
+
+
+def minify_css(css: str) -> str:
+    """
+    Conservative CSS minifier
+
+    Strips comments and collapses whitespace around braces, semicolons,
+    commas and after colons. Spaces before colons and around operators are
+    kept, since they are significant in selectors (".a :hover") and calc().
+    """
+    css = _COMMENT.sub("", css)
+    css = _WHITESPACE.sub(" ", css)
+    css = _AROUND_PUNCTUATION.sub(r"\1", css)
+    css = _AFTER_COLON.sub(":", css)
+    return css.replace(";}", "}").strip()
+
+
+def build_css_asset(source: str, static_dir: str = "static") -> CssAsset:
+    """
+    Minify a stylesheet and write it to the static folder as name.<hash>.css
+
+    Older hashed copies of the same stylesheet are removed.
+
+    Args:
+        source: Stylesheet path (relative to code/ directory)
+        static_dir: Streamlit static folder next to the main script
+    """
+    script_dir = Path(__file__).parent
+    source_path = script_dir / source
+    static_path = script_dir / static_dir
+
+    raw = source_path.read_text(encoding='utf-8')
+    css = minify_css(raw)
+    content_hash = hashlib.sha256(css.encode('utf-8')).hexdigest()[:12]
+
+    name = source_path.stem
+    filename = f"{name}.{content_hash}.css"
+
+    static_path.mkdir(parents=True, exist_ok=True)
+    target = static_path / filename
+    if not target.exists():
+        target.write_text(css, encoding='utf-8')
+
+    for stale in static_path.glob(f"{name}.*.css"):
+        if stale.name != filename:
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+
+    return CssAsset(name=name, filename=filename, content_hash=content_hash,
+                    css=css, source_bytes=len(raw.encode('utf-8')))
+
+
+def stylesheet_injector(asset: CssAsset) -> str:
+    """
+    HTML for a zero-height component that adds the stylesheet to the app page
+
+    The component iframe is same-origin, so it can fetch the asset and add a
+    <style> to the parent document's head. That element outlives the
+    component, so later reruns don't need to send anything. The CSS is fetched
+    rather than linked because Streamlit serves .css static files as
+    text/plain, which browsers refuse as a stylesheet.
+    """
+    element_id = f"css-{asset.name}"
+    return f"""<script>
+(function() {{
+    const doc = window.parent.document;
+    const current = doc.getElementById({json.dumps(element_id)});
+    if (current && current.dataset.hash === {json.dumps(asset.content_hash)}) return;
+    fetch(new URL({json.dumps(asset.url)}, window.parent.location.href))
+        .then(response => response.ok ? response.text() : Promise.reject(response.status))
+        .then(css => {{
+            const style = current || doc.createElement("style");
+            style.id = {json.dumps(element_id)};
+            style.dataset.hash = {json.dumps(asset.content_hash)};
+            style.textContent = css;
+            doc.head.appendChild(style);
+        }});
+}})();
+</script>"""
+
+
+@st.cache_resource(show_spinner=False)
+def get_css_asset(source: str = "styles/modern.css") -> CssAsset:
+    """Build a stylesheet asset once per process"""
+    return build_css_asset(source)
+
+
+def inject_css(source: str = "styles/modern.css"):
+    """
+    Apply a stylesheet to the page, sending it at most once per session
+
+    With server.enableStaticServing the browser fetches (and caches) the
+    hashed asset and nothing is sent on later reruns. Without static serving
+    the minified CSS is emitted inline on every rerun as before.
+    """
+    asset = get_css_asset(source)
+
+    if not st.get_option("server.enableStaticServing"):
+        st.markdown(f"<style>{asset.css}</style>", unsafe_allow_html=True)
+        return
+
+    session_key = f"_css_injected_{asset.name}"
+    if st.session_state.get(session_key) == asset.content_hash:
+        return
+
+    components.html(stylesheet_injector(asset), height=0)
+    st.session_state[session_key] = asset.content_hash
@@ -0,0 +1,116 @@
+# test_job_dedup.py
+"""
+Tests for JobDeduplicator: merging, persistence and sharing one instance between threads
+
+Usage:
+    python -m pytest -q test_job_dedup.py
+"""
+
+import json
+import threading
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import List, Optional
+
+from job_dedup import JobDeduplicator
+
+
+class Board(Enum):
+    REED = "reed"
+    INDEED = "indeed"
+
+
+@dataclass
+class Listing:
+    """The JobListing fields the deduplicator reads, without job_automation's imports"""
+    job_id: str
+    title: str
+    company: str
+    location: str
+    job_board: Board = Board.REED
+    salary: Optional[str] = None
+    description: str = ""
+    requirements: List[str] = field(default_factory=list)
+    url: str = ""
+    application_deadline: Optional[str] = None
+    remote_option: bool = False
+    match_score: float = 0.0
+
+
+def make_listings(prefix: str, count: int) -> List[Listing]:
+    return [Listing(job_id=f"{prefix}-{i}", title=f"Data Engineer {prefix} {i}",
+                    company=f"Company {prefix} {i}", location="London")
+            for i in range(count)]
+
+
+def test_merges_cross_board_duplicates(tmp_path):
+    dedup = JobDeduplicator(index_path=str(tmp_path / "index.json"))
+    jobs = [
+        Listing("1", "Senior Python Developer", "Acme Ltd", "London"),
+        Listing("2", "Sr. Python Developer", "Acme", "London, Greater London",
+                job_board=Board.INDEED, salary="£60,000"),
+        Listing("3", "Senior Python Developer", "Other Co", "London"),
+    ]
+
+    result = dedup.deduplicate(jobs)
+
+    assert len(result) == 2
+    assert result[0].salary == "£60,000"
+
+
+def test_index_survives_restart_and_is_valid_json(tmp_path):
+    index_path = tmp_path / "index.json"
+    first = JobDeduplicator(index_path=str(index_path))
+    first.deduplicate(make_listings("a", 5))
+
+    data = json.loads(index_path.read_text(encoding="utf-8"))
+    assert len(data["clusters"]) == 5
+    assert not list(tmp_path.glob(".tmp-*"))
+
+    second = JobDeduplicator(index_path=str(index_path))
+    assert second.clusters.keys() == first.clusters.keys()
+
+
+def test_unchanged_index_is_not_rewritten(tmp_path):
+    index_path = tmp_path / "index.json"
+    dedup = JobDeduplicator(index_path=str(index_path))
+    jobs = make_listings("a", 3)
+    dedup.deduplicate(jobs)
+
+    index_path.unlink()
+    dedup.deduplicate(jobs)
+
+    # Only last-seen times changed, so the save waits for save_interval
+    assert not index_path.exists()
+
+
+def test_shared_instance_under_concurrent_searches(tmp_path):
+    # JobAutomationEngine is shared by every session (st.cache_resource), and so is its deduplicator
+    dedup = JobDeduplicator(index_path=str(tmp_path / "index.json"), save_interval=0.0)
+    errors: List[BaseException] = []
+    results = {}
+    start = threading.Barrier(4)
+
+    def search(worker: int):
+        try:
+            start.wait()
+            for call in range(30):
+                # Every call adds new clusters, so the index is mutated and saved each time
+                jobs = make_listings(f"w{worker}c{call}", 20)
+                results[(worker, call)] = dedup.deduplicate(jobs + jobs[:5])
+        except BaseException as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=search, args=(worker,)) for worker in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(results) == 120
+    assert all(len(jobs) == 20 for jobs in results.values())
+    assert len(dedup.clusters) == 4 * 30 * 20
+
+    data = json.loads((tmp_path / "index.json").read_text(encoding="utf-8"))
+    assert len(data["clusters"]) == len(dedup.clusters)
@@ -0,0 +1,46 @@
+# test_job_store.py
+"""
+Tests for salary parsing and FTS query translation in the job store
+
+Usage:
+    python -m pytest -q test_job_store.py
+"""
+
+import pytest
+
+from job_store import build_fts_query, parse_salary_range
+
+
+@pytest.mark.parametrize("salary, expected", [
+    ("£30,000 - £40,000", (30000, 40000)),
+    ("£30,000 to £40,000 per annum", (30000, 40000)),
+    ("From £25,000 to £30,000", (25000, 30000)),
+    ("£45k", (45000, 45000)),
+    ("£30-40k", (30000, 40000)),
+    ("£30k - £40k", (30000, 40000)),
+    ("£350 per day", (80500, 80500)),
+    ("£20 - £25 per hour", (39000, 48750)),
+    ("£3,500 per month", (42000, 42000)),
+])
+def test_parses_pound_amounts(salary, expected):
+    assert parse_salary_range(salary) == expected
+
+
+@pytest.mark.parametrize("salary, expected", [
+    ("Up to £45,000 + 10% bonus", (45000, 45000)),
+    ("£35,000, 25 days holiday", (35000, 35000)),
+    ("£50,000 - £60,000 plus 2 weeks extra leave", (50000, 60000)),
+    ("Competitive, 25 days holiday", (None, None)),
+    ("Negotiable", (None, None)),
+    ("", (None, None)),
+    (None, (None, None)),
+])
+def test_ignores_numbers_that_are_not_pound_amounts(salary, expected):
+    assert parse_salary_range(salary) == expected
+
+
+def test_fts_query_syntax():
+    assert build_fts_query("python developer") == '"python" "developer"'
+    assert build_fts_query('title:engineer -junior') == '(title : "engineer") NOT "junior"'
+    assert build_fts_query("react OR frontend") == '"react" OR "frontend"'
+    assert build_fts_query("OR -x") is None
@@ -0,0 +1,239 @@
+# usage_meter.py
+"""
+Persistent usage metering: atomic quota counters in shared storage plus an append-only SQLite ledger
+"""
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from shared_storage import StorageBackend, get_shared_storage
+
+# ================================
+# 📏 USAGE METER
+# ================================
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS usage_ledger (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    owner TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    amount INTEGER NOT NULL,
+    reason TEXT NOT NULL,
+    recorded_at REAL NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_usage_ledger_owner ON usage_ledger (owner, metric, id);
+"""
+
+UNLIMITED = -1
+
+# Seconds get_usage() and check() may answer from this process's cache
+CACHE_SECONDS = 1.0
+
+
+@dataclass(frozen=True)
+class UsageEntry:
+    """One ledger row; corrections are new rows with negative amounts"""
+    entry_id: int
+    owner: str
+    metric: str
+    amount: int
+    reason: str
+    recorded_at: float
+
+
+class UsageMeter:
+    """
+    Usage counts that survive sessions and are shared by every worker.
+
+    Totals are counters in the shared storage backend (CV_STORAGE_URL), so
+    all workers enforce one quota, across hosts when the backend is Redis.
+    consume() increments first and gives the units back if the new total is
+    over the limit; increments are atomic in every backend, so concurrent
+    requests can't both pass the same last unit of quota.
+
+    Every change is also appended to a SQLite ledger for history and audit.
+    The ledger file is local to the host: with workers on several hosts each
+    ledger holds the changes made there, and only the counters are shared.
+
+    Reads are cached per process for cache_seconds. check() is advisory and
+    consume() always goes to storage, so a stale read can't overspend.
+    """
+
+    def __init__(self, db_path: str = "../output/usage.db",
+                 storage: Optional[StorageBackend] = None,
+                 cache_seconds: float = CACHE_SECONDS):
+        """
+        Args:
+            db_path: SQLite ledger file (relative to code/ directory)
+            storage: Backend holding the totals (defaults to the process-wide shared storage)
+            cache_seconds: Seconds a read total is reused before asking storage again
+        """
+        script_dir = Path(__file__).parent
+        self.db_path = script_dir / db_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.storage = storage or get_shared_storage()
+        self.cache_seconds = cache_seconds
+
+        self._lock = threading.Lock()
+        # Autocommit mode, so transactions are exactly the BEGIN ... COMMIT below
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False,
+                                    timeout=10.0, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        with self._lock:
+            self.conn.executescript(SCHEMA)
+
+        # (owner, metric) -> (used, monotonic time read)
+        self._cache: Dict[Tuple[str, str], Tuple[int, float]] = {}
+        self._migrate_local_totals()
+
+    # --- internals ---------------------------------------------------------
+
+    @staticmethod
+    def _counter(owner: str, metric: str) -> str:
+        return f"usage:{metric}:{owner}"
+
+    def _remember(self, owner: str, metric: str, used: int) -> int:
+        with self._lock:
+            self._cache[(owner, metric)] = (used, time.monotonic())
+        return used
+
+    def _record(self, owner: str, metric: str, amount: int, reason: str, used: int) -> int:
+        """Append a ledger entry for a change already applied to the counter"""
+        with self._lock:
+            self.conn.execute(
+                "INSERT INTO usage_ledger (owner, metric, amount, reason, recorded_at) VALUES (?, ?, ?, ?, ?)",
+                (owner, metric, amount, reason, time.time())
+            )
+        return self._remember(owner, metric, used)
+
+    def _migrate_local_totals(self):
+        """Move totals an older version kept in this ledger's usage_totals table into shared storage"""
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Re-checked under the write lock, so one process per host moves them
+                if self.conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'usage_totals'"
+                ).fetchone():
+                    for owner, metric, used in self.conn.execute(
+                        "SELECT owner, metric, used FROM usage_totals WHERE used != 0"
+                    ).fetchall():
+                        self.storage.incr(self._counter(owner, metric), used)
+                    self.conn.execute("DROP TABLE usage_totals")
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+
+    # --- public API --------------------------------------------------------
+
+    def get_usage(self, owner: str, metric: str) -> int:
+        """Units used so far (cached for cache_seconds)"""
+        with self._lock:
+            cached = self._cache.get((owner, metric))
+        if cached and time.monotonic() - cached[1] < self.cache_seconds:
+            return cached[0]
+        return self._remember(owner, metric, self.storage.get_counter(self._counter(owner, metric)))
+
+    def check(self, owner: str, metric: str, limit: int, amount: int = 1) -> Tuple[bool, int]:
+        """
+        Whether amount more units fit in limit, without consuming them
+
+        Returns:
+            Tuple of (allowed: bool, used: int)
+        """
+        used = self.get_usage(owner, metric)
+        return limit == UNLIMITED or used + amount <= limit, used
+
+    def consume(self, owner: str, metric: str, limit: int, amount: int = 1,
+                reason: str = "usage") -> Tuple[bool, int]:
+        """
+        Atomically check the quota and record usage if it fits
+
+        Args:
+            owner: Who the usage is counted against
+            metric: What is being metered (e.g. "cv_optimization")
+            limit: Maximum total units, or UNLIMITED (-1)
+            amount: Units to consume
+            reason: Note stored with the ledger entry
+
+        Returns:
+            Tuple of (consumed: bool, used: int) where used includes this amount if consumed
+        """
+        counter = self._counter(owner, metric)
+        used = self.storage.incr(counter, amount)
+        if limit != UNLIMITED and used > limit:
+            return False, self._remember(owner, metric, self.storage.incr(counter, -amount))
+        return True, self._record(owner, metric, amount, reason, used)
+
+    def refund(self, owner: str, metric: str, amount: int = 1, reason: str = "refund") -> int:
+        """Give back units consumed for work that then failed; returns the new total"""
+        used = self.storage.incr(self._counter(owner, metric), -amount)
+        return self._record(owner, metric, -amount, reason, used)
+
+    def reset(self, owner: str, metric: str, reason: str = "reset") -> int:
+        """Bring an owner's usage back to zero with a correcting entry"""
+        used = self.storage.reset_counter(self._counter(owner, metric))
+        if used:
+            return self._record(owner, metric, -used, reason, 0)
+        return self._remember(owner, metric, 0)
+
+    def transfer(self, from_owner: str, to_owner: str, metric: str, reason: str = "transfer") -> int:
+        """Move all of one owner's usage to another (e.g. on sign-in); returns the units moved"""
+        if from_owner == to_owner:
+            return 0
+        moved = self.storage.reset_counter(self._counter(from_owner, metric))
+        if moved:
+            self._record(from_owner, metric, -moved, f"{reason}:to:{to_owner}", 0)
+            used = self.storage.incr(self._counter(to_owner, metric), moved)
+            self._record(to_owner, metric, moved, f"{reason}:from:{from_owner}", used)
+        return moved
+
+    def history(self, owner: str, metric: Optional[str] = None, limit: int = 100) -> List[UsageEntry]:
+        """An owner's most recent entries in this host's ledger, newest first"""
+        query = "SELECT id, owner, metric, amount, reason, recorded_at FROM usage_ledger WHERE owner = ?"
+        params: list = [owner]
+        if metric:
+            query += " AND metric = ?"
+            params.append(metric)
+        query += " ORDER BY id DESC LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self.conn.execute(query, params).fetchall()
+        return [UsageEntry(*row) for row in rows]
+
+    def rebuild_totals(self):
+        """
+        Reset the shared counters to this ledger's sums (e.g. after losing the Redis data)
+
+        Only complete when every worker writes this ledger, i.e. all run on this host.
+        """
+        with self._lock:
+            totals = self.conn.execute(
+                "SELECT owner, metric, SUM(amount) FROM usage_ledger GROUP BY owner, metric"
+            ).fetchall()
+            self._cache.clear()
+        for owner, metric, used in totals:
+            self.storage.set_counter(self._counter(owner, metric), used)
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+_shared_meter: Optional[UsageMeter] = None
+_shared_lock = threading.Lock()
+
+def get_usage_meter() -> UsageMeter:
+    """Process-wide usage meter"""
+    global _shared_meter
+    with _shared_lock:
+        if _shared_meter is None:
+            _shared_meter = UsageMeter()
+        return _shared_meter
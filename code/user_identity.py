@@ -0,0 +1,81 @@
+# user_identity.py
+"""
+Who the current visitor is, stable across sessions and page reloads
+"""
+
+import re
+import secrets
+from typing import Optional
+
+import streamlit as st
+
+# ================================
+# 🪪 USER IDENTITY
+# ================================
+
+ANONYMOUS_PREFIX = "anon_"
+ANONYMOUS_COOKIE = "cv_enhancer_visitor"
+ANONYMOUS_COOKIE_MAX_AGE = 365 * 24 * 60 * 60
+
+_EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+_ANONYMOUS_ID_PATTERN = re.compile(rf"^{ANONYMOUS_PREFIX}[0-9a-f]{{32}}$")
+
+
+def normalize_email(email: Optional[str]) -> Optional[str]:
+    """Lowercased email, or None if it doesn't look like one"""
+    email = (email or "").strip().lower()
+    return email if _EMAIL_PATTERN.match(email) else None
+
+
+def verified_email() -> Optional[str]:
+    """
+    Email of a user signed in through Streamlit authentication (st.login)
+
+    Emails typed into a form are never used as an identity: anyone could
+    enter someone else's address and load their history or spend their quota.
+    """
+    user = getattr(st, "user", None)
+    if user is None or not user.get("is_logged_in"):
+        return None
+    if user.get("email_verified") is False:
+        return None
+    return normalize_email(user.get("email"))
+
+
+def anonymous_user_id() -> str:
+    """
+    Random, unguessable ID for a visitor who hasn't signed in
+
+    Kept in a browser cookie, so a new tab or a reload of the same browser
+    maps to the same ID (and the same usage and application history), while
+    different browsers behind one address never share it. A new ID is only
+    written to the cookie once persist_anonymous_id() runs.
+    """
+    if 'anonymous_user_id' not in st.session_state:
+        cookie = getattr(st.context, "cookies", {}).get(ANONYMOUS_COOKIE, "")
+        if _ANONYMOUS_ID_PATTERN.match(cookie):
+            st.session_state.anonymous_user_id = cookie
+        else:
+            st.session_state.anonymous_user_id = f"{ANONYMOUS_PREFIX}{secrets.token_hex(16)}"
+            st.session_state.anonymous_cookie_pending = True
+    return st.session_state.anonymous_user_id
+
+
+def persist_anonymous_id():
+    """Store a newly created anonymous ID in the browser cookie (call once per run from the page)"""
+    anonymous_id = anonymous_user_id()
+    if not st.session_state.pop('anonymous_cookie_pending', False):
+        return
+    import streamlit.components.v1 as components
+
+    components.html(
+        "<script>window.parent.document.cookie = "
+        f"'{ANONYMOUS_COOKIE}={anonymous_id}; Max-Age={ANONYMOUS_COOKIE_MAX_AGE}; Path=/; SameSite=Lax';"
+        "</script>",
+        height=0
+    )
+
+
+def current_user_id() -> str:
+    """The verified signed-in email, else this browser's anonymous ID"""
+    return verified_email() or anonymous_user_id()